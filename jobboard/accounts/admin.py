@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 
-from .models import User, EmployerProfile, JobSeekerProfile, Notification
+from .models import User, EmployerProfile, JobSeekerProfile, Notification, NotificationArchive, OutboxEmail
 
 
 @admin.register(User)
@@ -17,3 +17,10 @@ admin.site.register(EmployerProfile)
 admin.site.register(JobSeekerProfile)
 
 admin.site.register(Notification)
+admin.site.register(NotificationArchive)
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_at")
+    list_filter = ("status",)
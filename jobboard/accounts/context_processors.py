@@ -1,10 +1,16 @@
-from django.db.models import Count
-from .models import Notification
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+
+from .notifications import notification_nav_snapshot
 
 def notifications_nav(request):
     if not getattr(request, "user", None) or not request.user.is_authenticated:
         return {"nav_unread_notifications": 0, "nav_recent_notifications": [], "ui_dir": request.session.get('ui_dir','')}
-    qs = Notification.objects.filter(user=request.user)
-    unread = qs.filter(is_read=False).count()
-    recent = list(qs[:5])
-    return {"nav_unread_notifications": unread, "nav_recent_notifications": recent, "ui_dir": request.session.get('ui_dir','')}
+    snapshot = notification_nav_snapshot(request.user)
+    return {
+        "nav_unread_notifications": snapshot["unread"],
+        "nav_recent_notifications": snapshot["recent"],
+        "ui_dir": request.session.get('ui_dir',''),
+        # only pages served over ASGI get the live stream
+        "nav_notification_stream": getattr(settings, "NOTIFICATION_STREAM_ENABLED", True) and isinstance(request, ASGIRequest),
+    }
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from accounts.notifications import archive_read_notifications
+
+
+class Command(BaseCommand):
+    help = "Move read notifications older than --days into the archive table (run daily from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None, help="Defaults to NOTIFICATION_RETENTION_DAYS.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows moved per transaction.")
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+
+    def handle(self, *args, **opts):
+        moved = archive_read_notifications(
+            opts["days"],
+            batch_size=max(1, int(opts["batch_size"])),
+            pause=max(0.0, float(opts["pause"])),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {moved} notifications."))
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.outbox import drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Send queued outbox emails in batches over one backend connection each."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Emails claimed per transaction.")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and poll every N seconds (0 = drain once and exit).",
+        )
+
+    def handle(self, *args, **opts):
+        batch_size = max(1, int(opts["batch_size"]))
+        interval = float(opts["interval"])
+        while True:
+            sent, failed = drain_outbox(batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f"Sent {sent} emails, {failed} failed attempts."))
+            if interval <= 0:
+                return
+            time.sleep(interval)
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import Q
+from django.utils import timezone
 
 
 class User(AbstractUser):
@@ -18,13 +20,45 @@ class User(AbstractUser):
         return self.username
 
 
-class EmployerProfile(models.Model):
+class CounterFieldsMixin:
+    """Leave F()-maintained counter columns out of plain ``save()`` calls on existing rows.
+
+    A full save would write back the counter values read with the instance and
+    lose increments made by other requests in the meantime.
+    """
+
+    COUNTER_FIELDS: tuple[str, ...] = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+class EmployerProfile(CounterFieldsMixin, models.Model):
+    COUNTER_FIELDS = ("jobs_count", "applications_count", "submitted_count", "interview_count", "rejected_count")
+
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     company_name = models.CharField(max_length=100)
     company_description = models.TextField(blank=True, null=True)
     phone = models.CharField(max_length=20, blank=True, null=True)
     website = models.URLField(blank=True, null=True)
 
+    # Denormalized counters maintained by jobs.counters (reconcile_counters fixes drift).
+    jobs_count = models.IntegerField(default=0, editable=False)
+    applications_count = models.IntegerField(default=0, editable=False)
+    submitted_count = models.IntegerField(default=0, editable=False)
+    interview_count = models.IntegerField(default=0, editable=False)
+    rejected_count = models.IntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            # home_public "featured companies"
+            models.Index(fields=["-jobs_count", "company_name"], name="employer_jobs_count_idx"),
+        ]
+
     def __str__(self):
         return self.company_name
 
@@ -41,6 +75,32 @@ class JobSeekerProfile(models.Model):
         return self.full_name
 
 
+class NotificationManager(models.Manager):
+    def archive_read(self, before, *, batch_size=1000) -> list[int]:
+        """Move up to ``batch_size`` read notifications created before ``before`` to the archive.
+
+        One short transaction per call: rows are locked with SKIP LOCKED, deleted
+        and copied in a single statement. Returns the affected user ids (one per row).
+        """
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        table = qn(self.model._meta.db_table)
+        archive = qn(NotificationArchive._meta.db_table)
+        with transaction.atomic(using=self.db), connection.cursor() as cursor:
+            cursor.execute(
+                f"WITH moved AS ("
+                f"  DELETE FROM {table} WHERE id IN ("
+                f"    SELECT id FROM {table} WHERE is_read AND created_at < %s"
+                f"    ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED"
+                f"  ) RETURNING id, user_id, title, message, url, created_at"
+                f") INSERT INTO {archive} (id, user_id, title, message, url, created_at, archived_at) "
+                f"SELECT id, user_id, title, message, url, created_at, now() FROM moved "
+                f"ON CONFLICT (id) DO NOTHING RETURNING user_id",
+                [before, batch_size],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
 class Notification(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notifications")
     title = models.CharField(max_length=200)
@@ -49,8 +109,65 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = NotificationManager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # navbar unread count
+            models.Index(fields=["user", "is_read"], name="notif_user_read_idx"),
+            # notifications_list keyset pages
+            models.Index(fields=["user", "-created_at", "-id"], name="notif_user_created_idx"),
+        ]
 
     def __str__(self):
         return f"Notification({self.user_id}): {self.title}"
+
+
+class NotificationArchive(models.Model):
+    """Read notifications moved out of the hot table by ``archive_notifications``."""
+
+    id = models.BigIntegerField(primary_key=True)  # the original Notification id
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="archived_notifications"
+    )
+    title = models.CharField(max_length=200)
+    message = models.TextField(blank=True, null=True)
+    url = models.CharField(max_length=300, blank=True, null=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"NotificationArchive({self.user_id}): {self.title}"
+
+
+class OutboxEmail(models.Model):
+    """An email queued in the request's transaction and sent by the outbox worker."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["next_attempt_at"], condition=Q(status="pending"), name="outbox_pending_idx"),
+        ]
+
+    def __str__(self):
+        return f"OutboxEmail({self.status}): {self.subject}"
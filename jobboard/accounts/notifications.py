@@ -0,0 +1,71 @@
+"""Cached per-user unread count + recent notifications for the navbar.
+
+``notifications_nav`` runs on every page, so its data is kept in the cache and
+only recomputed after a write. Anything that creates or marks notifications
+must call ``invalidate_notification_nav`` for the affected users; entries also
+expire after NOTIFICATION_NAV_CACHE_SECONDS as a safety net for other writers
+(admin, seed data). Snapshots are kept in the shared cache (settings.CACHES),
+so an invalidation in one worker clears the badge for all of them.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Notification
+
+NAV_RECENT_LIMIT = 5
+
+
+def _nav_cache_key(user_id) -> str:
+    return f"accounts:notifications_nav:{user_id}"
+
+
+def notification_nav_snapshot(user) -> dict:
+    """``{"unread": int, "recent": [dict, ...]}`` for ``user``; zero queries on a cache hit."""
+    key = _nav_cache_key(user.pk)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        qs = Notification.objects.filter(user=user)
+        snapshot = {
+            "unread": qs.filter(is_read=False).count(),
+            "recent": list(qs.values("id", "title", "message", "url", "is_read")[:NAV_RECENT_LIMIT]),
+        }
+        cache.set(key, snapshot, timeout=int(getattr(settings, "NOTIFICATION_NAV_CACHE_SECONDS", 300)))
+    return snapshot
+
+
+def invalidate_notification_nav(*user_ids) -> None:
+    keys = [_nav_cache_key(user_id) for user_id in set(user_ids)]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    # again once committed, in case a concurrent request re-cached pre-commit data
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def archive_read_notifications(days=None, *, batch_size=1000, pause=0.0) -> int:
+    """Move read notifications older than ``days`` into NotificationArchive; returns the row count.
+
+    Works in independent batches so no lock is held for longer than one batch.
+    """
+    if days is None:
+        days = int(getattr(settings, "NOTIFICATION_RETENTION_DAYS", 90))
+    before = timezone.now() - timedelta(days=days)
+    total = 0
+    while True:
+        user_ids = Notification.objects.archive_read(before, batch_size=batch_size)
+        if not user_ids:
+            return total
+        total += len(user_ids)
+        invalidate_notification_nav(*user_ids)
+        if len(user_ids) < batch_size:
+            return total
+        if pause:
+            time.sleep(pause)
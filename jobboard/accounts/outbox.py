@@ -0,0 +1,176 @@
+"""Transactional email outbox.
+
+``enqueue_email`` stores the message as an ``OutboxEmail`` row in the caller's
+transaction, so an email is only ever sent for work that actually committed
+and no SMTP round trip happens inside the request. Delivery happens in
+batches claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` in a short
+transaction that only pushes ``next_attempt_at`` EMAIL_OUTBOX_LEASE_SECONDS
+ahead (a lease, so other workers skip the rows); the batch is then sent over
+a single backend connection with no transaction or row lock held, and the
+results are written in a second short transaction. A worker that dies
+mid-batch leaves its rows to be retried once the lease runs out. Failed
+messages are retried with
+exponential backoff (EMAIL_OUTBOX_RETRY_SECONDS, doubling) until
+EMAIL_OUTBOX_MAX_ATTEMPTS, then marked failed.
+
+After commit, a flush is scheduled in this process EMAIL_OUTBOX_FLUSH_SECONDS
+later (mirroring jobs.alert_batcher); ``send_outbox_emails`` drains whatever
+is left, e.g. from cron or as a long-running worker.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY_SECONDS = 6 * 3600
+
+_pending = threading.local()
+
+
+def enqueue_email(*, subject: str, message: str, recipient_list, from_email: str | None = None) -> OutboxEmail:
+    email = OutboxEmail(
+        subject=subject[:255],
+        body=message or "",
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(recipient_list),
+    )
+    buffer = getattr(_pending, "emails", None)
+    if buffer is not None:
+        buffer.append(email)
+        return email
+    email.save()
+    transaction.on_commit(_scheduler.schedule)
+    return email
+
+
+@contextmanager
+def batched_outbox():
+    """Collect ``enqueue_email`` calls in the block and write them with one bulk INSERT."""
+    if getattr(_pending, "emails", None) is not None:
+        yield  # already batching further up the stack
+        return
+    _pending.emails = []
+    try:
+        yield
+        emails = _pending.emails
+    finally:
+        _pending.emails = None
+    if emails:
+        OutboxEmail.objects.bulk_create(emails, batch_size=500)
+        transaction.on_commit(_scheduler.schedule)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    base = float(getattr(settings, "EMAIL_OUTBOX_RETRY_SECONDS", 30))
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), MAX_RETRY_DELAY_SECONDS))
+
+
+def _claim_batch(batch_size: int) -> list[OutboxEmail]:
+    lease = timedelta(seconds=float(getattr(settings, "EMAIL_OUTBOX_LEASE_SECONDS", 300)))
+    with transaction.atomic():
+        rows = list(
+            OutboxEmail.objects.filter(status=OutboxEmail.Status.PENDING, next_attempt_at__lte=timezone.now())
+            .select_for_update(skip_locked=True)
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if rows:
+            OutboxEmail.objects.filter(id__in=[row.id for row in rows]).update(
+                next_attempt_at=timezone.now() + lease
+            )
+    return rows
+
+
+def deliver_outbox_batch(*, batch_size: int = 100) -> tuple[int, int]:
+    """Claim and send one batch of due emails; returns (sent, failed attempts)."""
+    max_attempts = int(getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+    rows = _claim_batch(batch_size)
+    if not rows:
+        return 0, 0
+
+    sent, failed = [], []
+    try:
+        with get_connection(fail_silently=False) as connection:
+            for row in rows:
+                # one message per call so a bad address only fails its own row
+                try:
+                    connection.send_messages([EmailMessage(row.subject, row.body, row.from_email, row.to)])
+                    sent.append(row)
+                except Exception as exc:
+                    failed.append((row, exc))
+    except Exception as exc:
+        # could not open (or close) the connection: retry everything not yet sent
+        done = {row.id for row in sent} | {row.id for row, _exc in failed}
+        failed += [(row, exc) for row in rows if row.id not in done]
+
+    now = timezone.now()
+    for row, exc in failed:
+        row.attempts += 1
+        row.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+        if row.attempts >= max_attempts:
+            row.status = OutboxEmail.Status.FAILED
+            logger.error("Outbox email %s failed permanently: %s", row.id, row.last_error)
+        else:
+            row.next_attempt_at = now + _retry_delay(row.attempts)
+    with transaction.atomic():
+        if sent:
+            OutboxEmail.objects.filter(id__in=[row.id for row in sent]).update(
+                status=OutboxEmail.Status.SENT, sent_at=now, attempts=F("attempts") + 1, last_error=""
+            )
+        if failed:
+            OutboxEmail.objects.bulk_update(
+                [row for row, _exc in failed], ["attempts", "last_error", "status", "next_attempt_at"]
+            )
+    return len(sent), len(failed)
+
+
+def drain_outbox(*, batch_size: int = 100) -> tuple[int, int]:
+    sent_total = failed_total = 0
+    while True:
+        sent, failed = deliver_outbox_batch(batch_size=batch_size)
+        if not sent and not failed:
+            return sent_total, failed_total
+        sent_total += sent
+        failed_total += failed
+
+
+class _Scheduler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def schedule(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                return
+            window = float(getattr(settings, "EMAIL_OUTBOX_FLUSH_SECONDS", 1))
+            self._timer = threading.Timer(window, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            sent, failed = drain_outbox()
+            if sent or failed:
+                logger.info("Outbox flushed: sent=%s failed=%s", sent, failed)
+        except Exception:
+            logger.exception("Outbox delivery failed")
+        finally:
+            connections.close_all()
+
+
+_scheduler = _Scheduler()
@@ -0,0 +1,166 @@
+"""Server-sent events hub for live notifications.
+
+Each open ``notifications_stream`` connection subscribes a queue for its user.
+One hub per event loop polls the database every NOTIFICATION_STREAM_POLL_SECONDS
+for *all* subscribed users at once (new Notification rows, unread counts,
+new JobAlertMatch rows) and fans the results out to the queues. Database load
+therefore grows with the number of polls, not the number of connections.
+The psycopg2 driver used here has no async LISTEN support, so the hub polls
+rather than relying on LISTEN/NOTIFY.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import weakref
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from .models import Notification
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 15
+QUEUE_SIZE = 100
+
+
+def sse_event(event: str, payload) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+class NotificationHub:
+    def __init__(self):
+        self._subscribers: dict[int, set[asyncio.Queue]] = defaultdict(set)
+        self._unread: dict[int, int] = {}
+        self._cursor: tuple[int, int] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def _current_cursor(self) -> tuple[int, int]:
+        from jobs.models import JobAlertMatch
+
+        notification = await Notification.objects.aaggregate(last=Max("id"))
+        match = await JobAlertMatch.objects.aaggregate(last=Max("id"))
+        return notification["last"] or 0, match["last"] or 0
+
+    async def subscribe(self, user_id: int, *, unread: int) -> asyncio.Queue:
+        if self._cursor is None:
+            self._cursor = await self._current_cursor()
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._subscribers[user_id].add(queue)
+        self._unread[user_id] = unread
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+            self._unread.pop(user_id, None)
+
+    def _publish(self, user_id: int, event: str, payload) -> None:
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait((event, payload))
+            except asyncio.QueueFull:
+                # slow client; it can resync from the notifications page
+                pass
+
+    async def _run(self) -> None:
+        interval = float(getattr(settings, "NOTIFICATION_STREAM_POLL_SECONDS", 2))
+        while self._subscribers:
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("Notification stream poll failed")
+            await asyncio.sleep(interval)
+        self._cursor = None
+
+    async def poll_once(self) -> None:
+        from jobs.models import JobAlertMatch
+
+        user_ids = list(self._subscribers)
+        if not user_ids:
+            return
+        last_notification, last_match = self._cursor or await self._current_cursor()
+
+        rows = Notification.objects.filter(user_id__in=user_ids, id__gt=last_notification).order_by("id")
+        async for row in rows.values("id", "user_id", "title", "message", "url", "created_at"):
+            last_notification = row["id"]
+            self._publish(row.pop("user_id"), "notification", row)
+
+        matches = (
+            JobAlertMatch.objects.filter(alert__jobseeker__user_id__in=user_ids, id__gt=last_match)
+            .order_by("id")
+            .values("id", "alert_id", "job_id", "job__title", "job__location", "alert__jobseeker__user_id")
+        )
+        async for row in matches:
+            last_match = row["id"]
+            self._publish(
+                row["alert__jobseeker__user_id"],
+                "alert_match",
+                {
+                    "id": row["id"],
+                    "alert_id": row["alert_id"],
+                    "job_id": row["job_id"],
+                    "title": row["job__title"],
+                    "location": row["job__location"],
+                    "url": f"/jobs/{row['job_id']}/",
+                },
+            )
+        self._cursor = (last_notification, last_match)
+
+        counts = {user_id: 0 for user_id in user_ids}
+        unread = (
+            Notification.objects.filter(user_id__in=user_ids, is_read=False)
+            .values("user_id")
+            .annotate(n=Count("id"))
+            .order_by()
+        )
+        async for row in unread:
+            counts[row["user_id"]] = row["n"]
+        for user_id, count in counts.items():
+            if user_id in self._unread and self._unread[user_id] != count:
+                self._unread[user_id] = count
+                self._publish(user_id, "unread", {"count": count})
+
+
+_hubs: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, NotificationHub]" = weakref.WeakKeyDictionary()
+
+
+def get_notification_hub() -> NotificationHub:
+    """The hub for the running event loop (one per process under ASGI)."""
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = _hubs[loop] = NotificationHub()
+    return hub
+
+
+async def notification_events(user_id: int, unread: int):
+    """Async iterator of SSE frames for one connection."""
+    hub = get_notification_hub()
+    queue = await hub.subscribe(user_id, unread=unread)
+    try:
+        yield "retry: 5000\n\n"
+        yield sse_event("unread", {"count": unread})
+        while True:
+            try:
+                event, payload = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield sse_event(event, payload)
+    finally:
+        hub.unsubscribe(user_id, queue)
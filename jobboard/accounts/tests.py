@@ -1,9 +1,22 @@
-from django.test import TestCase
+from asgiref.sync import sync_to_async
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from unittest import mock
+
+from django.core import mail
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from django.core.cache import cache
 from django.utils import timezone
 
-from .models import User
+from jobs.utils import create_in_app_notification
+
+from .context_processors import notifications_nav
+from .models import Notification, NotificationArchive, OutboxEmail, User
+from .outbox import deliver_outbox_batch, enqueue_email
+from .realtime import NotificationHub, get_notification_hub
 
 
 class SmsActivationTests(TestCase):
@@ -87,3 +100,176 @@ class SmsActivationTests(TestCase):
         self.assertTrue(u.is_email_verified)
         self.assertIsNone(u.sms_activation_code)
         self.assertIn("_auth_user_id", self.client.session)
+
+
+class NotificationNavTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="nav", password="pass", role="jobseeker", email="nav@example.com")
+        for i in range(6):
+            create_in_app_notification(self.user, title=f"Note {i}")
+
+    def _nav(self):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        request.session = {}
+        return notifications_nav(request)
+
+    def test_nav_snapshot_is_cached(self):
+        ctx = self._nav()
+        self.assertEqual(ctx["nav_unread_notifications"], 6)
+        self.assertEqual([n["title"] for n in ctx["nav_recent_notifications"]], [f"Note {i}" for i in range(5, 0, -1)])
+        with self.assertNumQueries(0):
+            self._nav()
+
+    def test_writes_refresh_nav_snapshot(self):
+        self._nav()
+        create_in_app_notification(self.user, title="Fresh")
+        ctx = self._nav()
+        self.assertEqual(ctx["nav_unread_notifications"], 7)
+        self.assertEqual(ctx["nav_recent_notifications"][0]["title"], "Fresh")
+
+        self.client.login(username="nav", password="pass")
+        note = Notification.objects.get(title="Fresh")
+        self.client.post(reverse("notification_mark_read", args=[note.id]))
+        self.assertEqual(self._nav()["nav_unread_notifications"], 6)
+        self.client.post(reverse("notifications_mark_all_read"))
+        self.assertEqual(self._nav()["nav_unread_notifications"], 0)
+
+
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="live", password="pass", role="jobseeker", email="live@example.com")
+        self.other = User.objects.create_user(username="quiet", password="pass", role="jobseeker", email="q@example.com")
+
+    async def test_hub_fans_out_new_notifications_and_unread_counts(self):
+        hub = NotificationHub()
+        first = await hub.subscribe(self.user.pk, unread=0)
+        second = await hub.subscribe(self.user.pk, unread=0)
+        hub._task.cancel()  # poll by hand
+
+        await sync_to_async(create_in_app_notification)(self.user, title="Live one", url="/jobs/")
+        await sync_to_async(create_in_app_notification)(self.other, title="Not yours")
+        await hub.poll_once()
+
+        for queue in (first, second):
+            events = [queue.get_nowait() for _ in range(queue.qsize())]
+            self.assertEqual([name for name, _payload in events], ["notification", "unread"])
+            self.assertEqual(events[0][1]["title"], "Live one")
+            self.assertEqual(events[1][1], {"count": 1})
+
+        await hub.poll_once()  # nothing new, count unchanged -> silence
+        self.assertTrue(first.empty())
+        hub.unsubscribe(self.user.pk, first)
+        hub.unsubscribe(self.user.pk, second)
+        self.assertEqual(hub.connection_count, 0)
+
+    async def test_stream_endpoint_sends_initial_unread_count(self):
+        await sync_to_async(create_in_app_notification)(self.user, title="Waiting")
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("notifications_stream"))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        get_notification_hub()._task.cancel()
+        self.assertEqual(await anext(stream), b'event: unread\ndata: {"count": 1}\n\n')
+        self.assertEqual(get_notification_hub().connection_count, 1)
+
+    def test_stream_requires_login(self):
+        response = self.client.get(reverse("notifications_stream"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_wsgi_pages_do_not_open_the_stream(self):
+        self.client.force_login(self.user)
+        self.assertNotContains(self.client.get(reverse("notifications_list")), "data-stream-url")
+        # 204 makes EventSource stop reconnecting
+        self.assertEqual(self.client.get(reverse("notifications_stream")).status_code, 204)
+
+    async def test_asgi_pages_render_the_stream_url(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("notifications_list"))
+        self.assertContains(response, "data-stream-url")
+
+
+class NotificationRetentionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="old", password="pass", role="jobseeker", email="old@example.com")
+
+    def test_notifications_list_is_paginated(self):
+        for i in range(25):
+            create_in_app_notification(self.user, title=f"N{i}")
+        self.client.login(username="old", password="pass")
+        response = self.client.get(reverse("notifications_list"))
+        page = response.context["page_obj"]
+        self.assertEqual([n.title for n in page][:2], ["N24", "N23"])
+        self.assertEqual(len(page), 20)
+        response = self.client.get(reverse("notifications_list"), {"cursor": page.next_cursor})
+        self.assertEqual([n.title for n in response.context["page_obj"]], [f"N{i}" for i in range(4, -1, -1)])
+
+    def test_archive_moves_only_old_read_notifications_in_batches(self):
+        for i in range(5):
+            create_in_app_notification(self.user, title=f"Old read {i}")
+        create_in_app_notification(self.user, title="Old unread")
+        create_in_app_notification(self.user, title="Recent read")
+        old = timezone.now() - timedelta(days=100)
+        Notification.objects.exclude(title="Recent read").update(created_at=old)
+        Notification.objects.exclude(title="Old unread").update(is_read=True)
+
+        call_command("archive_notifications", days=30, batch_size=2, stdout=StringIO())
+
+        self.assertEqual(
+            sorted(Notification.objects.values_list("title", flat=True)), ["Old unread", "Recent read"]
+        )
+        archived = NotificationArchive.objects.filter(user=self.user)
+        self.assertEqual(archived.count(), 5)
+        self.assertEqual(archived.first().created_at, old)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", EMAIL_OUTBOX_RETRY_SECONDS=60)
+class EmailOutboxTests(TestCase):
+    def test_batch_is_sent_over_one_connection(self):
+        for i in range(3):
+            enqueue_email(subject=f"Hello {i}", message="Body", recipient_list=[f"u{i}@example.com"])
+        with mock.patch("accounts.outbox.get_connection", wraps=mail.get_connection) as get_connection:
+            self.assertEqual(deliver_outbox_batch(batch_size=10), (3, 0))
+        self.assertEqual(get_connection.call_count, 1)
+        self.assertEqual(sorted(m.subject for m in mail.outbox), ["Hello 0", "Hello 1", "Hello 2"])
+        self.assertFalse(OutboxEmail.objects.exclude(status=OutboxEmail.Status.SENT).exists())
+        self.assertEqual(deliver_outbox_batch(), (0, 0))
+
+    def test_batch_is_leased_while_it_is_sent(self):
+        email = enqueue_email(subject="Slow", message="Body", recipient_list=["x@example.com"])
+        claimed_while_sending = []
+
+        def send_messages(messages):
+            # an overlapping worker finds nothing due; the row carries a lease, not a held lock
+            claimed_while_sending.append(deliver_outbox_batch())
+            self.assertGreater(OutboxEmail.objects.get(pk=email.pk).next_attempt_at, timezone.now() + timedelta(seconds=250))
+            return len(messages)
+
+        connection = mock.MagicMock()
+        connection.__enter__.return_value.send_messages.side_effect = send_messages
+        with mock.patch("accounts.outbox.get_connection", return_value=connection):
+            self.assertEqual(deliver_outbox_batch(), (1, 0))
+        self.assertEqual(claimed_while_sending, [(0, 0)])
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), (OutboxEmail.Status.SENT, 1))
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_failures_back_off_then_give_up(self):
+        email = enqueue_email(subject="Flaky", message="Body", recipient_list=["x@example.com"])
+        with mock.patch("accounts.outbox.get_connection", side_effect=ConnectionRefusedError("smtp down")):
+            self.assertEqual(deliver_outbox_batch(), (0, 1))
+            email.refresh_from_db()
+            self.assertEqual(email.attempts, 1)
+            self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=50))
+            self.assertEqual(deliver_outbox_batch(), (0, 0))  # not due yet
+
+            OutboxEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+            self.assertEqual(deliver_outbox_batch(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.Status.FAILED)
+        self.assertIn("smtp down", email.last_error)
+        self.assertEqual(mail.outbox, [])
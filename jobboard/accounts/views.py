@@ -8,7 +8,9 @@ from django.contrib.auth import authenticate, login, logout, get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.tokens import default_token_generator
 from django.core.cache import cache
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
@@ -18,9 +20,12 @@ from django.views.decorators.http import require_http_methods, require_POST
 
 from jobboard.email_demo import send_email_demo
 from jobboard.sms_demo import send_sms_demo
+from jobs.pagination import keyset_paginate
 
 from .forms import EmployerRegistrationForm, JobSeekerRegistrationForm, LoginForm
 from .models import EmployerProfile, JobSeekerProfile, Notification
+from .notifications import invalidate_notification_nav, notification_nav_snapshot
+from .realtime import notification_events
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -356,8 +361,9 @@ def sms_send_code(request):
 # -----------------------------
 @login_required
 def notifications_list(request):
-    qs = Notification.objects.filter(user=request.user).order_by("-created_at")
-    return render(request, "accounts/notifications.html", {"notifications": qs})
+    qs = Notification.objects.filter(user=request.user)
+    page_obj = keyset_paginate(qs, request.GET.get("cursor"), per_page=20)
+    return render(request, "accounts/notifications.html", {"notifications": page_obj, "page_obj": page_obj})
 
 @login_required
 @require_POST
@@ -365,6 +371,7 @@ def notification_mark_read(request, notification_id):
     notif = get_object_or_404(Notification, id=notification_id, user=request.user)
     notif.is_read = True
     notif.save(update_fields=["is_read"])
+    invalidate_notification_nav(request.user.pk)
     next_url = request.POST.get("next") or request.META.get("HTTP_REFERER") or "/"
     return redirect(next_url)
 
@@ -372,9 +379,26 @@ def notification_mark_read(request, notification_id):
 @require_POST
 def notifications_mark_all_read(request):
     Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+    invalidate_notification_nav(request.user.pk)
     next_url = request.POST.get("next") or request.META.get("HTTP_REFERER") or "/"
     return redirect(next_url)
 
+@login_required
+async def notifications_stream(request):
+    # Server-sent events. Under WSGI the endless stream would pin a worker thread
+    # (and start a hub per request), so answer 204, which tells EventSource to stop retrying.
+    if not getattr(settings, "NOTIFICATION_STREAM_ENABLED", True) or not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    user = await request.auser()
+    snapshot = await sync_to_async(notification_nav_snapshot)(user)
+    response = StreamingHttpResponse(
+        notification_events(user.pk, snapshot["unread"]),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
 def toggle_ui_dir(request):
     # simple RTL/LTR toggle stored in session
     cur = request.session.get("ui_dir")
@@ -5,3 +5,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobboard.settings')
 
 application = get_asgi_application()
+
+from jobs.autocomplete import warm_autocomplete  # noqa: E402
+
+warm_autocomplete()
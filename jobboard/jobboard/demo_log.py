@@ -0,0 +1,148 @@
+"""Process-wide buffered writer for the demo SMS/email log files.
+
+``send_sms_demo`` / ``send_email_demo`` append to several small files per
+message. Doing that inside the request meant repeated ``mkdir``/open/close
+calls on the hot path, so callers now only enqueue ``(path, text)`` and a
+single background thread writes them in batches:
+
+- records arriving within DEMO_LOG_FLUSH_SECONDS are grouped per file and
+  written with one ``write`` + ``flush`` each;
+- open handles are kept in a small LRU, directories are created once;
+- ``flush_demo_logs()`` blocks until everything queued so far is on disk
+  (views that read the logs back call it), and it also runs at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_OPEN_FILES = 64
+MAX_BATCH = 1000
+
+
+class BufferedLogWriter:
+    def __init__(self, *, max_open_files: int = MAX_OPEN_FILES):
+        self.max_open_files = max_open_files
+        self._start_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._queue = queue.SimpleQueue()
+        self._handles: OrderedDict[Path, Any] = OrderedDict()
+        self._dirs: set[Path] = set()
+        self._io_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+
+    def _ensure_thread(self) -> None:
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._pid != os.getpid():
+                # forked worker: the parent's thread and handles are not ours
+                self._reset()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="demo-log-writer", daemon=True)
+                self._thread.start()
+
+    def write(self, path, text: str) -> None:
+        self._ensure_thread()
+        self._queue.put((Path(path), text))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything enqueued before this call has been written."""
+        if self._pid != os.getpid() or self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        self.flush()
+        with self._io_lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+    def _run(self) -> None:
+        window = float(getattr(settings, "DEMO_LOG_FLUSH_SECONDS", 0.2))
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + window
+            while len(batch) < MAX_BATCH and not isinstance(batch[-1], threading.Event):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch) -> None:
+        grouped = defaultdict(list)
+        waiters = []
+        for item in batch:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                grouped[item[0]].append(item[1])
+        with self._io_lock:
+            for path, chunks in grouped.items():
+                try:
+                    handle = self._handle(path)
+                    handle.write("".join(chunks))
+                    handle.flush()
+                except OSError:
+                    logger.exception("Could not write demo log %s", path)
+                    stale = self._handles.pop(path, None)
+                    if stale is not None:
+                        stale.close()
+        for waiter in waiters:
+            waiter.set()
+
+    def _handle(self, path: Path):
+        handle = self._handles.get(path)
+        if handle is not None:
+            self._handles.move_to_end(path)
+            return handle
+        if path.parent not in self._dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(path.parent)
+        handle = path.open("a", encoding="utf-8")
+        self._handles[path] = handle
+        while len(self._handles) > self.max_open_files:
+            _path, oldest = self._handles.popitem(last=False)
+            oldest.close()
+        return handle
+
+
+_writer = BufferedLogWriter()
+atexit.register(_writer.close)
+
+
+def append_line(path, text: str) -> None:
+    """Queue ``text`` (already newline-terminated) for appending to ``path``."""
+    _writer.write(path, text)
+
+
+def append_jsonl(path, payload: dict[str, Any]) -> None:
+    # serialize now so a bad payload fails in the caller, not in the writer thread
+    _writer.write(path, json.dumps(payload, ensure_ascii=False) + "\n")
+
+
+def flush_demo_logs(timeout: float = 5.0) -> bool:
+    return _writer.flush(timeout)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,13 +8,10 @@ from typing import Any, Iterable
 import re
 
 from django.conf import settings
-from django.core.mail import send_mail
 
+from accounts.outbox import enqueue_email
 
-def _append_jsonl(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+from .demo_log import append_jsonl, append_line
 
 
 def send_email_demo(
@@ -57,10 +53,9 @@ def send_email_demo(
         log_path = log_dir / "jobboard_email.log"
     log_path = Path(str(log_path))
 
-    _append_jsonl(log_path, payload)
+    append_jsonl(log_path, payload)
 
     base_dir = log_path.parent
-    (base_dir / "email").mkdir(parents=True, exist_ok=True)
 
 
     link = meta.get("activation_link") if isinstance(meta, dict) else None
@@ -69,43 +64,33 @@ def send_email_demo(
         link = m.group(0) if m else ""
 
 
-    outbox_txt = base_dir / "email_outbox.txt"
-    with outbox_txt.open("a", encoding="utf-8") as f:
-        f.write("=" * 72 + "\n")
-        f.write(f"Time: {now}\n")
-        f.write(f"To: {', '.join(to_emails)}\n")
-        f.write(f"Tag: {tag}\n")
-        f.write(f"Subject: {subject}\n")
-        if link:
-            f.write(f"Link: {link}\n")
-        f.write("\n")
-        f.write((message or "").strip() + "\n\n")
+    outbox = ["=" * 72, f"Time: {now}", f"To: {', '.join(to_emails)}", f"Tag: {tag}", f"Subject: {subject}"]
+    if link:
+        outbox.append(f"Link: {link}")
+    outbox += ["", (message or "").strip(), "", ""]
+    append_line(base_dir / "email_outbox.txt", "\n".join(outbox))
 
 
     def _safe_name(value: str) -> str:
         return re.sub(r"[^a-zA-Z0-9_.-]", "_", value)
 
+    entry = f"[{now}] {tag} subject={subject}\n" + (f"Link: {link}\n" if link else "") + "---\n"
     for email in to_emails:
-        rec_path = base_dir / "email" / f"to_{_safe_name(email)}.txt"
-        with rec_path.open("a", encoding="utf-8") as f:
-            f.write(f"[{now}] {tag} subject={subject}\n")
-            if link:
-                f.write(f"Link: {link}\n")
-            f.write("---\n")
+        append_line(base_dir / "email" / f"to_{_safe_name(email)}.txt", entry)
 
 
     employer_id = meta.get("employer_user_id") or meta.get("employer_id") if isinstance(meta, dict) else None
     if employer_id:
-        _append_jsonl(base_dir / "email" / f"employer_{employer_id}.jsonl", payload)
+        append_jsonl(base_dir / "email" / f"employer_{employer_id}.jsonl", payload)
     user_id = meta.get("user_id") if isinstance(meta, dict) else None
     if user_id:
-        _append_jsonl(base_dir / "email" / f"user_{user_id}.jsonl", payload)
+        append_jsonl(base_dir / "email" / f"user_{user_id}.jsonl", payload)
 
 
-    send_mail(
+    # delivered by the outbox worker once the surrounding transaction commits
+    enqueue_email(
         subject=subject,
         message=message,
         from_email=(from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@jobboard.local")),
         recipient_list=list(to_emails),
-        fail_silently=False,
     )
@@ -24,6 +24,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "accounts",
     "jobs",
     "resumes",
@@ -93,6 +94,52 @@ SESSION_SAVE_EVERY_REQUEST = True
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
 SMS_ACTIVATION_TTL_SECONDS = int(os.getenv("SMS_ACTIVATION_TTL_SECONDS", "600"))
 
+# -----------------------------
+# Job search
+# -----------------------------
+# Full-text (tsvector + GIN) keyword search; set to 0 to fall back to icontains scans.
+JOB_SEARCH_FULLTEXT = os.getenv("JOB_SEARCH_FULLTEXT", "1") == "1"
+# How long job_list sidebar facet counts are cached per normalized query.
+JOB_FACETS_CACHE_SECONDS = int(os.getenv("JOB_FACETS_CACHE_SECONDS", "60"))
+# Ordered job-id lists for repeated job_list searches; invalidated on any Job write.
+JOB_SEARCH_CACHE_SECONDS = int(os.getenv("JOB_SEARCH_CACHE_SECONDS", "300"))
+JOB_SEARCH_CACHE_MAX_IDS = int(os.getenv("JOB_SEARCH_CACHE_MAX_IDS", "1000"))
+# How often each worker checks whether its in-memory autocomplete indexes are stale.
+JOB_AUTOCOMPLETE_REFRESH_SECONDS = int(os.getenv("JOB_AUTOCOMPLETE_REFRESH_SECONDS", "5"))
+# Recommended jobs: "tfidf" (cosine similarity) or "overlap" (12/4/2 skill/text/education weights).
+JOB_RECOMMENDATION_PROFILE = os.getenv("JOB_RECOMMENDATION_PROFILE", "tfidf")
+# Minimum age of the in-memory job×term matrix before a catalogue change triggers a rebuild.
+JOB_RECOMMENDATION_REFRESH_SECONDS = int(os.getenv("JOB_RECOMMENDATION_REFRESH_SECONDS", "30"))
+# Rebuild a stale matrix in a background thread (requests keep the old one); "0" rebuilds inline.
+JOB_RECOMMENDATION_BACKGROUND_REFRESH = os.getenv("JOB_RECOMMENDATION_BACKGROUND_REFRESH", "1") == "1"
+# New jobs are matched against alerts in micro-batches collected over this window.
+JOB_ALERT_BATCH_WINDOW_SECONDS = float(os.getenv("JOB_ALERT_BATCH_WINDOW_SECONDS", "2"))
+# Each worker rebuilds its in-memory alert index at least this often, even without a version bump.
+JOB_ALERT_INDEX_MAX_AGE_SECONDS = int(os.getenv("JOB_ALERT_INDEX_MAX_AGE_SECONDS", "300"))
+# Per-seeker/employer application status counters on dashboards; dropped on every application write.
+APPLICATION_SUMMARY_CACHE_SECONDS = int(os.getenv("APPLICATION_SUMMARY_CACHE_SECONDS", "60"))
+# Landing page totals/featured companies/recent jobs: recomputed by one worker at a time,
+# the previous value is served for up to HOME_PUBLIC_CACHE_STALE_SECONDS meanwhile.
+HOME_PUBLIC_CACHE_SECONDS = int(os.getenv("HOME_PUBLIC_CACHE_SECONDS", "60"))
+HOME_PUBLIC_CACHE_STALE_SECONDS = int(os.getenv("HOME_PUBLIC_CACHE_STALE_SECONDS", "600"))
+# Numbered listings and landing page totals use planner row estimates ("about N results")
+# once the estimate reaches this many rows; below it they run an exact COUNT(*).
+ESTIMATED_COUNT_THRESHOLD = int(os.getenv("ESTIMATED_COUNT_THRESHOLD", "50000"))
+
+# -----------------------------
+# Notifications
+# -----------------------------
+# Navbar unread count/recent list is cached per user and dropped on every write;
+# the timeout only bounds staleness from writers that bypass accounts.notifications.
+NOTIFICATION_NAV_CACHE_SECONDS = int(os.getenv("NOTIFICATION_NAV_CACHE_SECONDS", "300"))
+# Live /accounts/notifications/stream/ (server-sent events). Only used when the request came in
+# over ASGI; plain WSGI (runserver, gunicorn) pages never open it and the endpoint answers 204.
+NOTIFICATION_STREAM_ENABLED = os.getenv("NOTIFICATION_STREAM_ENABLED", "1") == "1"
+# One poll per worker feeds every open /accounts/notifications/stream/ connection.
+NOTIFICATION_STREAM_POLL_SECONDS = float(os.getenv("NOTIFICATION_STREAM_POLL_SECONDS", "2"))
+# Read notifications older than this are moved to the archive by `archive_notifications`.
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "90"))
+
 # -----------------------------
 # Password validation
 # -----------------------------
@@ -114,6 +161,25 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+# -----------------------------
+# Cache (shared by every worker)
+# -----------------------------
+# Search/alert-index versions, single-flight locks and per-user navbar snapshots
+# must be visible to all processes, so the default is a table in the project
+# database (``manage.py createcachetable``); set REDIS_URL to use Redis instead.
+REDIS_URL = os.getenv("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": REDIS_URL}}
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": os.getenv("CACHE_TABLE", "jobboard_cache"),
+        }
+    }
+
+# Sends demo SMS/email logs to a temp directory and uses LocMemCache while tests run.
+TEST_RUNNER = "jobboard.test_runner.JobboardTestRunner"
 
 # -----------------------------
 # Email (Phase 4 - Activation)
@@ -128,6 +194,12 @@ EMAIL_PORT = int(os.getenv("EMAIL_PORT", "25"))
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "0") == "1"
+# Outgoing mail is queued in accounts.OutboxEmail and sent in batches (see accounts.outbox).
+EMAIL_OUTBOX_FLUSH_SECONDS = float(os.getenv("EMAIL_OUTBOX_FLUSH_SECONDS", "1"))
+EMAIL_OUTBOX_RETRY_SECONDS = float(os.getenv("EMAIL_OUTBOX_RETRY_SECONDS", "30"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+# A claimed batch is hidden from other workers this long while it is sent outside any transaction.
+EMAIL_OUTBOX_LEASE_SECONDS = float(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", "300"))
 
 # -----------------------------
 # Logging (Phase 3)
@@ -136,6 +208,8 @@ LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 SMS_DEMO_LOG = LOG_DIR / "sms_demo.log"
 EMAIL_DEMO_LOG = LOG_DIR / "email_demo.log"
+# Demo SMS/email log lines are written by a background thread in batches collected over this window.
+DEMO_LOG_FLUSH_SECONDS = float(os.getenv("DEMO_LOG_FLUSH_SECONDS", "0.2"))
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
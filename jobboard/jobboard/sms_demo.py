@@ -1,7 +1,8 @@
 """Demo SMS helper.
 
 Instead of sending real SMS (which needs a paid provider/API),
-we store outgoing SMS messages in a local log file so you can
+we store outgoing SMS messages in a local log file (written in the
+background, see jobboard.demo_log) so you can
 show it to the instructor as the 'SMS' output.
 
 Extra: we store each SMS as a JSON line so we can filter and show
@@ -10,7 +11,6 @@ messages per employer (or per user) inside the UI.
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -18,13 +18,9 @@ from typing import Any
 
 from django.conf import settings
 
-logger = logging.getLogger(__name__)
-
+from .demo_log import append_jsonl
 
-def _append_jsonl(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+logger = logging.getLogger(__name__)
 
 
 def send_sms_demo(
@@ -40,7 +36,6 @@ def send_sms_demo(
             return None
 
         log_path = Path(str(log_path))
-        log_path.parent.mkdir(parents=True, exist_ok=True)
 
         payload = {
             "ts": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -50,7 +45,7 @@ def send_sms_demo(
             "meta": meta or {},
         }
         # Global SMS log
-        _append_jsonl(log_path, payload)
+        append_jsonl(log_path, payload)
 
         # Also write per-employer/per-user logs (requested for demo/testing)
         base_dir = log_path.parent
@@ -58,7 +53,7 @@ def send_sms_demo(
 
         employer_id = meta_.get("employer_user_id") or meta_.get("employer_id") or meta_.get("employer")
         if employer_id is not None:
-            _append_jsonl(base_dir / "sms" / f"employer_{employer_id}.jsonl", payload)
+            append_jsonl(base_dir / "sms" / f"employer_{employer_id}.jsonl", payload)
 
         user_id = (
             meta_.get("user_id")
@@ -66,7 +61,7 @@ def send_sms_demo(
             or meta_.get("job_seeker_user_id")
         )
         if user_id is not None:
-            _append_jsonl(base_dir / "sms" / f"user_{user_id}.jsonl", payload)
+            append_jsonl(base_dir / "sms" / f"user_{user_id}.jsonl", payload)
 
         # Mirror the SMS content to terminal logs for easy copy/paste in demos.
         logger.info("SMS_DEMO phone=%s message=%s", phone, message)
@@ -0,0 +1,48 @@
+"""Test runner: demo logs go to a temp directory, the cache to process memory."""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+from pathlib import Path
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+from .demo_log import flush_demo_logs
+
+
+class JobboardTestRunner(DiscoverRunner):
+    """Point SMS_DEMO_LOG/EMAIL_DEMO_LOG at a temp directory for the whole run.
+
+    The root logger's file handler (logs/jobboard.log) is detached too, so a
+    test run leaves nothing behind under LOG_DIR. The shared database cache is
+    swapped for LocMemCache: tests run in one process, and cache reads would
+    otherwise show up in ``assertNumQueries``.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._log_dir = tempfile.TemporaryDirectory(prefix="jobboard-test-logs-")
+        path = Path(self._log_dir.name)
+        self._test_settings = override_settings(
+            LOG_DIR=path,
+            SMS_DEMO_LOG=path / "sms_demo.log",
+            EMAIL_DEMO_LOG=path / "email_demo.log",
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        )
+        self._test_settings.enable()
+        root = logging.getLogger()
+        self._file_handlers = [h for h in root.handlers if isinstance(h, logging.FileHandler)]
+        for handler in self._file_handlers:
+            root.removeHandler(handler)
+
+    def teardown_test_environment(self, **kwargs):
+        # the writer thread may still hold lines for files in the temp directory
+        flush_demo_logs()
+        root = logging.getLogger()
+        for handler in self._file_handlers:
+            root.addHandler(handler)
+        self._test_settings.disable()
+        self._log_dir.cleanup()
+        super().teardown_test_environment(**kwargs)
@@ -6,3 +6,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobboard.settings')
 
 application = get_wsgi_application()
+
+from jobs.autocomplete import warm_autocomplete  # noqa: E402
+
+warm_autocomplete()
@@ -13,3 +13,12 @@ admin.site.register(JobAlertMatch)
 admin.site.register(JobApplicationEvent)
 
 admin.site.register(ApplicationNote)
+
+from .models import Skill, JobSkill
+
+admin.site.register(Skill)
+admin.site.register(JobSkill)
+
+from .models import SkillPopularity
+
+admin.site.register(SkillPopularity)
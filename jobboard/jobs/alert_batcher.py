@@ -0,0 +1,86 @@
+"""Deferred, micro-batched alert matching for newly posted jobs.
+
+New jobs are saved with ``alerts_processed_at`` NULL. Posting a job only
+schedules a flush (on commit) JOB_ALERT_BATCH_WINDOW_SECONDS later, so every
+job created during that window is matched in the same pass. Batches are
+claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``, which lets several workers
+(and the ``process_job_alerts`` command, e.g. from cron after a restart) drain
+the backlog without matching a job twice.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .models import Job
+from .utils import process_job_alerts_for_jobs
+
+logger = logging.getLogger(__name__)
+
+
+def process_pending_job_alerts(*, batch_size: int = 500) -> tuple[int, int]:
+    """Claim and match one batch of unprocessed jobs.
+
+    Returns (jobs processed, matches created); (0, 0) once nothing is pending.
+    """
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.filter(alerts_processed_at__isnull=True)
+            .select_for_update(skip_locked=True)
+            .defer("search_vector")
+            .order_by("id")[:batch_size]
+        )
+        if not jobs:
+            return 0, 0
+        Job.objects.filter(id__in=[job.id for job in jobs]).update(alerts_processed_at=timezone.now())
+        return len(jobs), process_job_alerts_for_jobs(jobs)
+
+
+def drain_pending_job_alerts(*, batch_size: int = 500) -> tuple[int, int]:
+    jobs_total = matches_total = 0
+    while True:
+        jobs, matches = process_pending_job_alerts(batch_size=batch_size)
+        if not jobs:
+            return jobs_total, matches_total
+        jobs_total += jobs
+        matches_total += matches
+
+
+class _Batcher:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def schedule(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                return
+            window = float(getattr(settings, "JOB_ALERT_BATCH_WINDOW_SECONDS", 2))
+            self._timer = threading.Timer(window, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            jobs, matches = drain_pending_job_alerts()
+            if jobs:
+                logger.info("Job alerts processed: jobs=%s matches=%s", jobs, matches)
+        except Exception:
+            logger.exception("Deferred job alert matching failed")
+        finally:
+            connections.close_all()
+
+
+_batcher = _Batcher()
+
+
+def schedule_job_alerts() -> None:
+    """Flush pending jobs in the next batch window, once the current transaction commits."""
+    transaction.on_commit(_batcher.schedule)
@@ -0,0 +1,238 @@
+"""Reverse-matching (percolator) index over enabled job alerts.
+
+Instead of testing a new job against every alert, each alert is filed under a
+single anchor taken from one of its required clauses:
+
+- skills: every required skill token (exact lookup against the job's skills),
+  plus one character gram per skill for jobs that list no skills and fall back
+  to a text match;
+- keywords: one character gram per keyword;
+- location: one character gram of the location.
+
+Keyword/location matching is substring based, so a clause can only match if
+its anchor gram (its rarest 3-gram, or the whole term when shorter) occurs in
+the job text. Alerts without any text clause sit in a list sorted by
+``min_salary`` that is cut with ``bisect`` against the job's ``max_salary``.
+Candidates are then verified exactly, so the index only has to avoid false
+negatives.
+
+The index is built per process and rebuilt when alerts change: writes in this
+process mark it stale directly, other workers see the version key in the
+shared cache (settings.CACHES) bumped by jobs.signals. As a safety net for
+writes that bypass the signals (queryset updates, raw SQL), an index older
+than JOB_ALERT_INDEX_MAX_AGE_SECONDS is rebuilt as well.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import JobAlert, _split_alert_keywords, _tokenize_csv
+
+GRAM_SIZE = 3
+
+_VERSION_KEY = "jobs:alerts:version"
+
+
+@dataclass(frozen=True)
+class AlertCriteria:
+    """An alert's filters, parsed once."""
+
+    alert_id: int
+    location: str
+    min_salary: int | None
+    max_salary: int | None
+    keywords: tuple[str, ...]
+    skills: frozenset[str]
+
+    @classmethod
+    def from_values(cls, alert_id, keywords, skills, location, min_salary, max_salary):
+        return cls(
+            alert_id=alert_id,
+            location=(location or "").lower(),
+            min_salary=min_salary,
+            max_salary=max_salary,
+            keywords=tuple(_split_alert_keywords(keywords)),
+            skills=frozenset(_tokenize_csv(skills)),
+        )
+
+    @classmethod
+    def from_alert(cls, alert):
+        return cls.from_values(
+            alert.id, alert.keywords, alert.skills, alert.location, alert.min_salary, alert.max_salary
+        )
+
+    def matches(self, job, title_desc: str, job_skills: set[str]) -> bool:
+        if self.location and self.location not in (job.location or "").lower():
+            return False
+        if self.min_salary is not None and job.max_salary is not None and job.max_salary < self.min_salary:
+            return False
+        if self.max_salary is not None and job.min_salary is not None and job.min_salary > self.max_salary:
+            return False
+        if self.keywords and not any(k in title_desc for k in self.keywords):
+            return False
+        if self.skills:
+            if job_skills:
+                if not (self.skills & job_skills):
+                    return False
+            # no skills on job -> fallback to text contains
+            elif not any(s in title_desc for s in self.skills):
+                return False
+        return True
+
+
+def job_match_text(job) -> tuple[str, set[str]]:
+    """The (haystack, skill set) pair alerts are matched against."""
+    title_desc = f"{job.title} {job.description or ''} {job.required_skills or ''}".lower()
+    return title_desc, set(_tokenize_csv(job.required_skills))
+
+
+def _term_grams(term: str) -> list[str]:
+    if len(term) <= GRAM_SIZE:
+        return [term]
+    return [term[i : i + GRAM_SIZE] for i in range(len(term) - GRAM_SIZE + 1)]
+
+
+def _text_grams(text: str) -> set[str]:
+    grams = set()
+    for n in range(1, GRAM_SIZE + 1):
+        grams.update(text[i : i + n] for i in range(len(text) - n + 1))
+    return grams
+
+
+class AlertIndex:
+    def __init__(self, criteria):
+        self.criteria: dict[int, AlertCriteria] = {c.alert_id: c for c in criteria}
+
+        gram_counts = Counter()
+        for c in self.criteria.values():
+            for term in (*c.skills, *c.keywords, c.location):
+                if term:
+                    gram_counts.update(set(_term_grams(term)))
+
+        def anchor(term: str) -> str:
+            return min(_term_grams(term), key=lambda g: (gram_counts[g], g))
+
+        self.by_skill = defaultdict(list)
+        self.skill_grams = defaultdict(list)
+        self.keyword_grams = defaultdict(list)
+        self.location_grams = defaultdict(list)
+        open_alerts = []
+        for c in self.criteria.values():
+            if c.skills:
+                for skill in c.skills:
+                    self.by_skill[skill].append(c.alert_id)
+                    self.skill_grams[anchor(skill)].append(c.alert_id)
+            elif c.keywords:
+                for keyword in c.keywords:
+                    self.keyword_grams[anchor(keyword)].append(c.alert_id)
+            elif c.location:
+                self.location_grams[anchor(c.location)].append(c.alert_id)
+            else:
+                open_alerts.append((c.min_salary or 0, c.alert_id))
+        open_alerts.sort()
+        self.open_min_salaries = [m for m, _id in open_alerts]
+        self.open_ids = [alert_id for _m, alert_id in open_alerts]
+
+    def __len__(self):
+        return len(self.criteria)
+
+    def candidates(self, job, title_desc: str, job_skills: set[str]) -> set[int]:
+        found = set()
+        text_grams = _text_grams(title_desc)
+        if job_skills:
+            for skill in job_skills:
+                found.update(self.by_skill.get(skill, ()))
+        else:
+            for gram in text_grams & self.skill_grams.keys():
+                found.update(self.skill_grams[gram])
+        for gram in text_grams & self.keyword_grams.keys():
+            found.update(self.keyword_grams[gram])
+        if self.location_grams and job.location:
+            for gram in _text_grams(job.location.lower()) & self.location_grams.keys():
+                found.update(self.location_grams[gram])
+        if job.max_salary is None:
+            found.update(self.open_ids)
+        else:
+            found.update(self.open_ids[: bisect_right(self.open_min_salaries, job.max_salary)])
+        return found
+
+    def match(self, job) -> list[int]:
+        """Ids of alerts the job satisfies, most recently created alert first."""
+        title_desc, job_skills = job_match_text(job)
+        return sorted(
+            (
+                alert_id
+                for alert_id in self.candidates(job, title_desc, job_skills)
+                if self.criteria[alert_id].matches(job, title_desc, job_skills)
+            ),
+            reverse=True,
+        )
+
+
+def _load_criteria():
+    rows = (
+        JobAlert.objects.filter(is_enabled=True)
+        .order_by()
+        .values_list("id", "keywords", "skills", "location", "min_salary", "max_salary")
+        .iterator(chunk_size=5000)
+    )
+    return [AlertCriteria.from_values(*row) for row in rows]
+
+
+_lock = threading.Lock()
+_state = {"index": None, "version": None, "stale": False, "built_at": 0.0}
+
+
+def _seed() -> int:
+    # never back to a value some worker already built for, even after a cache flush
+    return time.time_ns() // 1000
+
+
+def _shared_version() -> int:
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        seed = _seed()
+        cache.add(_VERSION_KEY, seed, timeout=None)
+        version = cache.get(_VERSION_KEY, seed)
+    return version
+
+
+def get_alert_index() -> AlertIndex:
+    version = _shared_version()
+    index = _state["index"]
+    max_age = float(getattr(settings, "JOB_ALERT_INDEX_MAX_AGE_SECONDS", 300))
+    if (
+        index is not None
+        and not _state["stale"]
+        and _state["version"] == version
+        and time.monotonic() - _state["built_at"] < max_age
+    ):
+        return index
+    with _lock:
+        # stale alerts mean missed matches, so everyone waits for the rebuild
+        if _state["index"] is index:
+            _state["stale"] = False
+            _state.update(index=AlertIndex(_load_criteria()), version=version, built_at=time.monotonic())
+        return _state["index"]
+
+
+def _bump_shared_version() -> None:
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.add(_VERSION_KEY, _seed(), timeout=None)
+    _state["stale"] = True
+
+
+def invalidate_alert_index() -> None:
+    _state["stale"] = True
+    transaction.on_commit(_bump_shared_version)
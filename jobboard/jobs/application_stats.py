@@ -0,0 +1,51 @@
+"""Short-lived per-user cache of application status summaries.
+
+The seeker/employer dashboards and application lists all show the same
+per-status counters (``JobApplicationQuerySet.status_summary``). They are
+cached for APPLICATION_SUMMARY_CACHE_SECONDS per seeker/employer and dropped
+by jobs.signals whenever one of their applications is saved or deleted.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import JobApplication
+
+
+def _key(scope: str, owner_id) -> str:
+    return f"jobs:app_summary:{scope}:{owner_id}"
+
+
+def _cached(key: str, compute) -> dict:
+    summary = cache.get(key)
+    if summary is None:
+        summary = compute()
+        cache.set(key, summary, timeout=int(getattr(settings, "APPLICATION_SUMMARY_CACHE_SECONDS", 60)))
+    return summary
+
+
+def seeker_application_summary(seeker) -> dict:
+    return _cached(
+        _key("seeker", seeker.pk),
+        lambda: JobApplication.objects.for_jobseeker(seeker).status_summary(),
+    )
+
+
+def employer_application_summary(employer) -> dict:
+    return _cached(
+        _key("employer", employer.pk),
+        lambda: JobApplication.objects.filter(job__employer=employer).status_summary(),
+    )
+
+
+def invalidate_application_summaries(*, seeker_ids=(), employer_ids=()) -> None:
+    keys = [_key("seeker", pk) for pk in set(seeker_ids)]
+    keys += [_key("employer", pk) for pk in set(employer_ids)]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    # again once committed, in case a concurrent request re-cached pre-commit counts
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,202 @@
+"""In-memory prefix autocomplete for skills, job titles and company names.
+
+Each vocabulary is a sorted array of lowercase keys searched with ``bisect``.
+Any prefix with more than ``SCAN_LIMIT`` completions has its top-k terms
+precomputed at build time, so a lookup either returns a stored list or ranks
+at most ``SCAN_LIMIT`` candidates; cost does not grow with vocabulary size.
+
+Indexes are built per process (warmed from wsgi/asgi at worker start) and
+rebuilt after data changes: writes in this process mark them stale directly,
+and other workers notice the shared version key bumped by jobs.signals.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.db.models import Count
+
+logger = logging.getLogger(__name__)
+
+TOP_K = 20
+SCAN_LIMIT = 64
+# Popular terms also searched by substring when a prefix has few completions.
+CONTAINS_POOL = 120
+
+VOCABULARIES = ("skill", "title", "company")
+
+_VERSION_KEY = "jobs:autocomplete:version"
+
+
+class PrefixIndex:
+    def __init__(self, weighted_terms):
+        """``weighted_terms``: iterable of (display term, weight).
+
+        Multi-word terms are also reachable from the start of each word, so
+        "dev" completes "Backend Developer".
+        """
+        weights = Counter()
+        for term, weight in weighted_terms:
+            term = (term or "").strip()
+            if term:
+                weights[term] += weight
+
+        entries = []
+        for term, weight in weights.items():
+            lowered = term.lower()
+            starts = [0] + [m.end() for m in re.finditer(r"[\s/\-]+", lowered)]
+            for start in dict.fromkeys(starts):
+                if start < len(lowered):
+                    entries.append((lowered[start:], -weight, term))
+        entries.sort()
+
+        self._keys = [key for key, _w, _t in entries]
+        self._entries = [(-w, term) for _key, w, term in entries]
+        self._ranked = [term for term, _w in weights.most_common()]
+        self._top = {}
+        self._build_top(0, len(self._keys), 1)
+
+    def _build_top(self, lo: int, hi: int, depth: int) -> None:
+        groups = defaultdict(list)
+        for i in range(lo, hi):
+            key = self._keys[i]
+            if len(key) >= depth:
+                groups[key[:depth]].append(i)
+        for prefix, idxs in groups.items():
+            if len(idxs) <= SCAN_LIMIT:
+                continue
+            self._top[prefix] = self._rank(idxs[0], idxs[-1] + 1)
+            self._build_top(idxs[0], idxs[-1] + 1, depth + 1)
+
+    def _rank(self, lo: int, hi: int) -> list[str]:
+        best = {}
+        for weight, term in self._entries[lo:hi]:
+            if best.get(term, -1) < weight:
+                best[term] = weight
+        return [term for term, _w in heapq.nsmallest(TOP_K, best.items(), key=lambda kv: (-kv[1], kv[0]))]
+
+    def suggest(self, prefix: str, limit: int = 12) -> list[str]:
+        prefix = (prefix or "").strip().lower()
+        if not prefix:
+            return self._ranked[:limit]
+        if prefix in self._top:
+            out = self._top[prefix][:limit]
+        else:
+            lo = bisect_left(self._keys, prefix)
+            hi = lo
+            while hi < len(self._keys) and hi - lo <= SCAN_LIMIT and self._keys[hi].startswith(prefix):
+                hi += 1
+            out = self._rank(lo, hi)[:limit]
+        if len(out) < limit:
+            seen = set(out)
+            for term in self._ranked[:CONTAINS_POOL]:
+                if term not in seen and prefix in term.lower():
+                    out.append(term)
+                    seen.add(term)
+                    if len(out) >= limit:
+                        break
+        return out
+
+    def __len__(self):
+        return len(self._ranked)
+
+
+def _load_terms(vocabulary: str):
+    from accounts.models import EmployerProfile
+
+    from .models import Job, SkillPopularity
+
+    if vocabulary == "skill":
+        return SkillPopularity.objects.filter(total__gt=0).values_list("token", "total")
+    if vocabulary == "title":
+        return Job.objects.values_list("title").annotate(n=Count("id")).order_by()
+    if vocabulary == "company":
+        return EmployerProfile.objects.annotate(n=Count("jobs")).values_list("company_name", "n")
+    raise ValueError(f"Unknown autocomplete vocabulary: {vocabulary}")
+
+
+class _Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes: dict[str, PrefixIndex] = {}
+        self._versions: dict[str, int] = {}
+        self._stale: set[str] = set()
+        self._version = None
+        self._checked_at = 0.0
+
+    def _shared_version(self) -> int:
+        interval = float(getattr(settings, "JOB_AUTOCOMPLETE_REFRESH_SECONDS", 5))
+        now = time.monotonic()
+        if self._version is None or now - self._checked_at >= interval:
+            self._version = cache.get(_VERSION_KEY, 0)
+            self._checked_at = now
+        return self._version
+
+    def mark_stale(self) -> None:
+        self._stale.update(self._indexes)
+        self._version = None
+
+    def build(self, vocabulary: str) -> PrefixIndex:
+        version = self._shared_version()
+        index = PrefixIndex(_load_terms(vocabulary))
+        self._indexes[vocabulary] = index
+        self._versions[vocabulary] = version
+        self._stale.discard(vocabulary)
+        return index
+
+    def get(self, vocabulary: str) -> PrefixIndex:
+        index = self._indexes.get(vocabulary)
+        fresh = (
+            index is not None
+            and vocabulary not in self._stale
+            and self._versions.get(vocabulary) == self._shared_version()
+        )
+        if fresh:
+            return index
+        # One thread rebuilds; concurrent requests keep serving the previous index.
+        if not self._lock.acquire(blocking=index is None):
+            return index
+        try:
+            return self.build(vocabulary)
+        finally:
+            self._lock.release()
+
+
+_registry = _Registry()
+
+
+def suggest(vocabulary: str, prefix: str, limit: int = 12) -> list[str]:
+    return _registry.get(vocabulary).suggest(prefix, limit=limit)
+
+
+def _bump_shared_version() -> None:
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.add(_VERSION_KEY, 1, timeout=None)
+    _registry.mark_stale()
+
+
+def invalidate_autocomplete() -> None:
+    _registry.mark_stale()
+    # other workers must not rebuild from rows this transaction has not committed yet
+    transaction.on_commit(_bump_shared_version)
+
+
+def warm_autocomplete() -> None:
+    """Build every index up front so the first suggestion request is fast."""
+    try:
+        for vocabulary in VOCABULARIES:
+            _registry.build(vocabulary)
+    except DatabaseError:
+        # e.g. before migrations have run; indexes are built on first use instead
+        logger.warning("Autocomplete warm-up skipped", exc_info=True)
@@ -0,0 +1,157 @@
+"""Denormalized counters on Job and EmployerProfile.
+
+Listings (employer_jobs, home_public's featured companies) read these columns
+instead of annotating COUNTs over applications/jobs on every request. Each
+write path bumps them with a single ``UPDATE ... SET n = n + 1`` (``F()``), so
+concurrent requests never lose increments; ``reconcile_counters`` recomputes
+them in batches to repair drift from writes that bypass these helpers (admin
+deletes, cascades, bulk loads).
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from accounts.models import EmployerProfile
+
+from .models import Job, JobAlertMatch, JobApplication, SavedJob
+
+STATUS_COUNTERS = {"submitted": "submitted_count", "interview": "interview_count", "rejected": "rejected_count"}
+
+
+def _bump(job_id, employer_id, **deltas) -> None:
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    Job.objects.filter(pk=job_id).update(**{name: F(name) + delta for name, delta in deltas.items()})
+    employer_deltas = {name: delta for name, delta in deltas.items() if name in EmployerProfile.COUNTER_FIELDS}
+    if employer_deltas:
+        EmployerProfile.objects.filter(pk=employer_id).update(
+            **{name: F(name) + delta for name, delta in employer_deltas.items()}
+        )
+
+
+def application_created(application) -> None:
+    deltas = {"applications_count": 1}
+    column = STATUS_COUNTERS.get(application.status)
+    if column:
+        deltas[column] = 1
+    _bump(application.job_id, application.job.employer_id, **deltas)
+
+
+def application_status_changed(application, previous: str) -> None:
+    if previous == application.status:
+        return
+    deltas = defaultdict(int)
+    if previous in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[previous]] -= 1
+    if application.status in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[application.status]] += 1
+    _bump(application.job_id, application.job.employer_id, **deltas)
+
+
+def job_saved(job, delta: int) -> None:
+    _bump(job.pk, job.employer_id, saves_count=delta)
+
+
+def alert_matches_added(job_ids) -> None:
+    """``job_ids`` holds one entry per new match; jobs sharing a count share one UPDATE."""
+    by_count = defaultdict(list)
+    for job_id, n in Counter(job_ids).items():
+        by_count[n].append(job_id)
+    for n, ids in by_count.items():
+        Job.objects.filter(pk__in=ids).update(alert_matches_count=F("alert_matches_count") + n)
+
+
+def application_deleted(application, employer_id) -> None:
+    deltas = {"applications_count": -1}
+    column = STATUS_COUNTERS.get(application.status)
+    if column:
+        deltas[column] = -1
+    _bump(application.job_id, employer_id, **deltas)
+
+
+def job_posted(job, delta: int = 1) -> None:
+    EmployerProfile.objects.filter(pk=job.employer_id).update(jobs_count=F("jobs_count") + delta)
+
+
+# -----------------------------
+# Reconciliation
+# -----------------------------
+def _count(qs, group: str):
+    return Coalesce(
+        Subquery(qs.order_by().values(group).annotate(n=Count("*")).values("n")[:1], output_field=IntegerField()),
+        Value(0),
+    )
+
+
+def _models(apps=None):
+    """(Job, EmployerProfile, JobApplication, SavedJob, JobAlertMatch); historical ones inside a migration."""
+    if apps is None:
+        return Job, EmployerProfile, JobApplication, SavedJob, JobAlertMatch
+    return (
+        apps.get_model("jobs", "Job"),
+        apps.get_model("accounts", "EmployerProfile"),
+        apps.get_model("jobs", "JobApplication"),
+        apps.get_model("jobs", "SavedJob"),
+        apps.get_model("jobs", "JobAlertMatch"),
+    )
+
+
+def _job_counter_expressions(apps=None) -> dict:
+    _job, _employer, application, saved, match = _models(apps)
+    rows = application.objects.filter(job=OuterRef("pk"))
+    expressions = {"applications_count": _count(rows, "job")}
+    for status, column in STATUS_COUNTERS.items():
+        expressions[column] = _count(rows.filter(status=status), "job")
+    expressions["saves_count"] = _count(saved.objects.filter(job=OuterRef("pk")), "job")
+    expressions["alert_matches_count"] = _count(match.objects.filter(job=OuterRef("pk")), "job")
+    return expressions
+
+
+def _employer_counter_expressions(apps=None) -> dict:
+    job, _employer, application, _saved, _match = _models(apps)
+    rows = application.objects.filter(job__employer=OuterRef("pk"))
+    expressions = {
+        "jobs_count": _count(job.objects.filter(employer=OuterRef("pk")), "employer"),
+        "applications_count": _count(rows, "job__employer"),
+    }
+    for status, column in STATUS_COUNTERS.items():
+        expressions[column] = _count(rows.filter(status=status), "job__employer")
+    return expressions
+
+
+def _reconcile(model, expressions: dict, batch_size: int) -> int:
+    fixed = 0
+    last_pk = 0
+    while True:
+        ids = list(model.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return fixed
+        last_pk = ids[-1]
+        in_sync = Q()
+        for name in expressions:
+            in_sync &= Q(**{name: F(f"actual_{name}")})
+        drifted = list(
+            model.objects.filter(pk__in=ids)
+            .annotate(**{f"actual_{name}": expr for name, expr in expressions.items()})
+            .exclude(in_sync)
+            .values_list("pk", flat=True)
+        )
+        if drifted:
+            fixed += model.objects.filter(pk__in=drifted).update(**expressions)
+
+
+def reconcile_counters(*, batch_size: int = 500, apps=None) -> tuple[int, int]:
+    """Recompute drifted counters; returns (jobs fixed, employers fixed).
+
+    ``apps`` is a migration's app registry, for backfilling from a data migration.
+    """
+    job, employer, *_rest = _models(apps)
+    return (
+        _reconcile(job, _job_counter_expressions(apps), batch_size),
+        _reconcile(employer, _employer_counter_expressions(apps), batch_size),
+    )
@@ -97,7 +97,7 @@ class JobAlertForm(_BootstrapMixin, forms.ModelForm):
     class Meta:
         from .models import JobAlert
         model = JobAlert
-        fields = ["keywords", "skills", "location", "min_salary", "max_salary", "is_enabled"]
+        fields = ["keywords", "skills", "location", "min_salary", "max_salary", "delivery", "is_enabled"]
         widgets = {"keywords": forms.TextInput(), "skills": forms.TextInput()}
 
     def __init__(self, *args, **kwargs):
@@ -105,8 +105,13 @@ class JobAlertForm(_BootstrapMixin, forms.ModelForm):
         self.fields["location"].widget = forms.Select(
             choices=[("", "All cities")] + [(c, c) for c in ENGLAND_CITIES]
         )
+        self.fields["delivery"].required = False
         self._bootstrap()
 
+    def clean_delivery(self):
+        from .models import AlertDelivery
+        return self.cleaned_data.get("delivery") or AlertDelivery.INSTANT
+
     def clean(self):
         cleaned = super().clean()
         min_salary = cleaned.get("min_salary")
@@ -0,0 +1,102 @@
+"""Stampede-protected cache for the public landing page aggregates.
+
+``home_public`` is the busiest anonymous page and its aggregates (job and
+company totals, featured companies, recent jobs, popular skills) are the same
+for every visitor, so they are computed once per HOME_PUBLIC_CACHE_SECONDS.
+``single_flight_cached`` keeps a cold or expiring entry from turning into N
+identical recomputations:
+
+- single flight: a recompute is guarded by a ``cache.add`` lock, so only one
+  worker runs the queries; the others keep serving the previous value, which
+  stays in the cache HOME_PUBLIC_CACHE_STALE_SECONDS past its expiry;
+- early refresh: each read may decide to recompute before expiry, with a
+  probability that rises as expiry nears and with how long the last compute
+  took (``delta``), so popular keys are usually refreshed before they expire;
+- cold cache: readers that find neither a value nor the lock briefly wait for
+  the lock holder's result instead of querying themselves.
+
+The lock and the value must live in the shared cache (settings.CACHES):
+with a per-process cache such as LocMemCache every worker would hold its own
+lock and run the queries itself.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from accounts.models import EmployerProfile
+
+from .models import Job, SkillPopularity
+from .pagination import count_or_estimate
+
+HOME_PUBLIC_KEY = "jobs:home_public"
+LOCK_SECONDS = 30
+COLD_WAIT_SECONDS = 2.0
+BETA = 1.0
+
+
+def _due(entry: dict, beta: float) -> bool:
+    # "XFetch": -log(u) for u in (0, 1] is an exponential draw, scaled by the compute time
+    return time.time() - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expires"]
+
+
+def _recompute(key: str, compute, ttl: int, stale_ttl: int):
+    started = time.monotonic()
+    value = compute()
+    entry = {"value": value, "delta": time.monotonic() - started, "expires": time.time() + ttl}
+    cache.set(key, entry, timeout=ttl + stale_ttl)
+    return value
+
+
+def single_flight_cached(key: str, compute, *, ttl: int, stale_ttl: int, beta: float = BETA):
+    entry = cache.get(key)
+    if entry is not None and not _due(entry, beta):
+        return entry["value"]
+
+    lock = f"{key}:lock"
+    if cache.add(lock, 1, timeout=LOCK_SECONDS):
+        try:
+            return _recompute(key, compute, ttl, stale_ttl)
+        finally:
+            cache.delete(lock)
+    if entry is not None:
+        return entry["value"]  # another worker is refreshing it
+
+    deadline = time.monotonic() + COLD_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry["value"]
+    # the lock holder is stuck or gone; don't hold the request any longer
+    return compute()
+
+
+def _compute_home_public() -> dict:
+    jobs, jobs_estimated = count_or_estimate(Job.objects.all())
+    companies, companies_estimated = count_or_estimate(EmployerProfile.objects.all())
+    return {
+        "recent_jobs": list(Job.objects.select_related("employer").order_by("-created_at")[:12]),
+        "featured_companies": list(EmployerProfile.objects.order_by("-jobs_count", "company_name")[:8]),
+        "jobs": jobs,
+        "jobs_estimated": jobs_estimated,
+        "companies": companies,
+        "companies_estimated": companies_estimated,
+        "skill_suggestions": list(
+            SkillPopularity.objects.filter(total__gt=0).order_by("-total", "token").values_list("token", flat=True)[:20]
+        ),
+    }
+
+
+def home_public_aggregates() -> dict:
+    return single_flight_cached(
+        HOME_PUBLIC_KEY,
+        _compute_home_public,
+        ttl=int(getattr(settings, "HOME_PUBLIC_CACHE_SECONDS", 60)),
+        stale_ttl=int(getattr(settings, "HOME_PUBLIC_CACHE_STALE_SECONDS", 600)),
+    )
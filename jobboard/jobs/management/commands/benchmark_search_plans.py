@@ -0,0 +1,132 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from accounts.models import EmployerProfile
+from jobs.constants import UK_CITIES
+from jobs.models import Job
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a synthetic job catalogue inside a transaction and compare query plans for the "
+        "icontains filters (title, location, company) with and without the trigram indexes. "
+        "Everything is rolled back unless --keep is passed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=500_000)
+        parser.add_argument("--employers", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=7)
+        parser.add_argument("--keep", action="store_true", help="Commit the synthetic rows instead of rolling back.")
+
+    def _cases(self):
+        return [
+            ("title", Job.objects.filter(title__icontains="quantum")),
+            ("location", Job.objects.filter(location__icontains="chester")),
+            ("company", Job.objects.filter(employer__company_name__icontains="bench co 0042")),
+        ]
+
+    def _trigram_indexes(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename IN ('jobs_job', 'accounts_employerprofile') AND indexdef ILIKE %s",
+                ["%gin_trgm_ops%"],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def _seed(self, rnd, rows, employers_n, batch_size):
+        employers = []
+        for i in range(employers_n):
+            user = User.objects.create(
+                username=f"bench_emp_{i:04d}",
+                email=f"bench_emp_{i:04d}@example.com",
+                role="employer",
+            )
+            employers.append(EmployerProfile(user=user, company_name=f"Bench Co {i:04d}"))
+        employers = EmployerProfile.objects.bulk_create(employers)
+
+        titles = [
+            "Backend Developer",
+            "Frontend Engineer",
+            "Data Analyst",
+            "DevOps Engineer",
+            "QA Engineer",
+            "Product Designer",
+            "Support Specialist",
+            "Account Manager",
+        ]
+        batch = []
+        for i in range(rows):
+            title = rnd.choice(titles)
+            if rnd.random() < 0.005:
+                title = f"Quantum {title}"
+            batch.append(
+                Job(
+                    employer=rnd.choice(employers),
+                    title=title,
+                    description="Synthetic benchmark posting.",
+                    location=rnd.choice(UK_CITIES),
+                    required_skills="python, sql",
+                )
+            )
+            if len(batch) >= batch_size:
+                Job.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Job.objects.bulk_create(batch)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE jobs_job")
+            cursor.execute("ANALYZE accounts_employerprofile")
+
+    def _explain(self, qs, *, use_indexes: bool):
+        sql, params = qs.query.sql_with_params()
+        with connection.cursor() as cursor:
+            flag = "on" if use_indexes else "off"
+            cursor.execute(f"SET LOCAL enable_bitmapscan = {flag}")
+            cursor.execute(f"SET LOCAL enable_indexscan = {flag}")
+            cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0][0]
+        nodes = []
+
+        def _walk(node):
+            relation = node.get("Relation Name") or node.get("Index Name")
+            nodes.append(f"{node['Node Type']}({relation})" if relation else node["Node Type"])
+            for child in node.get("Plans", []):
+                _walk(child)
+
+        _walk(plan["Plan"])
+        return nodes, plan["Execution Time"]
+
+    def handle(self, *args, **opts):
+        rnd = random.Random(opts["seed"])
+        rows = max(1, int(opts["rows"]))
+
+        indexes = self._trigram_indexes()
+        if indexes:
+            self.stdout.write(f"Trigram indexes: {', '.join(indexes)}")
+        else:
+            self.stdout.write(self.style.WARNING("No trigram indexes found (is pg_trgm installed and migrated?)."))
+
+        with transaction.atomic():
+            started = time.perf_counter()
+            self._seed(rnd, rows, max(1, int(opts["employers"])), max(1, int(opts["batch_size"])))
+            self.stdout.write(f"Seeded {rows} jobs in {time.perf_counter() - started:.1f}s")
+
+            for label, qs in self._cases():
+                for use_indexes in (False, True):
+                    nodes, ms = self._explain(qs, use_indexes=use_indexes)
+                    mode = "indexes on " if use_indexes else "indexes off"
+                    self.stdout.write(f"{label:<9} {mode} {ms:>10.2f} ms  {' > '.join(nodes)}")
+
+            if not opts["keep"]:
+                transaction.set_rollback(True)
+                self.stdout.write("Rolled back synthetic rows.")
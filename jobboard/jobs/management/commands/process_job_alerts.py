@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.alert_batcher import drain_pending_job_alerts
+
+
+class Command(BaseCommand):
+    help = "Match newly posted jobs that are still waiting for alert processing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and poll every N seconds (0 = drain once and exit).",
+        )
+
+    def handle(self, *args, **opts):
+        batch_size = max(1, int(opts["batch_size"]))
+        interval = float(opts["interval"])
+        while True:
+            jobs, matches = drain_pending_job_alerts(batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f"Processed {jobs} jobs, created {matches} alert matches."))
+            if interval <= 0:
+                return
+            time.sleep(interval)
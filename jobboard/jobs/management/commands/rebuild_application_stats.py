@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import ApplicationDailyStat
+
+
+class Command(BaseCommand):
+    help = "Recompute the per job/day application rollup (ApplicationDailyStat) from applications and their events."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employer", type=int, action="append", help="Only rebuild these employer profile ids.")
+
+    def handle(self, *args, **opts):
+        rows = ApplicationDailyStat.objects.rebuild(opts["employer"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily application stat rows."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import JobSkill
+
+
+class Command(BaseCommand):
+    help = "Backfill/repair the normalized Skill table and job<->skill rows from Job.required_skills."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **opts):
+        jobs_seen, rows_added = JobSkill.objects.rebuild(batch_size=max(1, int(opts["batch_size"])))
+        self.stdout.write(self.style.SUCCESS(f"Indexed skills for {jobs_seen} jobs ({rows_added} new job/skill rows)."))
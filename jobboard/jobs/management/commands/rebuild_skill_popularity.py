@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import SkillPopularity
+
+
+class Command(BaseCommand):
+    help = "Recompute the SkillPopularity table from all job postings and job seeker profiles."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **opts):
+        tokens = SkillPopularity.objects.rebuild(chunk_size=max(1, int(opts["chunk_size"])))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt skill popularity for {tokens} tokens."))
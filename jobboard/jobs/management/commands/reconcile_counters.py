@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from jobs.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized application/save/alert/job counters on jobs and employers where they drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows checked per UPDATE (default 500).")
+
+    def handle(self, *args, **opts):
+        jobs, employers = reconcile_counters(batch_size=max(1, opts["batch_size"]))
+        self.stdout.write(self.style.SUCCESS(f"Fixed counters on {jobs} jobs and {employers} employers."))
@@ -9,6 +9,7 @@ from django.utils import timezone
 
 from accounts.models import EmployerProfile, JobSeekerProfile, Notification
 from jobs.constants import UK_CITIES
+from jobs.counters import reconcile_counters
 from jobs.models import ExperienceLevel, Job, JobAlert, JobApplication, JobType, SavedJob
 from jobs.utils import record_application_event, process_alert_matches_for_alert, create_in_app_notification
 from resumes.models import Resume
@@ -260,7 +261,7 @@ class Command(BaseCommand):
    
         for profile in seeker_profiles:
             for alert in JobAlert.objects.filter(jobseeker=profile, is_enabled=True):
-                created_matches = process_alert_matches_for_alert(alert, limit=500)
+                created_matches = process_alert_matches_for_alert(alert)
                 if created_matches > 0:
                     create_in_app_notification(
                         profile.user,
@@ -288,6 +289,9 @@ class Command(BaseCommand):
                     url="/jobs/dashboard/",
                 )
 
+        # seeded saves/applications/matches skip the view-level counter updates
+        reconcile_counters()
+
         self.stdout.write(self.style.SUCCESS("Seeded demo data successfully."))
         self.stdout.write(f"Created/updated employers: {employers_n}")
         self.stdout.write(f"Created/updated job seekers: {seekers_n}")
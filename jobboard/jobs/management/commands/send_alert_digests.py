@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import AlertDelivery
+from jobs.utils import send_alert_digests
+
+
+class Command(BaseCommand):
+    help = "Deliver pending job alert matches as one digest per job seeker (run hourly/daily from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--frequency",
+            required=True,
+            choices=[AlertDelivery.HOURLY, AlertDelivery.DAILY],
+        )
+        parser.add_argument("--batch-size", type=int, default=200, help="Seekers per transaction.")
+
+    def handle(self, *args, **opts):
+        seekers, matches = send_alert_digests(opts["frequency"], batch_size=max(1, int(opts["batch_size"])))
+        self.stdout.write(self.style.SUCCESS(f"Sent {opts['frequency']} digests to {seekers} seekers ({matches} matches)."))
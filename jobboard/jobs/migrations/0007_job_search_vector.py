@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:57
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_search_vector(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    EmployerProfile = apps.get_model("accounts", "EmployerProfile")
+    company = Subquery(EmployerProfile.objects.filter(pk=OuterRef("employer_id")).values("company_name")[:1])
+    Job.objects.update(
+        search_vector=(
+            SearchVector("title", weight="A", config="english")
+            + SearchVector("required_skills", weight="A", config="english")
+            + SearchVector(company, weight="B", config="english")
+            + SearchVector("location", weight="C", config="english")
+            + SearchVector("description", weight="D", config="english")
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_sms_activation_fields'),
+        ('jobs', '0006_jobapplication_interview_time'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_search_vector_gin'),
+        ),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+"""Trigram GIN indexes for the substring (icontains) filters used by search and alerts.
+
+Django compiles ``field__icontains`` on PostgreSQL to
+``UPPER("col"::text) LIKE UPPER('%term%')``, so the indexes are built on that
+exact expression; a plain ``gin_trgm_ops`` index on the column would never be
+picked for those queries.
+
+The indexes are created CONCURRENTLY (non-atomic migration) so they can be
+rolled out on a live table. If the server does not ship the ``pg_trgm``
+contrib extension the migration logs a warning and leaves the filters
+unindexed instead of failing the deploy.
+"""
+
+import logging
+
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+TRIGRAM_INDEXES = [
+    ("jobs_job_title_trgm", "jobs_job", "title"),
+    ("jobs_job_location_trgm", "jobs_job", "location"),
+    ("accounts_employerprofile_company_name_trgm", "accounts_employerprofile", "company_name"),
+]
+
+
+def _pg_trgm_available(schema_editor) -> bool:
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if not _pg_trgm_available(schema_editor):
+        logger.warning("pg_trgm extension is not available; skipping trigram indexes.")
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+            f'ON "{table}" USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0004_user_sms_activation_fields"),
+        ("jobs", "0007_job_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
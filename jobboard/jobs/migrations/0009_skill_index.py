@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:59
+
+import django.db.models.deletion
+import jobs.models
+from django.db import migrations, models
+
+
+def backfill_job_skills(apps, schema_editor):
+    # Alert matching and the skills filter treat a job without JobSkill rows as listing no skills.
+    apps.get_model("jobs", "JobSkill").objects.rebuild()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+            managers=[
+                ('objects', jobs.models.SkillManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_skills', to='jobs.job')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_links', to='jobs.skill')),
+            ],
+            managers=[
+                ('objects', jobs.models.JobSkillManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='jobs', through='jobs.JobSkill', to='jobs.skill'),
+        ),
+        migrations.AddIndex(
+            model_name='jobskill',
+            index=models.Index(fields=['skill', 'job'], name='jobskill_skill_job_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobskill',
+            unique_together={('job', 'skill')},
+        ),
+        migrations.RunPython(backfill_job_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_sms_activation_fields'),
+        ('jobs', '0009_skill_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at', '-id'], name='job_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['jobseeker', '-submitted_at', '-id'], name='app_seeker_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-submitted_at', '-id'], name='app_job_submitted_idx'),
+        ),
+    ]
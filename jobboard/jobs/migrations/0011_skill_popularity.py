@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:07
+
+import jobs.models
+from django.db import migrations, models
+
+
+def backfill_skill_popularity(apps, schema_editor):
+    # Home/job form/apply suggestions and the skill autocomplete read this table.
+    apps.get_model("jobs", "SkillPopularity").objects.rebuild()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillPopularity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64, unique=True)),
+                ('job_count', models.PositiveIntegerField(default=0)),
+                ('seeker_count', models.PositiveIntegerField(default=0)),
+                ('total', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-total', 'token'], name='skillpop_total_token_idx')],
+            },
+            managers=[
+                ('objects', jobs.models.SkillPopularityManager()),
+            ],
+        ),
+        migrations.RunPython(backfill_skill_popularity, migrations.RunPython.noop),
+    ]
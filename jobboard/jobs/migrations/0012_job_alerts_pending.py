@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:19
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_jobs_processed(apps, schema_editor):
+    # Jobs posted before deferred matching were already matched inline.
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.update(alerts_processed_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_sms_activation_fields'),
+        ('jobs', '0011_skill_popularity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='alerts_processed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(mark_existing_jobs_processed, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('alerts_processed_at__isnull', True)), fields=['id'], name='job_alerts_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:26
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_matches_notified(apps, schema_editor):
+    # Matches created before digests existed were notified individually.
+    JobAlertMatch = apps.get_model("jobs", "JobAlertMatch")
+    JobAlertMatch.objects.update(notified_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_job_alerts_pending'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobalert',
+            name='delivery',
+            field=models.CharField(choices=[('instant', 'Instant'), ('hourly', 'Hourly digest'), ('daily', 'Daily digest')], default='instant', help_text='Notify on every match, or in one hourly/daily digest.', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='jobalertmatch',
+            name='notified_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_matches_notified, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='jobalertmatch',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['alert'], name='alertmatch_unsent_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:45
+
+import django.db.models.deletion
+import jobs.models
+from django.db import migrations, models
+
+
+def backfill_daily_stats(apps, schema_editor):
+    # Existing applications and their timeline events; new ones are bumped as they happen.
+    apps.get_model("jobs", "ApplicationDailyStat").objects.rebuild()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_email_outbox'),
+        ('jobs', '0013_alert_digest_delivery'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('submissions', models.PositiveIntegerField(default=0)),
+                ('interviews', models.PositiveIntegerField(default=0)),
+                ('rejections', models.PositiveIntegerField(default=0)),
+                ('employer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_stats', to='accounts.employerprofile')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['employer', 'day'], name='appstat_employer_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'day'), name='appstat_job_day_uniq')],
+            },
+            managers=[
+                ('objects', jobs.models.ApplicationDailyStatManager()),
+            ],
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
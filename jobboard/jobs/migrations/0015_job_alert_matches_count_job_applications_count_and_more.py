@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:49
+
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    # Existing jobs/employers start at 0; fill in what the write paths would have counted.
+    from jobs.counters import reconcile_counters
+
+    reconcile_counters(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_employerprofile_applications_count_and_more'),
+        ('jobs', '0014_application_daily_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='alert_matches_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='interview_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='rejected_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='saves_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='submitted_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
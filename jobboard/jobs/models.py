@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 import re
+from collections import Counter, defaultdict
+from functools import lru_cache
 
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
 from django.db import models
-from django.db.models import Q
+from django.db import connections, transaction
+from django.db.models import Count, DurationField, Exists, ExpressionWrapper, F, FloatField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Extract, Greatest, Now
+from django.utils import timezone
 
-from accounts.models import EmployerProfile, JobSeekerProfile
+from accounts.models import CounterFieldsMixin, EmployerProfile, JobSeekerProfile
+
+# Postgres text search configuration used for the maintained Job.search_vector.
+SEARCH_CONFIG = "english"
+# Age (in days) at which the recency factor halves a job's relevance score.
+RELEVANCE_RECENCY_DAYS = 30
 
 
 def _tokenize_csv(text: str | None) -> list[str]:
@@ -25,6 +38,126 @@ def _tokenize_csv(text: str | None) -> list[str]:
     return out
 
 
+_SKILL_STOPWORDS = {
+    "and",
+    "the",
+    "for",
+    "with",
+    "from",
+    "this",
+    "that",
+    "your",
+    "have",
+    "will",
+    "you",
+    "our",
+    "role",
+    "team",
+}
+
+
+def _extract_skill_tokens(*values):
+    out = []
+    seen = set()
+    for value in values:
+        if not value:
+            continue
+        for token in re.findall(r"[a-z0-9+#\.]+", str(value).lower()):
+            token = token.strip(".")
+            if not token or len(token) < 2:
+                continue
+            if token in _SKILL_STOPWORDS or token.isdigit():
+                continue
+            if token not in seen:
+                out.append(token)
+                seen.add(token)
+    return out
+
+
+def _split_alert_keywords(text: str | None) -> list[str]:
+    return [k.strip().lower() for k in (text or "").replace(";", ",").split(",") if k.strip()]
+
+
+def _text_contains_any(terms) -> Q:
+    """Any term as a substring of title/description/skills (the alert-matching haystack)."""
+    cond = Q()
+    for term in terms:
+        cond |= Q(title__icontains=term) | Q(description__icontains=term) | Q(required_skills__icontains=term)
+    return cond
+
+
+def _fulltext_enabled() -> bool:
+    return bool(getattr(settings, "JOB_SEARCH_FULLTEXT", True))
+
+
+def job_search_vector():
+    """Weighted tsvector over title/skills (A), company (B), location (C), description (D)."""
+    company = Subquery(
+        EmployerProfile.objects.filter(pk=OuterRef("employer_id")).values("company_name")[:1]
+    )
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("required_skills", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(company, weight="B", config=SEARCH_CONFIG)
+        + SearchVector("location", weight="C", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="D", config=SEARCH_CONFIG)
+    )
+
+
+def _legacy_token_condition(token: str) -> Q:
+    if len(token) <= 2:
+        return (
+            Q(title__icontains=token)
+            | Q(required_skills__icontains=token)
+            | Q(employer__company_name__icontains=token)
+        )
+    return (
+        Q(title__icontains=token)
+        | Q(description__icontains=token)
+        | Q(location__icontains=token)
+        | Q(required_skills__icontains=token)
+        | Q(employer__company_name__icontains=token)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _is_stopword(token: str) -> bool:
+    """True when SEARCH_CONFIG drops ``token`` entirely ("a", "the", "to")."""
+    with connections["default"].cursor() as cursor:
+        cursor.execute("SELECT numnode(plainto_tsquery(%s::regconfig, %s)) = 0", [SEARCH_CONFIG, token])
+        return cursor.fetchone()[0]
+
+
+def _fulltext_query(tokens: list[str]) -> SearchQuery | None:
+    """Build an AND-ed prefix tsquery; short tokens only match title/skills/company (weights A/B).
+
+    Returns None when every token is a stopword, since the tsquery would be
+    empty and match nothing.
+    """
+    terms = []
+    for token in tokens:
+        if _is_stopword(token.lower()):
+            continue
+        weights = "AB" if len(token) <= 2 else ""
+        terms.append(f"{token.lower()}:*{weights}")
+    if not terms:
+        return None
+    return SearchQuery(" & ".join(terms), config=SEARCH_CONFIG, search_type="raw")
+
+
+def _split_query(q: str | None) -> tuple[list[str], list[str]]:
+    """Split a keyword query into plain word tokens (full-text) and symbol tokens (c++, node.js)."""
+    words, symbols = [], []
+    for token in re.split(r"\s+", (q or "").strip()):
+        if not token:
+            continue
+        if re.fullmatch(r"\w+", token):
+            words.append(token)
+        else:
+            symbols.append(token)
+    return words, symbols
+
+
 class JobQuerySet(models.QuerySet):
     def recent(self):
         return self.order_by("-created_at")
@@ -32,6 +165,76 @@ class JobQuerySet(models.QuerySet):
     def for_employer(self, employer: EmployerProfile):
         return self.filter(employer=employer)
 
+    def update_search_vector(self) -> int:
+        return self.update(search_vector=job_search_vector())
+
+    def ranked(self, q: str | None):
+        """Order by ts_rank decayed by job age; falls back to newest-first."""
+        words, _symbols = _split_query(q)
+        query = _fulltext_query(words) if _fulltext_enabled() else None
+        if query is None:
+            return self.recent()
+        age_days = Extract(
+            ExpressionWrapper(Now() - F("created_at"), output_field=DurationField()),
+            "epoch",
+        ) / Value(86400.0)
+        return self.annotate(
+            relevance=ExpressionWrapper(
+                SearchRank(F("search_vector"), query)
+                / (Value(1.0) + age_days / Value(float(RELEVANCE_RECENCY_DAYS))),
+                output_field=FloatField(),
+            )
+        ).order_by("-relevance", "-created_at")
+
+    def facet_counts(
+        self,
+        *,
+        job_type: str | None = None,
+        experience_level: str | None = None,
+        cover_letter_required: bool | None = None,
+        city: str | None = None,
+        cities=(),
+    ) -> dict[str, dict]:
+        """Per-option counts for the job_list sidebar filters in a single aggregate query.
+
+        Each dimension is counted with every *other* selected filter applied, so an
+        option's count is the number of results the user would get by picking it.
+        """
+        selected = {
+            "job_type": Q(job_type=job_type) if job_type else None,
+            "experience_level": Q(experience_level=experience_level) if experience_level else None,
+            "cover_letter": (
+                Q(cover_letter_required=cover_letter_required) if cover_letter_required is not None else None
+            ),
+            "city": Q(location__icontains=city) if city else None,
+        }
+
+        def _count(dimension: str, option: Q | None):
+            cond = Q()
+            for name, q in selected.items():
+                if name != dimension and q is not None:
+                    cond &= q
+            if option is not None:
+                cond &= option
+            return Count("pk", filter=cond) if cond else Count("pk")
+
+        options = []
+        for value, _label in JobType.choices:
+            options.append(("job_type", value, _count("job_type", Q(job_type=value))))
+        for value, _label in ExperienceLevel.choices:
+            options.append(("experience_level", value, _count("experience_level", Q(experience_level=value))))
+        options.append(("cover_letter", "any", _count("cover_letter", None)))
+        options.append(("cover_letter", "required", _count("cover_letter", Q(cover_letter_required=True))))
+        options.append(("cover_letter", "not_required", _count("cover_letter", Q(cover_letter_required=False))))
+        for name in cities:
+            options.append(("city", name, _count("city", Q(location__icontains=name))))
+
+        row = self.aggregate(**{f"f{i}": agg for i, (_d, _v, agg) in enumerate(options)})
+        out = {"job_type": {}, "experience_level": {}, "cover_letter": {}, "city": {}}
+        for i, (dimension, value, _agg) in enumerate(options):
+            out[dimension][value] = row[f"f{i}"]
+        return out
+
     def search(
         self,
         q: str | None = None,
@@ -45,23 +248,19 @@ class JobQuerySet(models.QuerySet):
     ):
         qs = self
         if q:
-            tokens = [t for t in re.split(r"\s+", q.strip()) if t]
-            for token in tokens:
-                if len(token) <= 2:
-                    token_cond = (
-                        Q(title__icontains=token)
-                        | Q(required_skills__icontains=token)
-                        | Q(employer__company_name__icontains=token)
-                    )
+            if _fulltext_enabled():
+                words, symbols = _split_query(q)
+                query = _fulltext_query(words)
+                if query is not None:
+                    qs = qs.filter(search_vector=query)
                 else:
-                    token_cond = (
-                        Q(title__icontains=token)
-                        | Q(description__icontains=token)
-                        | Q(location__icontains=token)
-                        | Q(required_skills__icontains=token)
-                        | Q(employer__company_name__icontains=token)
-                    )
-                qs = qs.filter(token_cond)
+                    # only stopwords ("to the"): match them as plain substrings instead
+                    symbols = words + symbols
+            else:
+                words, symbols = [], [t for t in re.split(r"\s+", q.strip()) if t]
+            # Tokens like "c++" or "node.js" don't survive the tsvector parser intact.
+            for token in symbols:
+                qs = qs.filter(_legacy_token_condition(token))
 
         if min_salary is not None:
             qs = qs.filter(Q(max_salary__isnull=True) | Q(max_salary__gte=min_salary))
@@ -69,7 +268,18 @@ class JobQuerySet(models.QuerySet):
             qs = qs.filter(Q(min_salary__isnull=True) | Q(min_salary__lte=max_salary))
         if skills:
             tokens = _tokenize_csv(skills)
-            if tokens:
+            if tokens and _fulltext_enabled():
+                # Exact skill hit via the job<->skill index, or any word in the job text.
+                cond = Q(pk__in=JobSkill.objects.filter(skill__name__in=tokens).values("job_id"))
+                words = [t for t in tokens if re.fullmatch(r"\w+", t)]
+                if words:
+                    cond |= Q(
+                        search_vector=SearchQuery(
+                            " | ".join(f"{w}:*" for w in words), config=SEARCH_CONFIG, search_type="raw"
+                        )
+                    )
+                qs = qs.filter(cond)
+            elif tokens:
                 cond = Q()
                 for t in tokens:
                     cond |= (
@@ -89,6 +299,24 @@ class JobQuerySet(models.QuerySet):
             qs = qs.filter(cover_letter_required=cover_letter_required)
         return qs
 
+    def matching_alert(self, alert):
+        """Jobs satisfying ``alert``: the SQL form of jobs.alert_index.AlertCriteria.matches."""
+        qs = self.search(min_salary=alert.min_salary, max_salary=alert.max_salary)
+        if alert.location:
+            qs = qs.filter(location__icontains=alert.location)
+        keywords = _split_alert_keywords(alert.keywords)
+        if keywords:
+            qs = qs.filter(_text_contains_any(keywords))
+        need = _tokenize_csv(alert.skills)
+        if need:
+            # exact skill overlap, or a text match for jobs that list no skills
+            has_skills = Exists(JobSkill.objects.filter(job_id=OuterRef("pk")))
+            qs = qs.filter(
+                Q(pk__in=JobSkill.objects.filter(skill__name__in=need).values("job_id"))
+                | (Q(~has_skills) & _text_contains_any(need))
+            )
+        return qs
+
 
 class JobManager(models.Manager):
     def get_queryset(self):
@@ -100,6 +328,9 @@ class JobManager(models.Manager):
     def for_employer(self, employer: EmployerProfile):
         return self.get_queryset().for_employer(employer)
 
+    def matching_alert(self, alert):
+        return self.get_queryset().matching_alert(alert)
+
     def search(
         self,
         q: str | None = None,
@@ -123,6 +354,100 @@ class JobManager(models.Manager):
         )
 
 
+class SkillManager(models.Manager):
+    use_in_migrations = True
+
+    def ensure(self, names) -> dict[str, "Skill"]:
+        """Return canonical Skill rows for ``names``, creating the missing ones."""
+        names = {n for n in names if n and len(n) <= Skill.NAME_MAX_LENGTH}
+        if not names:
+            return {}
+        self.bulk_create([self.model(name=n) for n in names], ignore_conflicts=True)
+        return {skill.name: skill for skill in self.filter(name__in=names)}
+
+
+class Skill(models.Model):
+    """Canonical lowercase skill token (as produced by ``_tokenize_csv``)."""
+    NAME_MAX_LENGTH = 64
+
+    name = models.CharField(max_length=NAME_MAX_LENGTH, unique=True)
+
+    objects = SkillManager()
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class SkillPopularityManager(models.Manager):
+    # migration 0011 fills the table with ``rebuild()``
+    use_in_migrations = True
+
+    def rebuild(self, *, chunk_size: int = 2000) -> int:
+        """Recompute every row from job postings and seeker profiles; returns the number of tokens."""
+        registry = self.model._meta.apps  # the historical models when called from a migration
+        job_counts = Counter()
+        seeker_counts = Counter()
+        sources = (
+            (registry.get_model("jobs", "Job"), "required_skills", job_counts),
+            (registry.get_model("accounts", "JobSeekerProfile"), "skills", seeker_counts),
+        )
+        for model, field, counts in sources:
+            rows = model.objects.exclude(**{f"{field}__isnull": True}).exclude(**{field: ""})
+            for raw in rows.values_list(field, flat=True).iterator(chunk_size=chunk_size):
+                counts.update(_extract_skill_tokens(raw))
+
+        tokens = [t for t in set(job_counts) | set(seeker_counts) if len(t) <= Skill.NAME_MAX_LENGTH]
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            self.bulk_create(
+                [
+                    self.model(
+                        token=t,
+                        job_count=job_counts[t],
+                        seeker_count=seeker_counts[t],
+                        total=job_counts[t] + seeker_counts[t],
+                    )
+                    for t in tokens
+                ],
+                batch_size=chunk_size,
+            )
+        return len(tokens)
+
+    def adjust(self, field: str, added=(), removed=()) -> None:
+        """Apply a per-row token delta for ``field`` ("job_count" or "seeker_count")."""
+        added = {t for t in added if len(t) <= Skill.NAME_MAX_LENGTH}
+        removed = {t for t in removed if len(t) <= Skill.NAME_MAX_LENGTH}
+        if added:
+            self.bulk_create([self.model(token=t) for t in added], ignore_conflicts=True)
+            self.filter(token__in=added).update(**{field: F(field) + 1, "total": F("total") + 1})
+        if removed:
+            self.filter(token__in=removed).update(
+                **{field: Greatest(F(field) - 1, 0), "total": Greatest(F("total") - 1, 0)}
+            )
+
+
+class SkillPopularity(models.Model):
+    """How many job postings / seeker profiles mention a skill token (``_extract_skill_tokens``).
+
+    Maintained incrementally by jobs.signals; ``rebuild_skill_popularity`` recomputes it.
+    """
+    token = models.CharField(max_length=Skill.NAME_MAX_LENGTH, unique=True)
+    job_count = models.PositiveIntegerField(default=0)
+    seeker_count = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+
+    objects = SkillPopularityManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["-total", "token"], name="skillpop_total_token_idx")]
+
+    def __str__(self):
+        return f"{self.token} ({self.total})"
+
+
 class JobType(models.TextChoices):
     FULL_TIME = "full_time", "Full-time"
     PART_TIME = "part_time", "Part-time"
@@ -137,7 +462,22 @@ class ExperienceLevel(models.TextChoices):
     LEAD = "lead", "Lead"
 
 
-class Job(models.Model):
+class AlertDelivery(models.TextChoices):
+    INSTANT = "instant", "Instant"
+    HOURLY = "hourly", "Hourly digest"
+    DAILY = "daily", "Daily digest"
+
+
+class Job(CounterFieldsMixin, models.Model):
+    COUNTER_FIELDS = (
+        "applications_count",
+        "submitted_count",
+        "interview_count",
+        "rejected_count",
+        "saves_count",
+        "alert_matches_count",
+    )
+
     employer = models.ForeignKey(EmployerProfile, on_delete=models.CASCADE, related_name="jobs")
     title = models.CharField(max_length=255)
     description = models.TextField()
@@ -170,9 +510,35 @@ class Job(models.Model):
     )
 
     created_at = models.DateTimeField(auto_now_add=True)
+    # Maintained by jobs.signals (Job and EmployerProfile saves); see job_search_vector().
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Normalized copy of required_skills, synced by jobs.signals / rebuild_skill_index.
+    skills = models.ManyToManyField(Skill, through="JobSkill", related_name="jobs", blank=True)
+    # NULL until the deferred alert matcher (jobs.alert_batcher) has processed the job.
+    alerts_processed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Denormalized counters maintained by jobs.counters (reconcile_counters fixes drift).
+    applications_count = models.IntegerField(default=0, editable=False)
+    submitted_count = models.IntegerField(default=0, editable=False)
+    interview_count = models.IntegerField(default=0, editable=False)
+    rejected_count = models.IntegerField(default=0, editable=False)
+    saves_count = models.IntegerField(default=0, editable=False)
+    alert_matches_count = models.IntegerField(default=0, editable=False)
 
     objects = JobManager()
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="job_search_vector_gin"),
+            # keyset pagination order (jobs.pagination)
+            models.Index(fields=["-created_at", "-id"], name="job_created_id_idx"),
+            models.Index(
+                fields=["id"],
+                condition=models.Q(alerts_processed_at__isnull=True),
+                name="job_alerts_pending_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -180,6 +546,63 @@ class Job(models.Model):
         return _tokenize_csv(self.required_skills)
 
 
+class JobSkillManager(models.Manager):
+    # migration 0009 backfills the index with ``rebuild()``
+    use_in_migrations = True
+
+    def sync(self, jobs) -> int:
+        """Make the job<->skill rows match each job's required_skills. Returns rows inserted."""
+        wanted = {job.pk: set(_tokenize_csv(job.required_skills)) for job in jobs}
+        if not wanted:
+            return 0
+        skills = self.model._meta.get_field("skill").related_model.objects.ensure(set().union(*wanted.values()))
+
+        existing = defaultdict(set)
+        for job_id, skill_id in self.filter(job_id__in=wanted).values_list("job_id", "skill_id"):
+            existing[job_id].add(skill_id)
+
+        stale = Q()
+        rows = []
+        for job_id, names in wanted.items():
+            skill_ids = {skills[n].pk for n in names if n in skills}
+            removed = existing[job_id] - skill_ids
+            if removed:
+                stale |= Q(job_id=job_id, skill_id__in=removed)
+            rows.extend(self.model(job_id=job_id, skill_id=sid) for sid in skill_ids - existing[job_id])
+        if stale:
+            self.filter(stale).delete()
+        self.bulk_create(rows, ignore_conflicts=True)
+        return len(rows)
+
+    def rebuild(self, *, batch_size: int = 1000) -> tuple[int, int]:
+        """``sync`` every job in id batches; returns (jobs seen, rows inserted)."""
+        job_model = self.model._meta.get_field("job").related_model
+        jobs_seen = rows_added = last_id = 0
+        while True:
+            batch = list(job_model.objects.filter(id__gt=last_id).order_by("id").only("id", "required_skills")[:batch_size])
+            if not batch:
+                return jobs_seen, rows_added
+            with transaction.atomic(using=self.db):
+                rows_added += self.sync(batch)
+            jobs_seen += len(batch)
+            last_id = batch[-1].id
+
+
+class JobSkill(models.Model):
+    """Inverted index row: which jobs require which canonical skill."""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="job_skills")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="job_links")
+
+    objects = JobSkillManager()
+
+    class Meta:
+        unique_together = [("job", "skill")]
+        indexes = [models.Index(fields=["skill", "job"], name="jobskill_skill_job_idx")]
+
+    def __str__(self):
+        return f"{self.job_id}: {self.skill_id}"
+
+
 class JobApplicationQuerySet(models.QuerySet):
     def submitted(self):
         return self.filter(status="submitted")
@@ -196,6 +619,28 @@ class JobApplicationQuerySet(models.QuerySet):
     def for_jobseeker(self, jobseeker: JobSeekerProfile):
         return self.filter(jobseeker=jobseeker)
 
+    def status_summary(self, *, by_job: bool = False) -> dict:
+        """Application counts per status plus ``"all"``, from one aggregate query.
+
+        With ``by_job=True`` the query is grouped by job instead; the totals are
+        summed from those rows and the per-job counts are returned under
+        ``"by_job"`` (job id -> the same dict).
+        """
+        statuses = [value for value, _label in self.model.STATUS_CHOICES]
+        counts = {"all": Count("id")}
+        counts.update({status: Count("id", filter=Q(status=status)) for status in statuses})
+        qs = self.order_by()
+        if not by_job:
+            return qs.aggregate(**counts)
+        summary = dict.fromkeys(counts, 0)
+        summary["by_job"] = {}
+        for row in qs.values("job_id").annotate(**counts):
+            job_id = row.pop("job_id")
+            summary["by_job"][job_id] = row
+            for name, value in row.items():
+                summary[name] += value
+        return summary
+
 
 class JobApplicationManager(models.Manager):
     def get_queryset(self):
@@ -216,6 +661,9 @@ class JobApplicationManager(models.Manager):
     def for_jobseeker(self, jobseeker: JobSeekerProfile):
         return self.get_queryset().for_jobseeker(jobseeker)
 
+    def status_summary(self, *, by_job: bool = False) -> dict:
+        return self.get_queryset().status_summary(by_job=by_job)
+
 
 class JobApplication(models.Model):
     STATUS_CHOICES = [
@@ -237,6 +685,13 @@ class JobApplication(models.Model):
 
     objects = JobApplicationManager()
 
+    class Meta:
+        indexes = [
+            # keyset pagination order for per-seeker / per-job listings (jobs.pagination)
+            models.Index(fields=["jobseeker", "-submitted_at", "-id"], name="app_seeker_submitted_idx"),
+            models.Index(fields=["job", "-submitted_at", "-id"], name="app_job_submitted_idx"),
+        ]
+
     def __str__(self):
         return f"{self.jobseeker.user.username} → {self.job.title}"
 
@@ -255,6 +710,94 @@ class JobApplicationEvent(models.Model):
         return f"{self.application_id}: {self.status}"
 
 
+ROLLUP_COUNTERS = {"submitted": "submissions", "interview": "interviews", "rejected": "rejections"}
+
+
+class ApplicationDailyStatManager(models.Manager):
+    # migration 0014 backfills the rollup with ``rebuild()``
+    use_in_migrations = True
+
+    def _table(self):
+        connection = connections[self.db]
+        return connection, connection.ops.quote_name
+
+    def bump(self, job, day, status: str, count: int = 1) -> None:
+        """Add ``count`` to the job's counter for ``status`` on ``day`` (one UPSERT)."""
+        column = ROLLUP_COUNTERS.get(status)
+        if column is None:
+            return
+        deltas = {name: (count if name == column else 0) for name in ROLLUP_COUNTERS.values()}
+        connection, qn = self._table()
+        table = qn(self.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (employer_id, job_id, day, submissions, interviews, rejections) "
+                "VALUES (%s, %s, %s, %s, %s, %s) "
+                f"ON CONFLICT (job_id, day) DO UPDATE SET "
+                f"submissions = {table}.submissions + EXCLUDED.submissions, "
+                f"interviews = {table}.interviews + EXCLUDED.interviews, "
+                f"rejections = {table}.rejections + EXCLUDED.rejections",
+                [job.employer_id, job.pk, day, deltas["submissions"], deltas["interviews"], deltas["rejections"]],
+            )
+
+    def rebuild(self, employer_ids=None) -> int:
+        """Recompute the rollup from applications and their timeline events; returns rows written.
+
+        Submissions are counted on ``submitted_at``'s day, interviews and
+        rejections on the day their event was recorded (as ``bump`` does).
+        """
+        connection, qn = self._table()
+        registry = self.model._meta.apps  # the historical models when called from a migration
+        table = qn(self.model._meta.db_table)
+        apps = qn(registry.get_model("jobs", "JobApplication")._meta.db_table)
+        events = qn(registry.get_model("jobs", "JobApplicationEvent")._meta.db_table)
+        jobs = qn(registry.get_model("jobs", "Job")._meta.db_table)
+        tz = timezone.get_current_timezone_name()
+        employer_filter, params = "", []
+        if employer_ids is not None:
+            employer_filter = "WHERE j.employer_id = ANY(%s)"
+            params = [list(employer_ids)]
+        with transaction.atomic(using=self.db), connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table}" + (" WHERE employer_id = ANY(%s)" if params else ""),
+                params,
+            )
+            cursor.execute(
+                f"INSERT INTO {table} (employer_id, job_id, day, submissions, interviews, rejections) "
+                "SELECT j.employer_id, x.job_id, x.day, SUM(x.s), SUM(x.i), SUM(x.r) FROM ("
+                f"  SELECT a.job_id, (a.submitted_at AT TIME ZONE %s)::date AS day, 1 AS s, 0 AS i, 0 AS r FROM {apps} a"
+                "  UNION ALL"
+                f"  SELECT a.job_id, (e.created_at AT TIME ZONE %s)::date, 0,"
+                "    (e.status = 'interview')::int, (e.status = 'rejected')::int"
+                f"  FROM {events} e JOIN {apps} a ON a.id = e.application_id"
+                "  WHERE e.status IN ('interview', 'rejected')"
+                f") x JOIN {jobs} j ON j.id = x.job_id {employer_filter} "
+                "GROUP BY j.employer_id, x.job_id, x.day",
+                [tz, tz, *params],
+            )
+            return cursor.rowcount
+
+
+class ApplicationDailyStat(models.Model):
+    """Per job and day application counters behind the employer dashboard chart."""
+
+    employer = models.ForeignKey(EmployerProfile, on_delete=models.CASCADE, related_name="application_stats")
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="daily_stats")
+    day = models.DateField()
+    submissions = models.PositiveIntegerField(default=0)
+    interviews = models.PositiveIntegerField(default=0)
+    rejections = models.PositiveIntegerField(default=0)
+
+    objects = ApplicationDailyStatManager()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["job", "day"], name="appstat_job_day_uniq")]
+        indexes = [models.Index(fields=["employer", "day"], name="appstat_employer_day_idx")]
+
+    def __str__(self):
+        return f"Stats({self.job_id} @ {self.day})"
+
+
 class SavedJob(models.Model):
     """Job bookmarks for job seekers."""
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="saved_by")
@@ -278,6 +821,12 @@ class JobAlert(models.Model):
     skills = models.CharField(max_length=255, blank=True, null=True, help_text="Comma separated skills.")
     location = models.CharField(max_length=255, blank=True, null=True)
     is_enabled = models.BooleanField(default=True)
+    delivery = models.CharField(
+        max_length=10,
+        choices=AlertDelivery.choices,
+        default=AlertDelivery.INSTANT,
+        help_text="Notify on every match, or in one hourly/daily digest.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -287,16 +836,67 @@ class JobAlert(models.Model):
         return f"Alert({self.jobseeker.user.username})"
 
 
+class JobAlertMatchManager(models.Manager):
+    def insert_pairs(self, rows) -> set[tuple[int, int]]:
+        """INSERT ``(alert_id, job_id, notified_at)`` rows in one statement.
+
+        Rows that already exist (including ones a concurrent writer just
+        inserted) are skipped; returns the ``(alert_id, job_id)`` pairs this
+        call actually created.
+        """
+        rows = list(rows)
+        if not rows:
+            return set()
+        alert_ids, job_ids, notified = (list(column) for column in zip(*rows))
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(self.model._meta.db_table)} (alert_id, job_id, created_at, notified_at, is_seen) "
+                "SELECT new.alert_id, new.job_id, %s, new.notified_at, false "
+                "FROM unnest(%s::bigint[], %s::bigint[], %s::timestamptz[]) AS new (alert_id, job_id, notified_at) "
+                "ON CONFLICT (alert_id, job_id) DO NOTHING RETURNING alert_id, job_id",
+                [timezone.now(), alert_ids, job_ids, notified],
+            )
+            return {(row[0], row[1]) for row in cursor.fetchall()}
+
+    def insert_for_alert(self, alert, job_ids) -> list[int]:
+        """INSERT ... SELECT a match row for every id in ``job_ids`` (a ``values("pk")`` queryset).
+
+        Existing matches are left alone; returns the ids of the newly matched jobs.
+        Rows are stored as notified: backfills are announced with one summary.
+        """
+        job_sql, params = job_ids.query.sql_with_params()
+        now = timezone.now()
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(self.model._meta.db_table)} (alert_id, job_id, created_at, notified_at, is_seen) "
+                f"SELECT %s, matched.job_id, %s, %s, false FROM ({job_sql}) AS matched (job_id) "
+                "ON CONFLICT (alert_id, job_id) DO NOTHING RETURNING job_id",
+                [alert.pk, now, now, *params],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
 class JobAlertMatch(models.Model):
     """A matched job for an alert (in-app notification)."""
     alert = models.ForeignKey(JobAlert, on_delete=models.CASCADE, related_name="matches")
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="alert_matches")
     created_at = models.DateTimeField(auto_now_add=True)
+    # NULL while the match waits for its alert's hourly/daily digest.
+    notified_at = models.DateTimeField(blank=True, null=True)
     is_seen = models.BooleanField(default=False)
 
+    objects = JobAlertMatchManager()
+
     class Meta:
         unique_together = [("alert", "job")]
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["alert"], condition=Q(notified_at__isnull=True), name="alertmatch_unsent_idx"),
+        ]
 
     def __str__(self):
         return f"Match({self.alert_id} -> {self.job_id})"
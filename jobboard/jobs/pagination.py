@@ -0,0 +1,263 @@
+"""Keyset (cursor) pagination for newest-first listings.
+
+Django's ``Paginator`` issues a ``COUNT(*)`` and an ``OFFSET`` that both get
+slower as a table grows. Here a page is fetched with
+``WHERE (key, id) < (last_key, last_id) ORDER BY key DESC, id DESC LIMIT n+1``,
+so every page costs the same index range scan regardless of depth.
+
+Listings that still need numbered pages use ``EstimatedPaginator``: it asks
+the planner for a row estimate first and only runs the exact ``COUNT(*)``
+when that estimate is below ESTIMATED_COUNT_THRESHOLD; above it the pages
+show "about N results".
+
+Cursors are signed, so clients cannot forge arbitrary filter values; an
+invalid or stale cursor simply yields the first page.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+
+from django.conf import settings
+from django.core import signing
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+
+_CURSOR_SALT = "jobs.pagination.cursor"
+
+
+@dataclass
+class CursorPage:
+    object_list: list = field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.prev_cursor is not None
+
+    @property
+    def has_other_pages(self) -> bool:
+        return self.has_next or self.has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def _encode(obj, key: str, direction: str) -> str:
+    value = getattr(obj, key)
+    return signing.dumps(
+        {"k": value.isoformat(), "id": obj.pk, "d": direction},
+        salt=_CURSOR_SALT,
+        compress=True,
+    )
+
+
+def _decode(cursor: str | None):
+    if not cursor:
+        return None
+    try:
+        data = signing.loads(cursor, salt=_CURSOR_SALT)
+        return datetime.fromisoformat(data["k"]), int(data["id"]), data["d"]
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        return None
+
+
+def keyset_paginate(queryset, cursor: str | None, *, per_page: int = 10, key: str = "created_at") -> CursorPage:
+    """Return one page of ``queryset`` ordered by ``(-key, -id)``."""
+    state = _decode(cursor)
+
+    if state and state[2] == "prev":
+        value, pk, _ = state
+        after = Q(**{f"{key}__gt": value}) | Q(**{key: value, "pk__gt": pk})
+        rows = list(queryset.filter(after).order_by(key, "pk")[: per_page + 1])
+        has_prev = len(rows) > per_page
+        rows = list(reversed(rows[:per_page]))
+        if rows:
+            return CursorPage(
+                object_list=rows,
+                next_cursor=_encode(rows[-1], key, "next"),
+                prev_cursor=_encode(rows[0], key, "prev") if has_prev else None,
+            )
+        state = None
+
+    ordered = queryset.order_by(f"-{key}", "-pk")
+    if state:
+        value, pk, _ = state
+        ordered = ordered.filter(Q(**{f"{key}__lt": value}) | Q(**{key: value, "pk__lt": pk}))
+    rows = list(ordered[: per_page + 1])
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    return CursorPage(
+        object_list=rows,
+        next_cursor=_encode(rows[-1], key, "next") if has_next and rows else None,
+        prev_cursor=_encode(rows[0], key, "prev") if state and rows else None,
+    )
+
+
+def keyset_paginate_ids(
+    ids: list,
+    cursor: str | None,
+    hydrate,
+    *,
+    complete: bool = True,
+    per_page: int = 10,
+    key: str = "created_at",
+    queryset=None,
+) -> CursorPage | None:
+    """``keyset_paginate`` over an already ordered list of primary keys.
+
+    ``hydrate(page_ids)`` must return the objects in the given order. Returns
+    None when the cursor is not in the list (or points past the end of an
+    incomplete list) so the caller can fall back to ``keyset_paginate``.
+    When a page reaches the end of an incomplete list, the rest of it is read
+    from ``queryset`` (the query the ids came from), continuing after the
+    last cached row.
+    """
+    state = _decode(cursor)
+    start = 0
+    if state:
+        _value, pk, direction = state
+        try:
+            pos = ids.index(pk)
+        except ValueError:
+            return None
+        start = pos + 1 if direction == "next" else max(0, pos - per_page)
+
+    if not complete and start >= len(ids):
+        return None
+    end = start + per_page
+    rows = hydrate(ids[start:end])
+    has_next = end < len(ids) or not complete
+    if rows and len(rows) < per_page and not complete and end >= len(ids) and queryset is not None:
+        rest = keyset_paginate(queryset, _encode(rows[-1], key, "next"), per_page=per_page - len(rows), key=key)
+        rows = list(rows) + rest.object_list
+        has_next = rest.has_next
+    if not rows:
+        return CursorPage()
+    return CursorPage(
+        object_list=rows,
+        next_cursor=_encode(rows[-1], key, "next") if has_next else None,
+        prev_cursor=_encode(rows[0], key, "prev") if start > 0 else None,
+    )
+
+
+# -----------------------------
+# Estimated counts
+# -----------------------------
+def estimated_count(queryset) -> int | None:
+    """Planner estimate of ``queryset.count()``, or None when there is none.
+
+    An unfiltered table reads ``pg_class.reltuples`` (kept by autovacuum/ANALYZE;
+    -1 until the table was first analyzed); anything else uses the row estimate
+    of ``EXPLAIN``.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.is_sliced and not query.combinator:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+            return row[0] if row and row[0] >= 0 else None
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_or_estimate(queryset) -> tuple[int, bool]:
+    """``(count, estimated)``: the planner estimate when it reaches the threshold, else an exact count."""
+    estimate = estimated_count(queryset)
+    if estimate is not None and estimate >= int(getattr(settings, "ESTIMATED_COUNT_THRESHOLD", 50_000)):
+        return estimate, True
+    return queryset.count(), False
+
+
+class EstimatedPage(Page):
+    has_more = False
+
+    def has_next(self):
+        if self.paginator.estimated:
+            return self.has_more
+        return super().has_next()
+
+    def next_page_number(self):
+        if self.paginator.estimated:
+            return self.number + 1
+        return super().next_page_number()
+
+
+class EstimatedPaginator(Paginator):
+    """``Paginator`` whose ``count`` may be a planner estimate (``estimated`` is then True).
+
+    Estimated page counts can be off in either direction, so in that mode
+    ``has_next`` is decided by fetching one row past the page instead, and
+    pages past the estimated last page stay reachable; only a page that comes
+    back empty is out of range.
+    """
+
+    estimated = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, "query"):
+            return super().count
+        count, self.estimated = count_or_estimate(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        self.count  # settles ``estimated``
+        if not self.estimated:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.estimated:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        if bottom + len(rows) > self.count:
+            # the estimate was low; never report fewer pages than this one proves exist
+            self.count = bottom + len(rows)
+            self.__dict__.pop("num_pages", None)
+        page = self._get_page(rows[: self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def get_page(self, number):
+        try:
+            return super().get_page(number)
+        except EmptyPage:
+            # past the real end of an estimated listing; only now is the exact count worth it
+            return self.page(max(1, math.ceil(self.object_list.count() / self.per_page)))
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedPage(*args, **kwargs)
@@ -0,0 +1,286 @@
+"""Vectorized job recommendations over the whole catalogue.
+
+``RecommendationIndex`` keeps job×term matrices in CSR form (NumPy
+``indptr``/``indices``/``data`` arrays, the layout scipy.sparse uses), so a
+seeker is scored against every job with one gather + ``bincount`` instead of a
+Python loop, and the best k are picked with ``argpartition``.
+
+Two scoring profiles are available:
+
+- ``"tfidf"``: cosine similarity between the seeker's skills/education and
+  TF-IDF weighted job text.
+- ``"overlap"``: the original weights and matching rules; 12 per exact
+  required-skill match, 4 per other skill found as a substring of the posting
+  text, 2 per education term found as a substring. Substring hits are found
+  by scanning the vocabulary once per seeker term and following the matching
+  terms' posting lists (the matrix transposed), not by testing every job.
+
+The index is built once per process (inline, on first use) and rebuilt when
+the job search cache version changes (any Job write), at most every
+JOB_RECOMMENDATION_REFRESH_SECONDS. Rebuilds run in a background thread and
+are swapped in when done; requests keep using the previous matrix meanwhile.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+from django.conf import settings
+from django.db import connections
+
+from .models import Job, _tokenize_csv
+from .search_cache import search_cache_version
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("tfidf", "overlap")
+
+EXACT_WEIGHT = 12
+TEXT_WEIGHT = 4
+EDUCATION_WEIGHT = 2
+# Education terms count for less than skills in the tf-idf query vector too.
+TFIDF_EDUCATION_WEIGHT = 0.5
+
+_TERM_RE = re.compile(r"[a-z0-9+#\.]+")
+
+
+def term_counts(*values) -> Counter:
+    """Lowercase term frequencies for profile, resume and job text."""
+    counts = Counter()
+    for value in values:
+        if not value:
+            continue
+        for token in _TERM_RE.findall(str(value).lower()):
+            token = token.strip(".")
+            if token and len(token) >= 2:
+                counts[token] += 1
+    return counts
+
+
+def tokenize_reco_text(*values) -> set[str]:
+    return set(term_counts(*values))
+
+
+class _CSRMatrix:
+    def __init__(self, rows: list, n_cols: int, dtype=np.float32):
+        """``rows``: one list of column ids per row, or of (column id, value) pairs."""
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        self.n_rows = len(rows)
+        self.n_cols = n_cols
+        self.indptr = np.concatenate(([0], np.cumsum(lengths)))
+        self.row_ids = np.repeat(np.arange(self.n_rows, dtype=np.int32), lengths)
+        flat = [cell for row in rows for cell in row]
+        if flat and isinstance(flat[0], tuple):
+            self.indices = np.fromiter((col for col, _v in flat), dtype=np.int32, count=len(flat))
+            self.data = np.fromiter((v for _c, v in flat), dtype=dtype, count=len(flat))
+        else:
+            self.indices = np.asarray(flat, dtype=np.int32)
+            self.data = np.ones(len(flat), dtype=dtype)
+
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """Matrix × dense vector -> one score per row."""
+        if not len(self.indices):
+            return np.zeros(self.n_rows, dtype=np.float64)
+        return np.bincount(self.row_ids, weights=self.data * vector[self.indices], minlength=self.n_rows)
+
+    def row(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def rows_with(self, cols) -> np.ndarray:
+        """Rows having any of ``cols``; needs the column posting lists from ``transpose_index``."""
+        hits = [self.row_ids[self._by_col[self._col_ptr[c] : self._col_ptr[c + 1]]] for c in cols]
+        return np.unique(np.concatenate(hits)) if hits else np.empty(0, dtype=np.int32)
+
+    def transpose_index(self) -> None:
+        """Build per-column posting lists (CSC order) for ``rows_with``."""
+        self._by_col = np.argsort(self.indices, kind="stable")
+        self._col_ptr = np.concatenate(([0], np.cumsum(np.bincount(self.indices, minlength=self.n_cols))))
+
+
+@dataclass
+class Recommendation:
+    job_id: int
+    score: float
+    overlap: int
+    overlap_terms: list = field(default_factory=list)
+
+
+class RecommendationIndex:
+    def __init__(self, rows):
+        """``rows``: iterable of (id, created_at, title, description, required_skills, location)."""
+        vocab: dict[str, int] = {}
+
+        def term_id(term):
+            return vocab.setdefault(term, len(vocab))
+
+        ids, created = [], []
+        skill_rows, word_rows, tf_rows = [], [], []
+        for job_id, created_at, title, description, required_skills, location in rows:
+            skills = set(_tokenize_csv(required_skills))
+            counts = term_counts(title, description, required_skills, location)
+            ids.append(job_id)
+            created.append(created_at.timestamp() if created_at else 0.0)
+            skill_rows.append([term_id(t) for t in skills])
+            word_rows.append([term_id(t) for t in counts])
+            for t in skills:
+                counts[t] += 1
+            tf_rows.append([(term_id(t), n) for t, n in counts.items()])
+
+        n_terms = len(vocab)
+        self.vocab = vocab
+        self.terms = np.array(sorted(vocab, key=vocab.get), dtype=object)
+        self.job_ids = np.array(ids, dtype=np.int64)
+        self.created = np.array(created, dtype=np.float64)
+        self.skills = _CSRMatrix(skill_rows, n_terms)
+        self.words = _CSRMatrix(word_rows, n_terms)
+        self.skills.transpose_index()
+        self.words.transpose_index()
+        # every term on its own line, so a substring search never spans two terms
+        self._vocab_text = "\n".join(self.terms)
+        self._term_starts = np.cumsum([0] + [len(t) + 1 for t in self.terms[:-1]]) if n_terms else np.zeros(0)
+
+        tf = _CSRMatrix(tf_rows, n_terms)
+        df = np.bincount(tf.indices, minlength=n_terms)
+        self.idf = np.log((1 + len(ids)) / (1 + df)) + 1.0
+        tf.data = (1.0 + np.log(tf.data)) * self.idf[tf.indices]
+        norms = np.sqrt(np.bincount(tf.row_ids, weights=tf.data**2, minlength=tf.n_rows))
+        norms[norms == 0] = 1.0
+        tf.data = (tf.data / norms[tf.row_ids]).astype(np.float32)
+        self.tfidf = tf
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def _indicator(self, terms, *, min_length: int = 0, weight: float = 1.0) -> np.ndarray:
+        vector = np.zeros(len(self.vocab), dtype=np.float32)
+        cols = [self.vocab[t] for t in terms if len(t) >= min_length and t in self.vocab]
+        vector[cols] = weight
+        return vector
+
+    def _terms_containing(self, token: str) -> np.ndarray:
+        starts = [m.start() for m in re.finditer(re.escape(token), self._vocab_text)]
+        return np.unique(np.searchsorted(self._term_starts, starts, side="right") - 1)
+
+    def _substring_hits(self, tokens, *, min_length: int, exclude_exact: bool = False) -> np.ndarray:
+        """Per job, how many of ``tokens`` occur as a substring of its text (the legacy ``token in hay``)."""
+        counts = np.zeros(len(self), dtype=np.float64)
+        for token in tokens:
+            if len(token) < min_length:
+                continue
+            rows = self.words.rows_with(self._terms_containing(token))
+            if exclude_exact and token in self.vocab:
+                # jobs requiring the token already scored it as an exact match
+                rows = np.setdiff1d(rows, self.skills.rows_with([self.vocab[token]]), assume_unique=True)
+            counts[rows] += 1
+        return counts
+
+    def score(self, skills: set, education: set, *, profile: str = "tfidf"):
+        """Return (scores, exact skill overlap counts) for every job."""
+        exact = self.skills.dot(self._indicator(skills))
+        if profile == "overlap":
+            text = self._substring_hits(skills, min_length=3, exclude_exact=True)
+            edu = self._substring_hits(education, min_length=4)
+            return EXACT_WEIGHT * exact + TEXT_WEIGHT * text + EDUCATION_WEIGHT * edu, exact
+        if profile != "tfidf":
+            raise ValueError(f"Unknown recommendation profile: {profile}")
+
+        query = np.maximum(
+            self._indicator(skills),
+            self._indicator(education, weight=TFIDF_EDUCATION_WEIGHT),
+        ) * self.idf
+        norm = np.linalg.norm(query)
+        if not norm:
+            return np.zeros(len(self)), exact
+        return self.tfidf.dot(query / norm), exact
+
+    def recommend(self, skills: set, education: set, *, profile: str = "tfidf", k: int = 30) -> list[Recommendation]:
+        if not len(self):
+            return []
+        scores, exact = self.score(skills, education, profile=profile)
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # lexsort: last key is primary
+        order = candidates[np.lexsort((-self.created[candidates], -exact[candidates], -scores[candidates]))]
+
+        out = []
+        for i in order:
+            job_skills = set(self.terms[self.skills.row(i)])
+            job_terms = self.terms[self.words.row(i)]
+            exact_terms = sorted(skills & job_skills)
+            text_hits = sorted(
+                t for t in skills - job_skills if len(t) >= 3 and any(t in term for term in job_terms)
+            )
+            score = float(scores[i])
+            out.append(
+                Recommendation(
+                    job_id=int(self.job_ids[i]),
+                    score=int(score) if profile == "overlap" else round(score * 100),
+                    overlap=int(exact[i]),
+                    overlap_terms=exact_terms + text_hits,
+                )
+            )
+        return out
+
+
+def _load_rows():
+    return (
+        Job.objects.order_by()
+        .values_list("id", "created_at", "title", "description", "required_skills", "location")
+        .iterator(chunk_size=2000)
+    )
+
+
+_lock = threading.Lock()
+_state = {"index": None, "version": None, "built_at": 0.0}
+
+
+def _rebuild(version) -> RecommendationIndex:
+    index = RecommendationIndex(_load_rows())
+    _state.update(index=index, version=version, built_at=time.monotonic())
+    return index
+
+
+def _rebuild_in_background(version) -> None:
+    try:
+        _rebuild(version)
+    except Exception:
+        logger.exception("Recommendation index rebuild failed")
+    finally:
+        _lock.release()
+        connections.close_all()
+
+
+def get_recommendation_index() -> RecommendationIndex:
+    index = _state["index"]
+    version = search_cache_version()
+    if index is not None and _state["version"] == version:
+        return index
+    interval = float(getattr(settings, "JOB_RECOMMENDATION_REFRESH_SECONDS", 30))
+    if index is not None and time.monotonic() - _state["built_at"] < interval:
+        return index
+    # Only a cold process builds inline; otherwise one background thread rebuilds
+    # while every request keeps using the previous matrix.
+    background = index is not None and getattr(settings, "JOB_RECOMMENDATION_BACKGROUND_REFRESH", True)
+    if not _lock.acquire(blocking=not background):
+        return index
+    if background:
+        threading.Thread(target=_rebuild_in_background, args=(version,), name="recommendation-index", daemon=True).start()
+        return index
+    try:
+        if _state["index"] is not None and _state["version"] == version:
+            return _state["index"]  # built while we waited for the lock
+        return _rebuild(version)
+    finally:
+        _lock.release()
+
+
+def recommend_jobs(skills: set, education: set, *, profile: str | None = None, k: int = 30) -> list[Recommendation]:
+    profile = profile or getattr(settings, "JOB_RECOMMENDATION_PROFILE", "tfidf")
+    return get_recommendation_index().recommend(skills, education, profile=profile, k=k)
@@ -0,0 +1,66 @@
+"""Cache of ordered job-ID lists for repeated job_list searches.
+
+Entries are keyed by the normalized search parameters plus a global version
+number. Any Job create/update/delete (and employer renames, since company
+names are searchable) bumps the version via jobs.signals, which orphans every
+cached entry at once so new postings show up on the next request.
+
+The version lives in the shared cache (settings.CACHES), so a bump in one
+worker is seen by all of them. If the key is evicted or the cache flushed, it
+is re-seeded from the clock rather than from 1, so it never goes back to a
+value some worker's in-memory index was already built for.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+_VERSION_KEY = "jobs:search:version"
+
+
+def _seed() -> int:
+    return time.time_ns() // 1000
+
+
+def search_cache_version() -> int:
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        seed = _seed()
+        cache.add(_VERSION_KEY, seed, timeout=None)
+        version = cache.get(_VERSION_KEY, seed)
+    return version
+
+
+def bump_search_cache_version() -> None:
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.add(_VERSION_KEY, _seed(), timeout=None)
+
+
+def search_cache_key(prefix: str, params: dict) -> str:
+    raw = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+    return f"jobs:{prefix}:v{search_cache_version()}:{digest}"
+
+
+def cached_search_ids(params: dict, queryset) -> dict:
+    """Return ``{"ids": [...], "complete": bool}`` for an ordered search queryset.
+
+    Only the first JOB_SEARCH_CACHE_MAX_IDS ids are kept; ``complete`` is False
+    when the result set is larger, so callers can fall back to the database for
+    pages past the cached window.
+    """
+    key = search_cache_key("search", params)
+    entry = cache.get(key)
+    if entry is None:
+        limit = int(getattr(settings, "JOB_SEARCH_CACHE_MAX_IDS", 1000))
+        ids = list(queryset.values_list("id", flat=True)[: limit + 1])
+        entry = {"ids": ids[:limit], "complete": len(ids) <= limit}
+        cache.set(key, entry, timeout=int(getattr(settings, "JOB_SEARCH_CACHE_SECONDS", 300)))
+    return entry
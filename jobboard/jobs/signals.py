@@ -0,0 +1,190 @@
+"""Model signal handlers for the jobs app.
+
+Keeps denormalized/search data in sync with the rows it is derived from.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.models import EmployerProfile, JobSeekerProfile
+
+from . import counters
+from .alert_index import invalidate_alert_index
+from .application_stats import invalidate_application_summaries
+from .autocomplete import invalidate_autocomplete
+from .models import AlertDelivery, Job, JobAlert, JobApplication, JobSkill, SkillPopularity, _extract_skill_tokens
+from .search_cache import bump_search_cache_version
+from .utils import flush_pending_alert_matches
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_search_vector(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and set(update_fields) <= {"search_vector"}:
+        return
+    Job.objects.filter(pk=instance.pk).update_search_vector()
+
+
+@receiver(post_save, sender=Job)
+def sync_job_skills(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and "required_skills" not in update_fields:
+        return
+    JobSkill.objects.sync([instance])
+
+
+@receiver(post_save, sender=EmployerProfile)
+def refresh_employer_jobs_search_vector(sender, instance, raw=False, update_fields=None, **kwargs):
+    # company_name is part of every job's vector
+    if raw or kwargs.get("created"):
+        return
+    if update_fields is not None and "company_name" not in update_fields:
+        return
+    Job.objects.filter(employer=instance).update_search_vector()
+    bump_search_cache_version()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_search_cache(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_search_cache_version()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=EmployerProfile)
+@receiver(post_delete, sender=EmployerProfile)
+def invalidate_job_autocomplete(sender, instance, raw=False, **kwargs):
+    # titles, company names and skill popularity all feed the suggestion indexes
+    if not raw:
+        invalidate_autocomplete()
+
+
+@receiver(post_save, sender=JobAlert)
+@receiver(post_delete, sender=JobAlert)
+def invalidate_job_alert_index(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_alert_index()
+
+
+@receiver(pre_save, sender=JobAlert)
+def remember_alert_delivery(sender, instance, raw=False, **kwargs):
+    if raw or not instance.pk:
+        return
+    instance._delivery_before = (
+        JobAlert.objects.filter(pk=instance.pk).values_list("delivery", "is_enabled").first()
+    )
+
+
+@receiver(post_save, sender=JobAlert)
+def flush_digest_matches_on_delivery_change(sender, instance, raw=False, **kwargs):
+    # digest runs only pick up enabled alerts with that delivery, so anything
+    # pending would otherwise never be sent
+    before = getattr(instance, "_delivery_before", None)
+    instance._delivery_before = None
+    if raw or before is None:
+        return
+    delivery, was_enabled = before
+    if delivery == AlertDelivery.INSTANT or not was_enabled:
+        return
+    if instance.delivery == AlertDelivery.INSTANT or not instance.is_enabled:
+        flush_pending_alert_matches(instance, delivery)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_application_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    try:
+        employer_id = instance.job.employer_id
+    except Job.DoesNotExist:
+        employer_id = None
+    invalidate_application_summaries(
+        seeker_ids=[instance.jobseeker_id],
+        employer_ids=[employer_id] if employer_id else [],
+    )
+
+
+# -----------------------------
+# Denormalized counters (jobs.counters)
+# -----------------------------
+@receiver(post_save, sender=Job)
+def count_posted_job(sender, instance, raw=False, created=False, **kwargs):
+    if created and not raw:
+        counters.job_posted(instance)
+
+
+@receiver(post_delete, sender=Job)
+def uncount_deleted_job(sender, instance, **kwargs):
+    counters.job_posted(instance, -1)
+
+
+@receiver(post_delete, sender=JobApplication)
+def uncount_deleted_application(sender, instance, **kwargs):
+    # runs for cascades too: a job's applications are deleted before the job itself
+    try:
+        employer_id = instance.job.employer_id
+    except Job.DoesNotExist:
+        return
+    counters.application_deleted(instance, employer_id)
+
+
+# -----------------------------
+# Skill popularity (SkillPopularity)
+# -----------------------------
+def _remember_skill_tokens(model, field: str, instance) -> None:
+    before = None
+    if instance.pk:
+        before = model.objects.filter(pk=instance.pk).values_list(field, flat=True).first()
+    instance._skill_tokens_before = set(_extract_skill_tokens(before))
+
+
+def _apply_skill_token_delta(instance, field: str, counter: str) -> None:
+    before = getattr(instance, "_skill_tokens_before", set())
+    after = set(_extract_skill_tokens(getattr(instance, field)))
+    SkillPopularity.objects.adjust(counter, added=after - before, removed=before - after)
+    instance._skill_tokens_before = after
+
+
+@receiver(pre_save, sender=Job)
+def remember_job_skill_tokens(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _remember_skill_tokens(Job, "required_skills", instance)
+
+
+@receiver(post_save, sender=Job)
+def update_job_skill_popularity(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _apply_skill_token_delta(instance, "required_skills", "job_count")
+
+
+@receiver(post_delete, sender=Job)
+def forget_job_skill_popularity(sender, instance, **kwargs):
+    SkillPopularity.objects.adjust("job_count", removed=_extract_skill_tokens(instance.required_skills))
+
+
+@receiver(pre_save, sender=JobSeekerProfile)
+def remember_seeker_skill_tokens(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _remember_skill_tokens(JobSeekerProfile, "skills", instance)
+
+
+@receiver(post_save, sender=JobSeekerProfile)
+def update_seeker_skill_popularity(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    changed = instance._skill_tokens_before != set(_extract_skill_tokens(instance.skills))
+    _apply_skill_token_delta(instance, "skills", "seeker_count")
+    if changed:
+        invalidate_autocomplete()
+
+
+@receiver(post_delete, sender=JobSeekerProfile)
+def forget_seeker_skill_popularity(sender, instance, **kwargs):
+    SkillPopularity.objects.adjust("seeker_count", removed=_extract_skill_tokens(instance.skills))
+    invalidate_autocomplete()
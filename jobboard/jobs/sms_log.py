@@ -0,0 +1,163 @@
+"""Newest-first reader for the append-only demo SMS JSONL logs.
+
+``employer_sms_log`` used to load and parse an employer's whole history on
+every request. This reader only touches the bytes it shows:
+
+- ``latest()`` walks the file backwards in BLOCK_SIZE blocks from the end (or
+  from a cursor: the byte offset of the oldest entry already shown), parsing
+  lines until a page is filled. Filters see the raw bytes first, so lines that
+  cannot match are never ``json.loads``-ed.
+- ``page()`` gives random access to numbered pages through a sidecar index
+  (``<log>.idx``) of line start offsets. The log only grows, so the index is
+  extended incrementally from its last covered offset; a shrunk log (rotation,
+  manual cleanup) triggers a rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+BLOCK_SIZE = 64 * 1024
+PER_PAGE = 50
+
+
+@dataclass
+class LogPage:
+    entries: list = field(default_factory=list)
+    # byte offset to pass back as ``before`` for the next (older) page
+    next_cursor: int | None = None
+    number: int | None = None
+    num_pages: int | None = None
+
+
+def _parse(line: bytes):
+    line = line.strip()
+    if not line.startswith(b"{"):
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+class SmsLogReader:
+    def __init__(self, path, *, block_size: int = BLOCK_SIZE):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.block_size = block_size
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _lines_reverse(self, f, end: int):
+        """Yield ``(offset, line)`` for complete lines that start before ``end``, last first."""
+        pos = end
+        tail = b""
+        while pos > 0:
+            size = min(self.block_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + tail).split(b"\n")
+            tail = lines[0]  # may continue in the previous block
+            offset = pos + len(tail) + 1
+            found = []
+            for line in lines[1:]:
+                found.append((offset, line))
+                offset += len(line) + 1
+            yield from reversed(found)
+        if tail:
+            yield 0, tail
+
+    def latest(
+        self,
+        limit: int = PER_PAGE,
+        *,
+        before: int | None = None,
+        raw_filter: bytes | None = None,
+        predicate: Callable[[dict], bool] | None = None,
+    ) -> LogPage:
+        """Newest ``limit`` entries older than the ``before`` offset.
+
+        ``raw_filter`` is a byte string every candidate line must contain;
+        ``predicate`` then checks the parsed entry.
+        """
+        if not self.path.exists():
+            return LogPage()
+        with self.path.open("rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            end = size
+            if before is not None and 0 < before <= size:
+                f.seek(before - 1)
+                if f.read(1) == b"\n":
+                    end = before
+            entries, oldest = [], None
+            for offset, line in self._lines_reverse(f, end):
+                if raw_filter is not None and raw_filter not in line:
+                    continue
+                entry = _parse(line)
+                if entry is None or (predicate is not None and not predicate(entry)):
+                    continue
+                if len(entries) == limit:
+                    # one more match exists: there is an older page
+                    return LogPage(entries=entries, next_cursor=oldest)
+                entries.append(entry)
+                oldest = offset
+        return LogPage(entries=entries)
+
+    def index(self) -> tuple[array, int]:
+        """(start offsets of all complete lines, end of the last one); refreshes the sidecar index."""
+        offsets = array("Q")
+        covered = 0
+        if self.index_path.exists():
+            offsets.frombytes(self.index_path.read_bytes())
+            if offsets:
+                covered = offsets.pop()  # last element: end of the indexed region
+        size = self.path.stat().st_size
+        if size < covered:
+            offsets, covered = array("Q"), 0
+        if size == covered and self.index_path.exists():
+            return offsets, covered
+
+        with self.path.open("rb") as f:
+            f.seek(covered)
+            pos = covered
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    break  # partially written line; index it next time
+                offsets.append(pos)
+                pos += len(line)
+        covered = pos
+
+        stored = array("Q", offsets)
+        stored.append(covered)
+        tmp = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(stored.tobytes())
+            os.replace(tmp, self.index_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+        return offsets, covered
+
+    def page(self, number: int, per_page: int = PER_PAGE) -> LogPage:
+        """Page ``number`` (1 = newest) of the unfiltered log, newest entry first."""
+        if not self.path.exists():
+            return LogPage(number=1, num_pages=1)
+        offsets, covered = self.index()
+        total = len(offsets)
+        num_pages = max(1, -(-total // per_page))
+        number = min(max(1, number), num_pages)
+        hi = total - (number - 1) * per_page
+        lo = max(0, hi - per_page)
+        if hi <= lo:
+            return LogPage(number=number, num_pages=num_pages)
+        with self.path.open("rb") as f:
+            f.seek(offsets[lo])
+            chunk = f.read((offsets[hi] if hi < total else covered) - offsets[lo])
+        entries = [entry for entry in map(_parse, chunk.split(b"\n")) if entry is not None]
+        entries.reverse()
+        return LogPage(entries=entries, number=number, num_pages=num_pages)
@@ -1,13 +1,26 @@
-from datetime import date
+import json
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-from django.test import TestCase, override_settings
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
 
 from accounts.models import User, EmployerProfile, JobSeekerProfile, Notification
+from accounts.outbox import drain_outbox
+from jobboard.demo_log import flush_demo_logs
 from resumes.models import Resume
-from .models import Job, JobApplication, JobAlert, JobAlertMatch, SavedJob
-from .utils import process_job_alerts_for_job
+from . import recommendations
+from .models import ApplicationDailyStat, Job, JobApplication, JobAlert, JobAlertMatch, JobSkill, SavedJob, Skill, SkillPopularity
+from .sms_log import SmsLogReader
+from .utils import process_alert_matches_for_alert, process_job_alerts_for_job, send_alert_digests
 
 
 class JobSearchTests(TestCase):
@@ -80,12 +93,90 @@ class JobSearchTests(TestCase):
         self.assertContains(resp, "QA Engineer")
         self.assertNotContains(resp, "Operations Analyst")
 
+    def test_search_matches_word_prefix_and_company(self):
+        resp = self.client.get(reverse("job_list"), {"q": "develop acme"})
+        self.assertContains(resp, "Backend Developer")
+        self.assertNotContains(resp, "UI Designer")
+
+    def test_stopword_only_query_falls_back_to_substring_match(self):
+        Job.objects.create(
+            employer=self.employer_profile,
+            title="Path to Leadership Programme",
+            description="Join the team",
+            location="York",
+            required_skills="mentoring",
+        )
+        titles = list(Job.objects.search(q="to the").values_list("title", flat=True))
+        self.assertEqual(titles, ["Path to Leadership Programme"])
+        resp = self.client.get(reverse("job_list"), {"q": "the", "sort": "relevance"})
+        self.assertContains(resp, "Path to Leadership Programme")
+        self.assertNotContains(resp, "UI Designer")
+
+    def test_company_rename_refreshes_search_vector(self):
+        self.employer_profile.company_name = "Globex"
+        self.employer_profile.save()
+        self.assertEqual(Job.objects.search(q="globex").count(), 2)
+        self.assertEqual(Job.objects.search(q="acme").count(), 0)
+
+    def test_relevance_sort_prefers_title_matches(self):
+        Job.objects.create(
+            employer=self.employer_profile,
+            title="Office Manager",
+            description="Coordinate the figma licence renewals",
+            location="Leeds",
+        )
+        resp = self.client.get(reverse("job_list"), {"q": "figma", "sort": "relevance"})
+        titles = [job.title for job in resp.context["jobs"]]
+        self.assertEqual(titles, ["UI Designer", "Office Manager"])
+
+    def test_facet_counts_apply_other_filters_in_one_query(self):
+        with self.assertNumQueries(1):
+            facets = Job.objects.search(q=None).facet_counts(job_type="contract", cities=["London", "Remote"])
+        # job_type counts ignore the job_type selection itself...
+        self.assertEqual(facets["job_type"]["full_time"], 1)
+        self.assertEqual(facets["job_type"]["contract"], 1)
+        # ...while other dimensions are narrowed by it.
+        self.assertEqual(facets["experience_level"], {"entry": 1, "mid": 0, "senior": 0, "lead": 0})
+        self.assertEqual(facets["city"], {"London": 1, "Remote": 0})
+        self.assertEqual(facets["cover_letter"]["any"], 1)
+
+    def test_job_list_renders_facet_counts(self):
+        cache.clear()
+        resp = self.client.get(reverse("job_list"), {"q": "designer"})
+        self.assertContains(resp, "Contract (1)")
+        self.assertContains(resp, "Full-time (0)")
+
     def test_job_list_provides_skill_suggestions(self):
         resp = self.client.get(reverse("job_list"))
         self.assertEqual(resp.status_code, 200)
         self.assertIn("skill_suggestions", resp.context)
         self.assertTrue(resp.context["skill_suggestions"])
 
+    def test_skill_popularity_tracks_job_edits_and_deletes(self):
+        job = Job.objects.get(title="UI Designer")
+        self.assertEqual(SkillPopularity.objects.get(token="figma").job_count, 1)
+
+        job.required_skills = "sketch, ui"
+        job.save()
+        self.assertEqual(SkillPopularity.objects.get(token="figma").total, 0)
+        self.assertEqual(SkillPopularity.objects.get(token="sketch").job_count, 1)
+
+        job.delete()
+        self.assertEqual(SkillPopularity.objects.get(token="sketch").total, 0)
+
+    def test_rebuild_skill_popularity_counts_jobs_and_profiles(self):
+        seeker_user = User.objects.create_user(username="js_pop", password="pass", role="jobseeker", email="js_pop@example.com")
+        JobSeekerProfile.objects.create(user=seeker_user, full_name="Pop Seeker", skills="python, go")
+        SkillPopularity.objects.all().delete()
+
+        call_command("rebuild_skill_popularity", stdout=StringIO())
+        python = SkillPopularity.objects.get(token="python")
+        self.assertEqual((python.job_count, python.seeker_count, python.total), (1, 1, 2))
+        self.assertEqual(
+            list(SkillPopularity.objects.order_by("-total", "token").values_list("token", flat=True)[:1]),
+            ["python"],
+        )
+
     def test_skill_suggestions_api_prefix(self):
         resp = self.client.get(reverse("skill_suggestions_api"), {"q": "dj"})
         self.assertEqual(resp.status_code, 200)
@@ -93,7 +184,30 @@ class JobSearchTests(TestCase):
         self.assertIn("items", data)
         self.assertTrue(any(item.startswith("dj") for item in data["items"]))
 
+    def test_suggestions_api_type_selects_vocabulary(self):
+        url = reverse("skill_suggestions_api")
+        self.assertEqual(self.client.get(url, {"q": "dev", "type": "title"}).json(), {"items": ["Backend Developer"]})
+        self.assertEqual(self.client.get(url, {"q": "ac", "type": "company"}).json(), {"items": ["ACME"]})
+        self.assertEqual(self.client.get(url, {"q": "x", "type": "nope"}).status_code, 400)
 
+        Job.objects.create(
+            employer=self.employer_profile, title="Data Engineer", description="ETL", location="Leeds", required_skills="dbt"
+        )
+        self.assertEqual(self.client.get(url, {"q": "data", "type": "title"}).json()["items"], ["Data Engineer"])
+        self.assertIn("dbt", self.client.get(url, {"q": "db"}).json()["items"])
+
+    def test_prefix_index_ranks_large_vocabulary(self):
+        from .autocomplete import SCAN_LIMIT, PrefixIndex
+
+        terms = [(f"skill{i:04d}", i) for i in range(SCAN_LIMIT * 5)] + [("scala", 10_000), ("sql", 1)]
+        index = PrefixIndex(terms)
+        self.assertEqual(index.suggest("s", limit=3), ["scala", f"skill{SCAN_LIMIT * 5 - 1:04d}", f"skill{SCAN_LIMIT * 5 - 2:04d}"])
+        self.assertEqual(index.suggest("skill000", limit=2), ["skill0009", "skill0008"])
+        self.assertEqual(index.suggest("sq"), ["sql"])
+        self.assertEqual(index.suggest("", limit=1), ["scala"])
+
+
+@override_settings(JOB_RECOMMENDATION_REFRESH_SECONDS=0, JOB_RECOMMENDATION_BACKGROUND_REFRESH=False)
 class RecommendationTests(TestCase):
     def setUp(self):
         self.employer_user = User.objects.create_user(username="emp", password="pass", role="employer", email="emp@example.com", is_active=True)
@@ -164,6 +278,184 @@ class RecommendationTests(TestCase):
         self.assertContains(resp, "Recommended skills to mention")
         self.assertIn("python", resp.context["skill_suggestions"])
 
+    def test_overlap_profile_keeps_legacy_weights(self):
+        self.client.login(username="js", password="pass")
+        resp = self.client.get(reverse("recommended_jobs"), {"profile": "overlap"})
+        item = resp.context["recommendations"][0]
+        self.assertEqual(item["job"], self.job1)
+        # two exact skill matches; "python"/"django" are not counted again as text hits
+        self.assertEqual(item["score"], 24)
+        self.assertEqual(item["overlap_terms"], ["django", "python"])
+
+    def test_overlap_profile_counts_substring_text_hits(self):
+        # legacy rule: a skill counts when it appears anywhere in the posting text, even inside a longer word
+        self.seeker_profile.skills = "java, linux"
+        self.seeker_profile.education = "Systems"
+        self.seeker_profile.save(update_fields=["skills", "education"])
+        job3 = Job.objects.create(
+            employer=self.employer_profile,
+            title="Frontend Developer",
+            description="JavaScript single page apps",
+            location="Remote",
+            required_skills="javascript",
+        )
+
+        self.client.login(username="js", password="pass")
+        resp = self.client.get(reverse("recommended_jobs"), {"profile": "overlap"})
+        scores = {item["job"]: item["score"] for item in resp.context["recommendations"]}
+        # exact "linux" + education "systems" in the description
+        self.assertEqual(scores[self.job2], 14)
+        # "java" inside "javascript"
+        self.assertEqual(scores[job3], 4)
+        self.assertNotIn(self.job1, scores)
+
+    def test_stale_index_is_rebuilt_in_the_background(self):
+        recommendations.get_recommendation_index()
+        Job.objects.create(
+            employer=self.employer_profile, title="Go Developer", description="-", location="Remote", required_skills="go"
+        )
+        stale = recommendations._state["index"]
+        with override_settings(JOB_RECOMMENDATION_BACKGROUND_REFRESH=True), mock.patch.object(
+            recommendations.threading, "Thread"
+        ) as thread:
+            self.assertIs(recommendations.get_recommendation_index(), stale)
+        thread.return_value.start.assert_called_once_with()
+        # the thread owns the lock until its rebuild finishes
+        target = thread.call_args.kwargs["target"]
+        with mock.patch.object(recommendations.connections, "close_all"):
+            target(*thread.call_args.kwargs["args"])
+        self.assertIsNot(recommendations._state["index"], stale)
+        self.assertEqual(len(recommendations._state["index"]), 3)
+
+
+class SkillIndexTests(TestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create_user(username="emp_skill", password="pass", role="employer", email="emp_skill@example.com", is_active=True)
+        self.employer_profile = EmployerProfile.objects.create(
+            user=self.employer_user, company_name="ACME Skills", phone="000", company_description="addr"
+        )
+
+    def test_job_save_syncs_skill_rows(self):
+        job = Job.objects.create(
+            employer=self.employer_profile,
+            title="Backend",
+            description="APIs",
+            location="Leeds",
+            required_skills="Python, Django; SQL",
+        )
+        self.assertEqual(sorted(job.skills.values_list("name", flat=True)), ["django", "python", "sql"])
+
+        job.required_skills = "python, c++"
+        job.save()
+        self.assertEqual(sorted(job.skills.values_list("name", flat=True)), ["c++", "python"])
+        self.assertTrue(Skill.objects.filter(name="django").exists())
+
+    def test_rebuild_command_backfills_bulk_created_jobs(self):
+        Job.objects.bulk_create(
+            [Job(employer=self.employer_profile, title="Ops", description="-", location="York", required_skills="linux, aws")]
+        )
+        self.assertFalse(JobSkill.objects.exists())
+        call_command("rebuild_skill_index", stdout=StringIO())
+        self.assertEqual(
+            sorted(JobSkill.objects.values_list("skill__name", flat=True)),
+            ["aws", "linux"],
+        )
+
+    def test_skill_filter_uses_exact_skill_tokens(self):
+        Job.objects.create(
+            employer=self.employer_profile, title="Systems Engineer", description="Low level", location="York", required_skills="c++, linux"
+        )
+        Job.objects.create(
+            employer=self.employer_profile, title="Web Developer", description="Frontend", location="York", required_skills="javascript"
+        )
+        titles = list(Job.objects.search(skills="c++").values_list("title", flat=True))
+        self.assertEqual(titles, ["Systems Engineer"])
+
+    @override_settings(JOB_RECOMMENDATION_REFRESH_SECONDS=0, JOB_RECOMMENDATION_BACKGROUND_REFRESH=False)
+    def test_recommendations_consider_older_jobs_with_skill_overlap(self):
+        Job.objects.create(
+            employer=self.employer_profile, title="Elixir Veteran Role", description="-", location="York", required_skills="elixir, phoenix"
+        )
+        Job.objects.bulk_create(
+            [Job(employer=self.employer_profile, title=f"Filler {i}", description="-", location="York") for i in range(300)]
+        )
+        seeker_user = User.objects.create_user(username="js_skill", password="pass", role="jobseeker", email="js_skill@example.com", is_active=True)
+        JobSeekerProfile.objects.create(user=seeker_user, full_name="Skill Seeker", skills="elixir")
+
+        self.client.login(username="js_skill", password="pass")
+        resp = self.client.get(reverse("recommended_jobs"))
+        self.assertContains(resp, "Elixir Veteran Role")
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create_user(username="emp_page", password="pass", role="employer", email="emp_page@example.com", is_active=True)
+        self.employer_profile = EmployerProfile.objects.create(
+            user=self.employer_user, company_name="ACME Pages", phone="000", company_description="addr"
+        )
+        for i in range(25):
+            Job.objects.create(employer=self.employer_profile, title=f"Job {i:02d}", description="-", location="York")
+
+    def test_job_list_walks_pages_forward_and_back(self):
+        first = self.client.get(reverse("job_list"))
+        page1 = [job.title for job in first.context["jobs"]]
+        self.assertEqual(page1[0], "Job 24")
+        self.assertEqual(len(page1), 10)
+
+        second = self.client.get(reverse("job_list"), {"cursor": first.context["page_obj"].next_cursor})
+        page2 = [job.title for job in second.context["jobs"]]
+        self.assertEqual(page2[0], "Job 14")
+
+        third = self.client.get(reverse("job_list"), {"cursor": second.context["page_obj"].next_cursor})
+        self.assertEqual(len(third.context["jobs"]), 5)
+        self.assertFalse(third.context["page_obj"].has_next)
+
+        back = self.client.get(reverse("job_list"), {"cursor": second.context["page_obj"].prev_cursor})
+        self.assertEqual([job.title for job in back.context["jobs"]], page1)
+        self.assertFalse(back.context["page_obj"].has_previous)
+
+    @override_settings(JOB_SEARCH_CACHE_MAX_IDS=15)
+    def test_page_past_the_cached_id_window_is_filled_from_the_database(self):
+        cache.clear()
+        first = self.client.get(reverse("job_list"))
+        second = self.client.get(reverse("job_list"), {"cursor": first.context["page_obj"].next_cursor})
+        self.assertEqual([job.title for job in second.context["jobs"]], [f"Job {i:02d}" for i in range(14, 4, -1)])
+        third = self.client.get(reverse("job_list"), {"cursor": second.context["page_obj"].next_cursor})
+        self.assertEqual([job.title for job in third.context["jobs"]], [f"Job {i:02d}" for i in range(4, -1, -1)])
+        self.assertFalse(third.context["page_obj"].has_next)
+
+    def test_repeated_search_is_served_from_id_cache(self):
+        cache.clear()
+        self.client.get(reverse("job_list"), {"q": "job"})
+        with self.assertNumQueries(1):
+            # only the id__in hydration query; search ids and skill suggestions are in memory
+            resp = self.client.get(reverse("job_list"), {"q": "job"})
+        self.assertEqual(resp.context["jobs"][0].title, "Job 24")
+
+    def test_new_job_invalidates_cached_search(self):
+        self.client.get(reverse("job_list"))
+        Job.objects.create(employer=self.employer_profile, title="Fresh Posting", description="-", location="York")
+        resp = self.client.get(reverse("job_list"))
+        self.assertEqual(resp.context["jobs"][0].title, "Fresh Posting")
+
+    def test_invalid_cursor_returns_first_page(self):
+        resp = self.client.get(reverse("job_list"), {"cursor": "not-a-cursor"})
+        self.assertEqual(resp.context["jobs"][0].title, "Job 24")
+
+    def test_view_applications_is_paginated(self):
+        job = Job.objects.first()
+        for i in range(25):
+            user = User.objects.create_user(username=f"js_page_{i}", password="pass", role="jobseeker", email=f"js_page_{i}@example.com")
+            seeker = JobSeekerProfile.objects.create(user=user, full_name=f"Seeker {i}")
+            JobApplication.objects.create(job=job, jobseeker=seeker, resume="resumes/test.pdf")
+
+        self.client.login(username="emp_page", password="pass")
+        resp = self.client.get(reverse("view_applications", args=[job.id]))
+        self.assertEqual(len(resp.context["applications"]), 20)
+        self.assertTrue(resp.context["page_obj"].has_next)
+        nxt = self.client.get(reverse("view_applications", args=[job.id]), {"cursor": resp.context["page_obj"].next_cursor})
+        self.assertEqual(len(nxt.context["applications"]), 5)
+
 
 class SavedJobsTests(TestCase):
     def setUp(self):
@@ -268,6 +560,206 @@ class AlertFlowTests(TestCase):
             ).exists()
         )
 
+    def test_alert_index_agrees_with_full_scan(self):
+        from .alert_index import AlertCriteria, AlertIndex, job_match_text
+
+        specs = [
+            ("backend", "", "", None, None),
+            ("", "python, go", "", None, None),
+            ("", "", "lond", None, None),
+            ("", "", "", 95000, None),
+            ("", "", "", None, 40000),
+            ("design", "figma", "london", None, 60000),
+            ("qa", "", "", None, None),
+            ("", "c++", "", None, None),
+        ]
+        criteria = [AlertCriteria.from_values(i, *spec) for i, spec in enumerate(specs, start=1)]
+        index = AlertIndex(criteria)
+        jobs = [
+            Job(title="Backend Engineer", description="Python APIs", location="Remote", required_skills="python, sql", min_salary=50000, max_salary=90000),
+            Job(title="UI Designer", description="Figma systems", location="London", required_skills="", min_salary=30000, max_salary=50000),
+            Job(title="QA Analyst", description="Write C++ tests", location="Leeds"),
+        ]
+        for job in jobs:
+            title_desc, job_skills = job_match_text(job)
+            expected = sorted((c.alert_id for c in criteria if c.matches(job, title_desc, job_skills)), reverse=True)
+            self.assertEqual(index.match(job), expected, job.title)
+            self.assertLess(len(index.candidates(job, title_desc, job_skills)), len(criteria))
+
+    def test_alert_index_follows_shared_version_and_max_age(self):
+        from . import alert_index
+
+        index = alert_index.get_alert_index()
+        self.assertIs(alert_index.get_alert_index(), index)
+        # another worker saved an alert: only the shared version moved
+        cache.incr(alert_index._VERSION_KEY)
+        rebuilt = alert_index.get_alert_index()
+        self.assertIsNot(rebuilt, index)
+
+        # bulk writes skip the signals; the max age still picks them up
+        JobAlert.objects.bulk_create([JobAlert(jobseeker=self.seeker_profile, keywords="haskell")])
+        self.assertIs(alert_index.get_alert_index(), rebuilt)
+        with override_settings(JOB_ALERT_INDEX_MAX_AGE_SECONDS=0):
+            fresh = alert_index.get_alert_index()
+        self.assertIsNot(fresh, rebuilt)
+        job = Job(title="Haskell Developer", description="-", location="York")
+        self.assertEqual(len(fresh.match(job)), 1)
+
+    def test_create_job_defers_alert_matching_to_batch(self):
+        alert = JobAlert.objects.create(jobseeker=self.seeker_profile, keywords="kotlin", is_enabled=True)
+        self.client.login(username="emp_alert", password="pass")
+        with self.captureOnCommitCallbacks() as callbacks:
+            resp = self.client.post(
+                reverse("create_job"),
+                {"title": "Kotlin Developer", "description": "Android", "location": "Leeds", "job_type": "full_time", "experience_level": "mid"},
+            )
+        self.assertEqual(resp.status_code, 302)
+        self.assertTrue(callbacks)
+        self.assertFalse(JobAlertMatch.objects.exists())
+        Job.objects.create(employer=self.employer_profile, title="Kotlin Lead", description="-", location="York")
+
+        out = StringIO()
+        call_command("process_job_alerts", stdout=out)
+        self.assertIn("Processed 2 jobs, created 2 alert matches.", out.getvalue())
+        self.assertEqual(JobAlertMatch.objects.filter(alert=alert).count(), 2)
+        self.assertFalse(Job.objects.filter(alerts_processed_at__isnull=True).exists())
+
+    def test_bulk_alert_matches_cost_constant_statements(self):
+        from .utils import create_alert_matches
+
+        jobs = [Job.objects.create(employer=self.employer_profile, title=f"Role {i}", description="-", location="York") for i in range(3)]
+        for i in range(4):
+            JobAlert.objects.create(jobseeker=self.seeker_profile, keywords=f"role{i}", is_enabled=True)
+        alerts = list(JobAlert.objects.select_related("jobseeker__user"))
+        pairs = [(alert, job) for alert in alerts for job in jobs]
+
+        with self.assertNumQueries(7):  # savepoint, match INSERT, 2 counter UPDATEs, notification/outbox INSERTs, release
+            created = create_alert_matches(pairs[:-1])
+        self.assertEqual(len(created), 11)
+        self.assertEqual(Notification.objects.filter(user=self.seeker_user).count(), 11)
+
+        # the last pair lands first from another writer (e.g. an alert backfill)
+        JobAlertMatch.objects.insert_pairs([(pairs[-1][0].id, pairs[-1][1].id, None)])
+        self.assertEqual(create_alert_matches(pairs), [])
+        self.assertEqual(JobAlertMatch.objects.count(), 12)
+        self.assertEqual(Notification.objects.filter(user=self.seeker_user).count(), 11)
+        self.assertEqual(sorted(Job.objects.filter(pk__in=[j.pk for j in jobs]).values_list("alert_matches_count", flat=True)), [3, 4, 4])
+
+    def test_sql_alert_predicate_agrees_with_python_matcher(self):
+        from .alert_index import AlertCriteria, job_match_text
+
+        Job.objects.create(employer=self.employer_profile, title="Backend Engineer", description="Python APIs", location="Remote", required_skills="python, sql", min_salary=50000, max_salary=90000)
+        Job.objects.create(employer=self.employer_profile, title="UI Designer", description="Figma systems", location="London", min_salary=30000, max_salary=50000)
+        Job.objects.create(employer=self.employer_profile, title="QA Analyst", description="Write C++ tests", location="Leeds")
+        specs = [
+            {"keywords": "backend; figma"},
+            {"skills": "python, go"},
+            {"skills": "figma"},
+            {"location": "lond"},
+            {"min_salary": 60000},
+            {"max_salary": 40000, "keywords": "design"},
+            {"skills": "c++", "location": "leeds"},
+        ]
+        jobs = list(Job.objects.all())
+        for spec in specs:
+            alert = JobAlert.objects.create(jobseeker=self.seeker_profile, **spec)
+            criteria = AlertCriteria.from_alert(alert)
+            expected = {job.title for job in jobs if criteria.matches(job, *job_match_text(job))}
+            self.assertEqual(set(Job.objects.matching_alert(alert).values_list("title", flat=True)), expected, spec)
+
+    def test_alert_backfill_covers_whole_catalogue(self):
+        old = Job.objects.create(employer=self.employer_profile, title="Haskell Developer", description="-", location="York")
+        Job.objects.filter(pk=old.pk).update(created_at=old.created_at - timedelta(days=365))
+        Job.objects.bulk_create(
+            [Job(employer=self.employer_profile, title=f"Filler {i}", description="-", location="York") for i in range(300)]
+        )
+        alert = JobAlert.objects.create(jobseeker=self.seeker_profile, keywords="haskell", is_enabled=True)
+
+        with self.assertNumQueries(4):  # savepoint, INSERT ... SELECT, counter UPDATE, release
+            self.assertEqual(process_alert_matches_for_alert(alert), 1)
+        self.assertTrue(JobAlertMatch.objects.filter(alert=alert, job=old).exists())
+        self.assertEqual(process_alert_matches_for_alert(alert), 0)
+
+    def test_daily_alert_matches_are_sent_as_one_digest(self):
+        daily = JobAlert.objects.create(jobseeker=self.seeker_profile, keywords="scala", delivery="daily")
+        instant = JobAlert.objects.create(jobseeker=self.seeker_profile, keywords="elm")
+        for title in ("Scala Engineer", "Senior Scala Engineer", "Elm Developer"):
+            job = Job.objects.create(employer=self.employer_profile, title=title, description="-", location="York")
+            process_job_alerts_for_job(job)
+
+        self.assertEqual(Notification.objects.filter(user=self.seeker_user).count(), 1)
+        self.assertEqual(JobAlertMatch.objects.filter(alert=daily, notified_at__isnull=True).count(), 2)
+        self.assertFalse(JobAlertMatch.objects.filter(alert=instant, notified_at__isnull=True).exists())
+
+        out = StringIO()
+        call_command("send_alert_digests", "--frequency", "hourly", stdout=out)
+        self.assertIn("to 0 seekers", out.getvalue())
+        call_command("send_alert_digests", "--frequency", "daily", stdout=out)
+        self.assertIn("Sent daily digests to 1 seekers (2 matches).", out.getvalue())
+        digest = Notification.objects.get(user=self.seeker_user, title__startswith="2 new job matches")
+        self.assertEqual(digest.url, "/jobs/alerts/inbox/")
+        self.assertFalse(JobAlertMatch.objects.filter(notified_at__isnull=True).exists())
+
+    def test_leaving_digest_delivery_settles_pending_matches(self):
+        daily = JobAlert.objects.create(jobseeker=self.seeker_profile, keywords="scala", delivery="daily")
+        hourly = JobAlert.objects.create(jobseeker=self.seeker_profile, keywords="elm", delivery="hourly")
+        for title in ("Scala Engineer", "Senior Scala Engineer", "Elm Developer"):
+            process_job_alerts_for_job(Job.objects.create(employer=self.employer_profile, title=title, description="-", location="York"))
+        self.assertEqual(JobAlertMatch.objects.filter(notified_at__isnull=True).count(), 3)
+
+        # switched to instant: the pending matches go out as one last digest
+        daily.delivery = "instant"
+        daily.save()
+        self.assertFalse(JobAlertMatch.objects.filter(alert=daily, notified_at__isnull=True).exists())
+        self.assertTrue(Notification.objects.filter(user=self.seeker_user, title__startswith="2 new job matches").exists())
+
+        # disabled: marked notified without sending, so re-enabling doesn't replay them
+        hourly.is_enabled = False
+        hourly.save()
+        self.assertFalse(JobAlertMatch.objects.filter(notified_at__isnull=True).exists())
+        self.assertFalse(Notification.objects.filter(user=self.seeker_user, title__startswith="1 new job match").exists())
+
+    def test_disabling_alert_removes_it_from_index(self):
+        alert = JobAlert.objects.create(jobseeker=self.seeker_profile, keywords="rust", is_enabled=True)
+        job = Job.objects.create(employer=self.employer_profile, title="Rust Engineer", description="-", location="York")
+        process_job_alerts_for_job(job)
+        self.assertEqual(JobAlertMatch.objects.filter(alert=alert).count(), 1)
+
+        alert.is_enabled = False
+        alert.save()
+        other = Job.objects.create(employer=self.employer_profile, title="Senior Rust Engineer", description="-", location="York")
+        process_job_alerts_for_job(other)
+        self.assertFalse(JobAlertMatch.objects.filter(job=other).exists())
+
+
+class AlertDigestLockTests(TransactionTestCase):
+    def test_digest_run_skips_seekers_locked_by_another_run(self):
+        employer_user = User.objects.create_user(username="emp_lock", password="pass", role="employer", email="emp_lock@example.com")
+        employer = EmployerProfile.objects.create(user=employer_user, company_name="ACME")
+        job = Job.objects.create(employer=employer, title="Scala Engineer", description="-", location="York")
+        alerts = []
+        for i in range(2):
+            user = User.objects.create_user(username=f"js_lock{i}", password="pass", role="jobseeker", email=f"js_lock{i}@example.com")
+            seeker = JobSeekerProfile.objects.create(user=user, full_name=f"Seeker {i}")
+            alert = JobAlert.objects.create(jobseeker=seeker, keywords="scala", delivery="daily")
+            JobAlertMatch.objects.create(alert=alert, job=job)
+            alerts.append(alert)
+
+        # an overlapping run still holds the first seeker's matches
+        other = connections.create_connection("default")
+        try:
+            with other.cursor() as cursor:
+                cursor.execute("BEGIN")
+                cursor.execute("SELECT id FROM jobs_jobalertmatch WHERE alert_id = %s FOR UPDATE", [alerts[0].pk])
+                self.assertEqual(send_alert_digests("daily", batch_size=1), (1, 1))
+                cursor.execute("ROLLBACK")
+        finally:
+            other.close()
+        self.assertEqual(
+            list(JobAlertMatch.objects.filter(notified_at__isnull=True).values_list("alert_id", flat=True)), [alerts[0].pk]
+        )
+        self.assertEqual(send_alert_digests("daily", batch_size=1), (1, 1))
+
 
 class ApplicationDetailTests(TestCase):
     def setUp(self):
@@ -315,6 +807,8 @@ class NotificationTests(TestCase):
         self.app.refresh_from_db()
         self.assertEqual(self.app.status, "interview")
         self.assertEqual(str(self.app.interview_time), "10:30:00")
+        self.assertEqual(len(mail.outbox), 0)  # queued, not sent inside the request
+        self.assertEqual(drain_outbox(), (1, 0))
         self.assertEqual(len(mail.outbox), 1)
         self.assertIn("Interview scheduled", mail.outbox[0].subject)
         self.assertTrue(Notification.objects.filter(user=self.seeker_user, title__icontains="Interview scheduled").exists())
@@ -325,5 +819,290 @@ class NotificationTests(TestCase):
         self.assertEqual(resp.status_code, 302)
         self.app.refresh_from_db()
         self.assertEqual(self.app.status, "rejected")
+        call_command("send_outbox_emails", stdout=StringIO())
         self.assertEqual(len(mail.outbox), 1)
         self.assertTrue(Notification.objects.filter(user=self.seeker_user, title__icontains="Application update").exists())
+
+    def test_demo_logs_are_written_in_background_and_readable_after_flush(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            with override_settings(SMS_DEMO_LOG=tmp / "sms_demo.log", EMAIL_DEMO_LOG=tmp / "email_demo.log"):
+                JobSeekerProfile.objects.filter(pk=self.seeker_profile.pk).update(phone="+440000000001")
+                self.client.login(username="emp", password="pass")
+                self.client.get(reverse("reject_application", args=[self.app.id]))
+                resp = self.client.get(reverse("employer_sms_log"))
+                self.assertEqual([e["meta"]["kind"] for e in resp.context["entries"]], ["rejected"])
+
+                self.assertTrue(flush_demo_logs())
+                self.assertIn("Subject:", (tmp / "email_outbox.txt").read_text())
+                self.assertTrue((tmp / "email" / "to_js_example.com.txt").exists())
+
+
+class SmsLogReaderTests(TestCase):
+    def _write(self, path, entries):
+        with path.open("a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+
+    def test_backward_reader_filters_and_pages_by_cursor(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "employer_1.jsonl"
+            self._write(path, [{"n": i, "meta": {"kind": "interview" if i % 3 else "rejected"}} for i in range(40)])
+            reader = SmsLogReader(path, block_size=64)  # force many block boundaries
+
+            page = reader.latest(5)
+            self.assertEqual([e["n"] for e in page.entries], [39, 38, 37, 36, 35])
+            page = reader.latest(5, before=page.next_cursor)
+            self.assertEqual([e["n"] for e in page.entries], [34, 33, 32, 31, 30])
+
+            rejected = []
+            cursor = None
+            while True:
+                page = reader.latest(4, before=cursor, raw_filter=b'"rejected"')
+                rejected += [e["n"] for e in page.entries]
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+            self.assertEqual(rejected, list(range(39, -1, -3)))
+
+    def test_offset_index_gives_random_pages_and_grows_incrementally(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "employer_1.jsonl"
+            self._write(path, [{"n": i} for i in range(23)])
+            reader = SmsLogReader(path)
+
+            page = reader.page(3, per_page=10)
+            self.assertEqual((page.number, page.num_pages), (3, 3))
+            self.assertEqual([e["n"] for e in page.entries], [2, 1, 0])
+            self.assertTrue(reader.index_path.exists())
+
+            self._write(path, [{"n": 23}, {"n": 24}])
+            with path.open("a") as f:
+                f.write('{"n": 25')  # still being written
+            self.assertEqual([e["n"] for e in reader.page(1, per_page=3).entries], [24, 23, 22])
+            self.assertEqual(len(reader.index()[0]), 25)
+
+
+class ApplicationSummaryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.employer_user = User.objects.create_user(username="emp", password="pass", role="employer", email="emp@example.com")
+        self.employer = EmployerProfile.objects.create(user=self.employer_user, company_name="ACME")
+        self.jobs = [Job.objects.create(employer=self.employer, title=f"Role {i}", description="-", location="York") for i in range(2)]
+        self.seekers = []
+        for i, status in enumerate(["submitted", "interview", "rejected", "submitted"]):
+            user = User.objects.create_user(username=f"js{i}", password="pass", role="jobseeker", email=f"js{i}@example.com")
+            seeker = JobSeekerProfile.objects.create(user=user, full_name=f"Seeker {i}")
+            self.seekers.append(seeker)
+            JobApplication.objects.create(job=self.jobs[i % 2], jobseeker=seeker, resume="resumes/x.pdf", status=status)
+
+    def test_status_summary_is_one_query(self):
+        qs = JobApplication.objects.filter(job__employer=self.employer)
+        with self.assertNumQueries(1):
+            summary = qs.status_summary()
+        self.assertEqual(summary, {"all": 4, "submitted": 2, "interview": 1, "rejected": 1})
+        with self.assertNumQueries(1):
+            summary = qs.status_summary(by_job=True)
+        self.assertEqual(summary["all"], 4)
+        self.assertEqual(summary["by_job"][self.jobs[0].id], {"all": 2, "submitted": 1, "interview": 0, "rejected": 1})
+        self.assertEqual(summary["by_job"][self.jobs[1].id], {"all": 2, "submitted": 1, "interview": 1, "rejected": 0})
+
+    def test_dashboard_counts_are_cached_until_an_application_changes(self):
+        self.client.login(username="emp", password="pass")
+        self.assertEqual(self.client.get(reverse("employer_applications")).context["counts"]["submitted"], 2)
+        self.assertEqual(cache.get(f"jobs:app_summary:employer:{self.employer.pk}")["all"], 4)
+
+        app = JobApplication.objects.get(jobseeker=self.seekers[0])
+        app.status = "interview"
+        app.save()
+        resp = self.client.get(reverse("dashboard"))
+        self.assertEqual((resp.context["submitted_count"], resp.context["interview_count"]), (1, 2))
+        self.assertEqual(resp.context["jobs_count"], 2)
+
+    def test_seeker_dashboard_counts_come_with_the_profile(self):
+        seeker = self.seekers[0]
+        SavedJob.objects.create(jobseeker=seeker, job=self.jobs[0])
+        SavedJob.objects.create(jobseeker=seeker, job=self.jobs[1])
+        alert = JobAlert.objects.create(jobseeker=seeker, keywords="role", is_enabled=True)
+        JobAlertMatch.objects.create(alert=alert, job=self.jobs[0])
+        JobAlertMatch.objects.create(alert=alert, job=self.jobs[1], is_seen=True)
+        # another seeker's rows are not counted
+        SavedJob.objects.create(jobseeker=self.seekers[1], job=self.jobs[0])
+
+        self.client.login(username="js0", password="pass")
+        resp = self.client.get(reverse("dashboard"))
+        self.assertEqual((resp.context["saved_count"], resp.context["alerts_unseen"]), (2, 1))
+
+    def _rollup(self):
+        return sorted(ApplicationDailyStat.objects.values_list("job_id", "day", "submissions", "interviews", "rejections"))
+
+    def test_daily_rollup_is_incremental_and_rebuildable(self):
+        from .utils import record_application_event
+
+        # setUp rows bypassed the views, so start from a rebuild
+        call_command("rebuild_application_stats", stdout=StringIO())
+        self.assertEqual(sum(row[2] for row in self._rollup()), 4)
+
+        for app in JobApplication.objects.filter(jobseeker__in=self.seekers[:2]):
+            record_application_event(app, "interview")
+        record_application_event(JobApplication.objects.get(jobseeker=self.seekers[3]), "rejected")
+        record_application_event(JobApplication.objects.get(jobseeker=self.seekers[3]), "note")
+        incremental = self._rollup()
+        today = timezone.localdate()
+        self.assertIn((self.jobs[1].id, today, 2, 1, 1), incremental)
+
+        ApplicationDailyStat.objects.rebuild()
+        self.assertEqual(self._rollup(), incremental)
+
+        self.client.login(username="emp", password="pass")
+        chart = self.client.get(reverse("dashboard"), {"range": 90}).context["chart"]
+        self.assertEqual((chart["days"], len(chart["labels"])), (90, 90))
+        self.assertEqual((chart["values"][-1], chart["interviews"][-1], chart["rejections"][-1]), (4, 2, 1))
+        self.assertEqual(self.client.get(reverse("dashboard"), {"range": 12}).context["chart"]["days"], 7)
+
+
+class CounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.employer_user = User.objects.create_user(username="emp", password="pass", role="employer", email="emp@example.com")
+        self.employer = EmployerProfile.objects.create(user=self.employer_user, company_name="ACME")
+        self.job = Job.objects.create(employer=self.employer, title="Role", description="-", location="York")
+        self.seeker_user = User.objects.create_user(username="js", password="pass", role="jobseeker", email="js@example.com")
+        self.seeker = JobSeekerProfile.objects.create(user=self.seeker_user, full_name="Seeker")
+        self.app = JobApplication.objects.create(job=self.job, jobseeker=self.seeker, resume="resumes/x.pdf")
+
+    def _counts(self):
+        self.job.refresh_from_db()
+        self.employer.refresh_from_db()
+        return (
+            (self.job.applications_count, self.job.submitted_count, self.job.rejected_count, self.job.saves_count),
+            (self.employer.jobs_count, self.employer.applications_count, self.employer.rejected_count),
+        )
+
+    def test_write_paths_keep_counters_in_step(self):
+        # the setUp application bypassed the apply view
+        call_command("reconcile_counters", stdout=StringIO())
+        self.assertEqual(self._counts(), ((1, 1, 0, 0), (1, 1, 0)))
+
+        self.client.login(username="js", password="pass")
+        self.client.get(reverse("toggle_saved_job", args=[self.job.id]))
+        self.assertEqual(self._counts()[0][3], 1)
+        self.client.get(reverse("toggle_saved_job", args=[self.job.id]))
+        self.assertEqual(self._counts()[0][3], 0)
+
+        self.client.login(username="emp", password="pass")
+        self.client.get(reverse("reject_application", args=[self.app.id]))
+        self.assertEqual(self._counts(), ((1, 0, 1, 0), (1, 1, 1)))
+
+        # a full save() of a stale instance must not overwrite the counters
+        Job.objects.get(pk=self.job.pk).save()
+        JobApplication.objects.get(pk=self.app.pk).delete()
+        self.assertEqual(self._counts(), ((0, 0, 0, 0), (1, 0, 0)))
+
+        self.job.delete()
+        self.employer.refresh_from_db()
+        self.assertEqual((self.employer.jobs_count, self.employer.applications_count), (0, 0))
+
+    def test_reconcile_repairs_drift_and_feeds_featured_companies(self):
+        other = EmployerProfile.objects.create(
+            user=User.objects.create_user(username="emp2", password="pass", role="employer"), company_name="Beta"
+        )
+        for i in range(2):
+            Job.objects.create(employer=other, title=f"Beta {i}", description="-", location="Leeds")
+        Job.objects.filter(pk=self.job.pk).update(applications_count=7, saves_count=3)
+        EmployerProfile.objects.filter(pk=other.pk).update(jobs_count=0)
+
+        from .counters import reconcile_counters
+
+        # the setUp application is drift too; every employer's jobs_count was kept by the signals but Beta's
+        self.assertEqual(reconcile_counters(batch_size=1), (1, 2))
+        self.assertEqual(self._counts()[0], (1, 1, 0, 0))
+        self.assertEqual(reconcile_counters(), (0, 0))
+
+        resp = self.client.get(reverse("home"))
+        self.assertEqual([(c.company_name, c.jobs_count) for c in resp.context["featured_companies"]], [("Beta", 2), ("ACME", 1)])
+
+
+class LandingCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        employer = EmployerProfile.objects.create(
+            user=User.objects.create_user(username="emp", password="pass", role="employer"), company_name="ACME"
+        )
+        Job.objects.create(employer=employer, title="Role", description="-", location="York")
+
+    def test_home_public_aggregates_are_computed_once(self):
+        self.assertEqual(self.client.get(reverse("home")).context["stats"]["jobs"], 1)
+        with self.assertNumQueries(0):
+            resp = self.client.get(reverse("home"))
+        self.assertEqual([job.title for job in resp.context["recent_jobs"]], ["Role"])
+
+    def test_expired_entry_is_served_stale_while_another_worker_refreshes(self):
+        from .landing_cache import single_flight_cached
+
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(single_flight_cached("t:agg", compute, ttl=60, stale_ttl=60), 1)
+        entry = cache.get("t:agg")
+        cache.set("t:agg", {**entry, "expires": entry["expires"] - 120})
+
+        cache.add("t:agg:lock", 1)  # another worker is mid-refresh
+        self.assertEqual(single_flight_cached("t:agg", compute, ttl=60, stale_ttl=60), 1)
+        cache.delete("t:agg:lock")
+        self.assertEqual(single_flight_cached("t:agg", compute, ttl=60, stale_ttl=60), 2)
+        self.assertEqual(single_flight_cached("t:agg", compute, ttl=60, stale_ttl=60), 2)
+        self.assertEqual(len(calls), 2)
+
+
+@override_settings(ESTIMATED_COUNT_THRESHOLD=20)
+class EstimatedCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        employer = EmployerProfile.objects.create(
+            user=User.objects.create_user(username="emp", password="pass", role="employer"), company_name="ACME"
+        )
+        Job.objects.bulk_create(
+            [Job(employer=employer, title=f"Role {i}", description="-", location="York") for i in range(30)]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE jobs_job")
+
+    def test_paginator_switches_to_estimates_above_threshold(self):
+        from .pagination import EstimatedPaginator
+
+        paginator = EstimatedPaginator(Job.objects.order_by("-id"), 10)
+        page = paginator.get_page(3)
+        self.assertTrue(paginator.estimated)
+        self.assertEqual(paginator.count, 30)  # reltuples, exact right after ANALYZE
+        self.assertEqual((len(page), page.has_next(), page.has_previous()), (10, False, True))
+
+        small = EstimatedPaginator(Job.objects.filter(title="Role 7").order_by("id"), 10)
+        self.assertEqual((small.count, small.estimated), (1, False))
+
+    def test_pages_past_a_low_estimate_stay_reachable(self):
+        from .pagination import EstimatedPaginator
+
+        employer = EmployerProfile.objects.get()
+        # reltuples still says 30 until the next ANALYZE
+        Job.objects.bulk_create(
+            [Job(employer=employer, title=f"Bulk {i}", description="-", location="York") for i in range(70)]
+        )
+        paginator = EstimatedPaginator(Job.objects.order_by("-id"), 10)
+        self.assertEqual((paginator.count, paginator.estimated), (30, True))
+        pages = [paginator.get_page(n) for n in (3, 4, 10)]
+        self.assertEqual([page.number for page in pages], [3, 4, 10])
+        self.assertEqual([page.has_next() for page in pages], [True, True, False])
+        self.assertEqual(len(pages[-1]), 10)
+        self.assertEqual(paginator.num_pages, 10)
+        # past the real end, get_page falls back to the real last page
+        self.assertEqual(paginator.get_page(11).number, 10)
+
+    def test_home_public_shows_about_for_estimated_totals(self):
+        resp = self.client.get(reverse("home"))
+        self.assertTrue(resp.context["stats"]["jobs_estimated"])
+        self.assertFalse(resp.context["stats"]["companies_estimated"])
+        self.assertContains(resp, "about <strong>30</strong> jobs")
@@ -1,4 +1,8 @@
 import logging
+from collections import defaultdict
+from django.db import transaction
+from django.utils import timezone
+from accounts.outbox import batched_outbox
 from jobboard.email_demo import send_email_demo
 from jobboard.sms_demo import send_sms_demo
 
@@ -112,122 +116,292 @@ def send_application_status_notification(application, *, kind: str):
 
 def record_application_event(application, status: str, note: str | None = None):
     """Create a timeline event for an application."""
-    from .models import JobApplicationEvent
+    from .models import ApplicationDailyStat, JobApplicationEvent
     try:
-        JobApplicationEvent.objects.create(application=application, status=status, note=note)
+        event = JobApplicationEvent.objects.create(application=application, status=status, note=note)
+        # keep the dashboard rollup in step with the timeline
+        ApplicationDailyStat.objects.bump(application.job, timezone.localdate(event.created_at), status)
     except Exception:
         logger.exception("Failed to record application event")
 
 
 def process_job_alerts_for_job(job):
     """When a new job is created, match it against enabled job alerts and store in-app notifications."""
-    from .models import JobAlert, JobAlertMatch
-    from .models import _tokenize_csv  # reuse
+    return process_job_alerts_for_jobs([job])
 
-    title_desc = f"{job.title} {job.description or ''} {job.required_skills or ''}".lower()
-    job_skills = set(_tokenize_csv(job.required_skills))
 
-    alerts = JobAlert.objects.filter(is_enabled=True).select_related("jobseeker", "jobseeker__user")
-    for alert in alerts:
-        if not _job_matches_alert(alert, job, title_desc, job_skills):
-            continue
-        _create_alert_match_and_notify(alert, job, JobAlertMatch)
+def process_job_alerts_for_jobs(jobs) -> int:
+    """Match a batch of new jobs against enabled alerts in one pass.
 
+    The alert index is consulted once per job, the candidate alerts for the
+    whole batch are loaded in one query and the matches are bulk inserted.
+    Returns count of newly created matches.
+    """
+    from .alert_index import get_alert_index, job_match_text
+    from .models import JobAlert
+
+    jobs = list(jobs)
+    # The percolator index narrows 100k+ alerts down to the few that can match.
+    index = get_alert_index()
+    candidates = {job.id: index.match(job) for job in jobs}
+    alert_ids = {alert_id for ids in candidates.values() for alert_id in ids}
+    if not alert_ids:
+        return 0
 
-def process_alert_matches_for_alert(alert, *, limit: int = 250) -> int:
+    alerts = JobAlert.objects.filter(id__in=alert_ids, is_enabled=True).select_related("jobseeker", "jobseeker__user").in_bulk()
+    pairs = []
+    for job in jobs:
+        title_desc, job_skills = job_match_text(job)
+        for alert_id in candidates[job.id]:
+            alert = alerts.get(alert_id)
+            if alert is not None and _job_matches_alert(alert, job, title_desc, job_skills):
+                pairs.append((alert, job))
+    return len(create_alert_matches(pairs))
+
+
+def process_alert_matches_for_alert(alert, *, limit: int | None = None) -> int:
     """Backfill matches for an alert against existing jobs.
 
+    The alert is translated into a database predicate (JobQuerySet.matching_alert)
+    and the matches are written with a single INSERT ... SELECT, so the whole
+    catalogue is covered without loading any jobs. ``limit`` restricts the
+    backfill to the newest jobs. Callers send one summary notification instead
+    of one per backfilled match.
+
     Returns count of newly created matches.
     """
+    from .counters import alert_matches_added
     from .models import Job, JobAlertMatch
-    from .models import _tokenize_csv
 
     if not getattr(alert, "is_enabled", False):
         return 0
 
-    created_count = 0
-    qs = Job.objects.select_related("employer", "employer__user").recent()[:limit]
-    for job in qs:
-        title_desc = f"{job.title} {job.description or ''} {job.required_skills or ''}".lower()
-        job_skills = set(_tokenize_csv(job.required_skills))
-        if not _job_matches_alert(alert, job, title_desc, job_skills):
-            continue
-        if _create_alert_match_and_notify(alert, job, JobAlertMatch):
-            created_count += 1
-    return created_count
+    job_ids = Job.objects.matching_alert(alert).values("pk")
+    job_ids = job_ids.order_by("-created_at")[:limit] if limit else job_ids.order_by()
+    with transaction.atomic():
+        matched = JobAlertMatch.objects.insert_for_alert(alert, job_ids)
+        alert_matches_added(matched)
+    return len(matched)
 
 
 def _job_matches_alert(alert, job, title_desc: str, job_skills: set[str]) -> bool:
-    if alert.location and (alert.location.lower() not in (job.location or "").lower()):
-        return False
-    if alert.min_salary is not None:
-        if job.max_salary is not None and job.max_salary < alert.min_salary:
-            return False
-    if alert.max_salary is not None:
-        if job.min_salary is not None and job.min_salary > alert.max_salary:
-            return False
+    from .alert_index import AlertCriteria
 
-    from .models import _tokenize_csv
+    return AlertCriteria.from_alert(alert).matches(job, title_desc, job_skills)
 
-    if alert.keywords:
-        kws = [k.strip().lower() for k in alert.keywords.replace(";", ",").split(",") if k.strip()]
-        if kws and not any(k in title_desc for k in kws):
-            return False
 
-    if alert.skills:
-        need = set(_tokenize_csv(alert.skills))
-        if need and job_skills:
-            if not (need & job_skills):
-                return False
-        elif need:
-            # no skills on job -> fallback to text contains
-            if not any(s in title_desc for s in need):
-                return False
+def create_alert_matches(pairs, *, notify: bool = True) -> list:
+    """Bulk insert JobAlertMatch rows for (alert, job) pairs.
 
-    return True
+    Pairs that already have a match are skipped. The newly created pairs are
+    returned. Matches for instant alerts are notified right away (unless
+    ``notify`` is False); hourly/daily ones are left for send_alert_digests.
+    A fan-out of any size costs one match INSERT, the counter UPDATEs and one
+    notification INSERT per 1000 rows, instead of two statements per match.
+    """
+    from .counters import alert_matches_added
+    from .models import AlertDelivery, JobAlertMatch
 
+    pairs = list({(alert.id, job.id): (alert, job) for alert, job in pairs}.values())
+    if not pairs:
+        return []
 
-def _create_alert_match_and_notify(alert, job, job_alert_match_model) -> bool:
+    now = timezone.now()
 
-    try:
-        _match, created = job_alert_match_model.objects.get_or_create(alert=alert, job=job)
-        if not created:
-            return False
+    def sent_now(alert) -> bool:
+        return not notify or alert.delivery == AlertDelivery.INSTANT
 
-        label = _alert_label(alert)
-        create_in_app_notification(
+    with transaction.atomic():
+        # ON CONFLICT ... RETURNING: a pair a concurrent writer inserted first is not "new" here,
+        # so it is neither counted nor notified twice.
+        created = JobAlertMatch.objects.insert_pairs(
+            (alert.id, job.id, now if sent_now(alert) else None) for alert, job in pairs
+        )
+        new_pairs = [(alert, job) for alert, job in pairs if (alert.id, job.id) in created]
+        alert_matches_added(job.id for _alert, job in new_pairs)
+    instant = [(alert, job) for alert, job in new_pairs if alert.delivery == AlertDelivery.INSTANT]
+    if notify and instant:
+        notify_alert_matches(instant)
+    return new_pairs
+
+
+def notify_alert_matches(pairs) -> None:
+    """In-app notifications (one bulk INSERT) plus demo email/SMS for new (alert, job) matches."""
+    pairs = list(pairs)
+    create_in_app_notifications(
+        (
             alert.jobseeker.user,
-            title=f"New job match: {job.title}",
-            message=f"Matched your alert: {label}",
-            url=f"/jobs/{job.id}/",
+            f"New job match: {job.title}",
+            f"Matched your alert: {_alert_label(alert)}",
+            f"/jobs/{job.id}/",
         )
-        # Demo email/SMS notifications (logged under logs/)
-        try:
-            user = alert.jobseeker.user
-            to_email = user.email or "demo@example.com"
-            send_email_demo(
-                subject="New job match (demo)",
-                message=f"A new job matched your alert '{label}': {job.title} ({job.location})",
-                to_emails=[to_email],
-                meta={"user_id": user.id, "alert_id": alert.id, "job_id": job.id},
+        for alert, job in pairs
+    )
+    with batched_outbox():
+        for alert, job in pairs:
+            _send_alert_match_demo_messages(alert, job)
+
+
+def send_alert_digests(frequency: str, *, batch_size: int = 200) -> tuple[int, int]:
+    """Send one notification, email and SMS per seeker for unsent hourly/daily matches.
+
+    Seekers are processed ``batch_size`` at a time in id order; their pending
+    matches are claimed with SELECT ... FOR UPDATE SKIP LOCKED so overlapping
+    runs never send a match twice. A batch whose matches are all locked by
+    another run is skipped, not taken as the end of the queue. Returns
+    (seekers notified, matches delivered).
+    """
+    from .models import JobAlertMatch
+
+    seekers_total = matches_total = 0
+    last_seeker_id = 0
+    pending = JobAlertMatch.objects.filter(
+        notified_at__isnull=True, alert__delivery=frequency, alert__is_enabled=True
+    )
+    while True:
+        with transaction.atomic():
+            seeker_ids = list(
+                pending.filter(alert__jobseeker_id__gt=last_seeker_id)
+                .order_by("alert__jobseeker_id")
+                .values_list("alert__jobseeker_id", flat=True)
+                .distinct()[:batch_size]
             )
-            phone = getattr(alert.jobseeker, "phone", None) or "+440000000000"
-            send_sms_demo(
-                phone=phone,
-                message=f"New job match: {job.title} in {job.location} (demo)",
-                meta={"user_id": user.id, "alert_id": alert.id, "job_id": job.id},
+            if not seeker_ids:
+                return seekers_total, matches_total
+            last_seeker_id = seeker_ids[-1]
+            matches = list(
+                pending.filter(alert__jobseeker_id__in=seeker_ids)
+                .select_related("job", "alert__jobseeker__user")
+                .select_for_update(of=("self",), skip_locked=True)
+                .order_by("-created_at")
             )
-        except Exception:
-            logger.exception("Failed to send demo alert notifications")
-        return True
+            if not matches:
+                continue  # another run holds this whole batch
+            seekers_total += _deliver_digests(matches, frequency)
+        matches_total += len(matches)
+
+
+def _deliver_digests(matches, frequency: str) -> int:
+    """Notify each seeker once for their ``matches`` and mark them notified; returns the seeker count."""
+    from .models import JobAlertMatch
+
+    by_seeker = defaultdict(list)
+    for match in matches:
+        by_seeker[match.alert.jobseeker].append(match)
+    create_in_app_notifications(
+        (
+            seeker.user,
+            _digest_title(len(items)),
+            ", ".join(m.job.title for m in items[:5]) + (" ..." if len(items) > 5 else ""),
+            "/jobs/alerts/inbox/",
+        )
+        for seeker, items in by_seeker.items()
+    )
+    with batched_outbox():
+        for seeker, items in by_seeker.items():
+            _send_digest_demo_messages(seeker, items, frequency)
+    JobAlertMatch.objects.filter(id__in=[m.id for m in matches]).update(notified_at=timezone.now())
+    return len(by_seeker)
+
+
+def flush_pending_alert_matches(alert, frequency: str) -> int:
+    """Settle ``alert``'s undelivered digest matches after it leaves ``frequency``.
+
+    Switched to instant: the pending matches go out now as one last digest.
+    Disabled: they are only marked notified (they stay in the Alert Inbox).
+    Otherwise no digest run would ever pick them up again. Returns the number
+    of matches settled.
+    """
+    from .models import JobAlertMatch
+
+    with transaction.atomic():
+        matches = list(
+            JobAlertMatch.objects.filter(alert=alert, notified_at__isnull=True)
+            .select_related("job", "alert__jobseeker__user")
+            .select_for_update(of=("self",), skip_locked=True)
+            .order_by("-created_at")
+        )
+        if not matches:
+            return 0
+        if alert.is_enabled:
+            _deliver_digests(matches, frequency)
+        else:
+            JobAlertMatch.objects.filter(id__in=[m.id for m in matches]).update(notified_at=timezone.now())
+    return len(matches)
+
+
+def _digest_title(count: int) -> str:
+    return f"{count} new job match{'es' if count != 1 else ''} for your alerts"
+
+
+def _send_digest_demo_messages(seeker, matches, frequency: str) -> None:
+    user = seeker.user
+    lines = [f"- {m.job.title} ({m.job.location}) /jobs/{m.job_id}/" for m in matches[:20]]
+    if len(matches) > 20:
+        lines.append(f"... and {len(matches) - 20} more in your Alert Inbox.")
+    meta = {"user_id": user.id, "match_ids": [m.id for m in matches], "frequency": frequency}
+    try:
+        send_email_demo(
+            subject=f"Your {frequency} job alert digest (demo)",
+            message=f"Hello {user.username},\n\n{_digest_title(len(matches))}:\n" + "\n".join(lines) + "\n\nJobBoard",
+            to_emails=[user.email or "demo@example.com"],
+            meta=meta,
+        )
+        send_sms_demo(
+            phone=getattr(seeker, "phone", None) or "+440000000000",
+            message=f"{_digest_title(len(matches))} on JobBoard (demo)",
+            meta=meta,
+        )
     except Exception:
-        logger.exception("Failed to create JobAlertMatch")
-        return False
+        logger.exception("Failed to send demo alert digest")
+
+
+def _send_alert_match_demo_messages(alert, job) -> None:
+    # Demo email/SMS notifications (logged under logs/)
+    label = _alert_label(alert)
+    try:
+        user = alert.jobseeker.user
+        to_email = user.email or "demo@example.com"
+        send_email_demo(
+            subject="New job match (demo)",
+            message=f"A new job matched your alert '{label}': {job.title} ({job.location})",
+            to_emails=[to_email],
+            meta={"user_id": user.id, "alert_id": alert.id, "job_id": job.id},
+        )
+        phone = getattr(alert.jobseeker, "phone", None) or "+440000000000"
+        send_sms_demo(
+            phone=phone,
+            message=f"New job match: {job.title} in {job.location} (demo)",
+            meta={"user_id": user.id, "alert_id": alert.id, "job_id": job.id},
+        )
+    except Exception:
+        logger.exception("Failed to send demo alert notifications")
 
 
 def create_in_app_notification(user, title: str, message: str = "", url: str = ""):
     try:
         from accounts.models import Notification
+        from accounts.notifications import invalidate_notification_nav
         Notification.objects.create(user=user, title=title, message=message or None, url=url or None)
+        invalidate_notification_nav(user.pk)
     except Exception:
         logger.exception("Failed to create in-app notification")
+
+
+def create_in_app_notifications(items) -> int:
+    """Bulk version of create_in_app_notification for (user, title, message, url) tuples."""
+    try:
+        from accounts.models import Notification
+        from accounts.notifications import invalidate_notification_nav
+        created = Notification.objects.bulk_create(
+            [
+                Notification(user=user, title=title, message=message or None, url=url or None)
+                for user, title, message, url in items
+            ],
+            batch_size=1000,
+        )
+        invalidate_notification_nav(*(n.user_id for n in created))
+        return len(created)
+    except Exception:
+        logger.exception("Failed to create in-app notifications")
+        return 0
@@ -3,13 +3,12 @@ from datetime import date as date_cls, timedelta, time as time_cls
 from pathlib import Path
 import json
 import re
-from collections import Counter
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from django.db.models import Q, Count
-from django.db.models.functions import TruncDate
+from django.core.cache import cache
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.http import JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.utils.http import url_has_allowed_host_and_scheme
@@ -17,14 +16,33 @@ from django.utils import timezone
 
 from django.conf import settings
 from accounts.models import EmployerProfile, JobSeekerProfile
+from jobboard.demo_log import flush_demo_logs
 from resumes.models import Resume
 from accounts.decorators import employer_required, jobseeker_required
 from .constants import ENGLAND_CITIES
 from .forms import JobForm, JobApplicationForm, JobAlertForm
-from .models import Job, JobApplication, ApplicationNote, SavedJob, JobType, ExperienceLevel, JobAlertMatch
+from . import autocomplete, counters
+from .application_stats import employer_application_summary, seeker_application_summary
+from .alert_batcher import schedule_job_alerts
+from .landing_cache import home_public_aggregates
+from .pagination import EstimatedPaginator, keyset_paginate, keyset_paginate_ids
+from .recommendations import PROFILES, recommend_jobs, tokenize_reco_text
+from .search_cache import cached_search_ids, search_cache_key
+from .sms_log import SmsLogReader
+from .models import (
+    ApplicationDailyStat,
+    Job,
+    JobApplication,
+    ApplicationNote,
+    SavedJob,
+    JobType,
+    ExperienceLevel,
+    JobAlertMatch,
+    SkillPopularity,
+    _extract_skill_tokens,
+)
 from .utils import (
     send_application_status_notification,
-    process_job_alerts_for_job,
     process_alert_matches_for_alert,
     record_application_event,
     create_in_app_notification,
@@ -33,12 +51,25 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 def _paginate(request, queryset, per_page=10):
-    paginator = Paginator(queryset, per_page)
+    """Numbered pages; large querysets are counted from planner estimates (see jobs.pagination)."""
+    paginator = EstimatedPaginator(queryset, per_page)
     page_number = request.GET.get("page") or 1
     page_obj = paginator.get_page(page_number)
     return page_obj
 
 
+def _cursor_paginate(request, queryset, per_page=10, key="created_at"):
+    """Constant-cost newest-first pagination; see jobs.pagination."""
+    return keyset_paginate(queryset, request.GET.get("cursor"), per_page=per_page, key=key)
+
+
+def _querystring_without(request, *names):
+    params = request.GET.copy()
+    for name in names:
+        params.pop(name, None)
+    return params.urlencode()
+
+
 def _safe_int(v):
     try:
         if v is None or v == "":
@@ -56,55 +87,6 @@ def _tokenize_query(v: str | None) -> list[str]:
     return [part for part in re.split(r"\s+", _normalize_space(v).lower()) if part]
 
 
-def _tokenize_reco_text(*values):
-    """Tokenize profile/resume text into lowercase terms for recommendations."""
-    tokens = set()
-    for value in values:
-        if not value:
-            continue
-        for token in re.findall(r"[a-z0-9+#\.]+", str(value).lower()):
-            token = token.strip(".")
-            if token and len(token) >= 2:
-                tokens.add(token)
-    return tokens
-
-
-_SKILL_STOPWORDS = {
-    "and",
-    "the",
-    "for",
-    "with",
-    "from",
-    "this",
-    "that",
-    "your",
-    "have",
-    "will",
-    "you",
-    "our",
-    "role",
-    "team",
-}
-
-
-def _extract_skill_tokens(*values):
-    out = []
-    seen = set()
-    for value in values:
-        if not value:
-            continue
-        for token in re.findall(r"[a-z0-9+#\.]+", str(value).lower()):
-            token = token.strip(".")
-            if not token or len(token) < 2:
-                continue
-            if token in _SKILL_STOPWORDS or token.isdigit():
-                continue
-            if token not in seen:
-                out.append(token)
-                seen.add(token)
-    return out
-
-
 def _ensure_jobseeker_profile(user):
     profile = JobSeekerProfile.objects.filter(user=user).first()
     if profile:
@@ -118,34 +100,25 @@ def _ensure_jobseeker_profile(user):
 
 
 def _popular_skill_suggestions(limit=12):
-    counter = Counter()
-    required_skills_values = (
-        Job.objects.exclude(required_skills__isnull=True)
-        .exclude(required_skills__exact="")
-        .values_list("required_skills", flat=True)[:500]
-    )
-    for raw in required_skills_values:
-        for token in _extract_skill_tokens(raw):
-            counter[token] += 1
-    seeker_skills_values = (
-        JobSeekerProfile.objects.exclude(skills__isnull=True)
-        .exclude(skills__exact="")
-        .values_list("skills", flat=True)[:500]
+    return list(
+        SkillPopularity.objects.filter(total__gt=0)
+        .order_by("-total", "token")
+        .values_list("token", flat=True)[:limit]
     )
-    for raw in seeker_skills_values:
-        for token in _extract_skill_tokens(raw):
-            counter[token] += 1
-    return [token for token, _ in counter.most_common(limit)]
 
 
 def _skill_suggestions_by_prefix(prefix: str, *, limit: int = 12) -> list[str]:
-    prefix_norm = (prefix or "").strip().lower()
-    pool = _popular_skill_suggestions(limit=120)
-    if not prefix_norm:
-        return pool[:limit]
-    starts = [s for s in pool if s.startswith(prefix_norm)]
-    contains = [s for s in pool if prefix_norm in s and not s.startswith(prefix_norm)]
-    return (starts + contains)[:limit]
+    return autocomplete.suggest("skill", prefix, limit=limit)
+
+
+_SUGGESTION_TYPES = {
+    "skill": "skill",
+    "skills": "skill",
+    "title": "title",
+    "titles": "title",
+    "company": "company",
+    "companies": "company",
+}
 
 
 def _search_skill_suggestions(request, limit=12):
@@ -216,33 +189,52 @@ def _apply_skill_suggestions(job, seeker_profile, latest_resume, limit=10):
     return ordered[:limit]
 
 
-def _last_7_days_application_series(apps_qs):
+APPLICATION_CHART_RANGES = (7, 30, 90, 365)
+
+
+def _application_series(employer, days: int = 7):
+    """Daily submissions/interviews/rejections for the dashboard chart, read from the rollup table."""
     today = timezone.localdate()
-    start = today - timedelta(days=6)
-    days = [start + timedelta(days=i) for i in range(7)]
+    start = today - timedelta(days=days - 1)
+    dates = [start + timedelta(days=i) for i in range(days)]
 
-    counts = {d: 0 for d in days}
     rows = (
-        apps_qs.filter(submitted_at__date__gte=start, submitted_at__date__lte=today)
-        .annotate(day=TruncDate("submitted_at"))
+        ApplicationDailyStat.objects.filter(employer=employer, day__gte=start, day__lte=today)
         .values("day")
-        .annotate(c=Count("id"))
+        .annotate(s=Sum("submissions"), i=Sum("interviews"), r=Sum("rejections"))
+        .order_by()
     )
-    for row in rows:
-        day = row.get("day")
-        if day in counts:
-            counts[day] = row.get("c", 0)
+    by_day = {row["day"]: row for row in rows}
+    empty = {"s": 0, "i": 0, "r": 0}
 
-    labels = [d.strftime("%a") for d in days]
-    values = [counts[d] for d in days]
+    label_format = "%a" if days <= 7 else "%d %b"
     return {
-        "labels": labels,
-        "values": values,
+        "labels": [d.strftime(label_format) for d in dates],
+        "values": [by_day.get(d, empty)["s"] for d in dates],
+        "interviews": [by_day.get(d, empty)["i"] for d in dates],
+        "rejections": [by_day.get(d, empty)["r"] for d in dates],
+        "days": days,
         "from": start.isoformat(),
         "to": today.isoformat(),
     }
 
 
+def _job_list_facets(params: dict, search_kwargs: dict, selected: dict) -> dict:
+    """Sidebar facet counts for job_list, cached per normalized query."""
+    cache_key = search_cache_key("facets", params)
+    facets = cache.get(cache_key)
+    if facets is None:
+        facets = Job.objects.search(**search_kwargs).facet_counts(cities=ENGLAND_CITIES, **selected)
+        cache.set(cache_key, facets, timeout=int(getattr(settings, "JOB_FACETS_CACHE_SECONDS", 60)))
+    return facets
+
+
+def _hydrate_jobs(ids) -> list:
+    """Load jobs for a page of cached ids with one id__in query, keeping the cached order."""
+    by_id = Job.objects.select_related("employer").defer("search_vector").in_bulk(ids)
+    return [by_id[i] for i in ids if i in by_id]
+
+
 # -----------------------------
 # Employer: Create/Edit Jobs
 # -----------------------------
@@ -261,8 +253,8 @@ def create_job(request):
             job = form.save(commit=False)
             job.employer = employer_profile
             job.save()
-            # Trigger job alerts (demo)
-            process_job_alerts_for_job(job)
+            # Alert matching runs in the next micro-batch (jobs.alert_batcher).
+            schedule_job_alerts()
             messages.success(request, "Job posted.")
             logger.info("Job created: job_id=%s employer=%s", job.id, request.user.username)
             return redirect("employer_jobs")
@@ -367,20 +359,63 @@ def job_list(request):
         cover_letter_required=cover_letter_required,
     )
 
- 
+    city_filter = None
     if city and city.strip().lower() not in {"all", "all cities", "any"}:
-        qs = qs.filter(location__icontains=city.strip())
+        city_filter = city.strip()
+        qs = qs.filter(location__icontains=city_filter)
+
+    search_params = {
+        "q": q.lower(),
+        "company": company.lower(),
+        "min_salary": min_salary,
+        "max_salary": max_salary,
+        "skills": skills.lower(),
+        "city": (city_filter or "").lower(),
+        "job_type": job_type,
+        "experience_level": experience_level,
+        "cover_letter": cover_letter_required,
+    }
+    facets = _job_list_facets(
+        search_params,
+        {"q": q, "min_salary": min_salary, "max_salary": max_salary, "skills": skills, "company": company},
+        {
+            "job_type": job_type or None,
+            "experience_level": experience_level or None,
+            "cover_letter_required": cover_letter_required,
+            "city": city_filter,
+        },
+    )
 
     if sort == "salary_high":
         qs = qs.order_by("-max_salary", "-created_at")
     elif sort == "salary_low":
         qs = qs.order_by("min_salary", "-created_at")
+    elif sort == "relevance":
+        qs = qs.ranked(q)
     else:
         sort = "newest"
-        qs = qs.order_by("-created_at")
+        qs = qs.order_by("-created_at", "-id")
 
+    # Repeated searches are served from a cached, ordered id list (see jobs.search_cache);
+    # only the page being shown is loaded from the database.
+    cached = cached_search_ids({**search_params, "sort": sort}, qs)
     cities = ENGLAND_CITIES
-    page_obj = _paginate(request, qs, per_page=10)
+    if sort == "newest":
+        page_obj = keyset_paginate_ids(
+            cached["ids"],
+            request.GET.get("cursor"),
+            _hydrate_jobs,
+            complete=cached["complete"],
+            per_page=10,
+            queryset=qs,
+        )
+        if page_obj is None:
+            page_obj = _cursor_paginate(request, qs, per_page=10)
+    elif cached["complete"]:
+        page_obj = _paginate(request, cached["ids"], per_page=10)
+        page_obj.object_list = _hydrate_jobs(page_obj.object_list)
+    else:
+        page_obj = _paginate(request, qs, per_page=10)
     page_jobs = list(page_obj.object_list)
 
     saved_job_ids = set()
@@ -398,6 +433,7 @@ def job_list(request):
 
     ctx = {
         "page_obj": page_obj,
+        "cursor_query": _querystring_without(request, "cursor", "page"),
         "jobs": page_jobs,
         "q": q,
         "company": company,
@@ -410,17 +446,26 @@ def job_list(request):
         "cover_letter": cover_letter,
         "sort": sort,
         "cities": cities,
+        "city_options": [(c, facets["city"].get(c, 0)) for c in cities],
         "saved_job_ids": saved_job_ids,
         "skill_suggestions": skill_suggestions,
-        "job_type_choices": JobType.choices,
-        "experience_choices": ExperienceLevel.choices,
+        "job_type_choices": [
+            (value, label, facets["job_type"].get(value, 0)) for value, label in JobType.choices
+        ],
+        "experience_choices": [
+            (value, label, facets["experience_level"].get(value, 0)) for value, label in ExperienceLevel.choices
+        ],
+        "cover_letter_counts": facets["cover_letter"],
     }
     return render(request, "jobs/job_list.html", ctx)
 
 
 def skill_suggestions_api(request):
     prefix = _normalize_space(request.GET.get("q"))
-    items = _skill_suggestions_by_prefix(prefix, limit=12)
+    vocabulary = _SUGGESTION_TYPES.get((request.GET.get("type") or "skill").strip().lower())
+    if vocabulary is None:
+        return JsonResponse({"items": []}, status=400)
+    items = autocomplete.suggest(vocabulary, prefix, limit=12)
     return JsonResponse({"items": items})
 
 
@@ -474,6 +519,7 @@ def apply_job(request, job_id):
                 note=note or None,
             )
             app.save()
+            counters.application_created(app)
             record_application_event(app, "submitted", "Application submitted")
 
             # In-app notification for employer
@@ -565,19 +611,20 @@ def my_applications(request):
     applications = base_qs
     if status != "all":
         applications = applications.filter(status=status)
-    applications = applications.order_by("-submitted_at")
+    page_obj = _cursor_paginate(request, applications, per_page=20, key="submitted_at")
 
-    counts = {
-        "all": base_qs.count(),
-        "submitted": base_qs.filter(status="submitted").count(),
-        "interview": base_qs.filter(status="interview").count(),
-        "rejected": base_qs.filter(status="rejected").count(),
-    }
+    counts = seeker_application_summary(seeker_profile)
 
     return render(
         request,
         "jobs/my_applications.html",
-        {"applications": applications, "status": status, "counts": counts},
+        {
+            "applications": page_obj.object_list,
+            "page_obj": page_obj,
+            "cursor_query": _querystring_without(request, "cursor"),
+            "status": status,
+            "counts": counts,
+        },
     )
 
 
@@ -605,19 +652,21 @@ def employer_applications(request):
     applications = base_qs
     if status != "all":
         applications = applications.filter(status=status)
-    applications = applications.order_by("-submitted_at")
+    page_obj = _cursor_paginate(request, applications, per_page=20, key="submitted_at")
 
-    counts = {
-        "all": base_qs.count(),
-        "submitted": base_qs.filter(status="submitted").count(),
-        "interview": base_qs.filter(status="interview").count(),
-        "rejected": base_qs.filter(status="rejected").count(),
-    }
+    counts = employer_application_summary(employer_profile)
 
     return render(
         request,
         "jobs/employer_applications.html",
-        {"applications": applications, "status": status, "counts": counts, "employer": employer_profile},
+        {
+            "applications": page_obj.object_list,
+            "page_obj": page_obj,
+            "cursor_query": _querystring_without(request, "cursor"),
+            "status": status,
+            "counts": counts,
+            "employer": employer_profile,
+        },
     )
 
 
@@ -632,61 +681,46 @@ def employer_sms_log(request):
         messages.error(request, "Access denied.")
         return redirect("home")
 
+    flush_demo_logs()
     log_path = getattr(settings, "SMS_DEMO_LOG", None)
-    entries = []
-
-
-    base_dir = None
     if log_path:
         base_dir = Path(str(log_path)).parent
     else:
         base_dir = Path(getattr(settings, "LOG_DIR", "."))
 
-    employer_file = base_dir / "sms" / f"employer_{request.user.id}.jsonl"
-    if employer_file.exists():
-        for raw in employer_file.read_text(encoding="utf-8", errors="ignore").splitlines():
-            line = raw.strip()
-            if not line:
-                continue
-            if line.startswith("{"):
-                try:
-                    obj = json.loads(line)
-                    entries.append(obj)
-                except Exception:
-                    continue
-
-        return render(request, "jobs/employer_sms_log.html", {"entries": entries})
-
-    if log_path:
-        p = Path(str(log_path))
-        if p.exists():
-            for raw in p.read_text(encoding="utf-8", errors="ignore").splitlines():
-                line = raw.strip()
-                if not line:
-                    continue
-                if line.startswith("{"):
-                    try:
-                        obj = json.loads(line)
-                    except Exception:
-                        continue
-                    meta = obj.get("meta") or {}
-                    if meta.get("employer_user_id") == request.user.id:
-                        entries.append(obj)
-                else:
-                    continue
-
-
     kind = request.GET.get("kind")
-    if kind in {"interview", "rejected"}:
-        entries = [e for e in entries if (e.get("meta") or {}).get("kind") == kind]
-
-
-    entries = list(reversed(entries))
+    if kind not in {"interview", "rejected"}:
+        kind = None
+    before = _safe_int(request.GET.get("before"))
+
+    raw_filter = None
+    predicates = []
+    if kind:
+        raw_filter = f'"kind": "{kind}"'.encode()
+        predicates.append(lambda e: (e.get("meta") or {}).get("kind") == kind)
+
+    reader = SmsLogReader(base_dir / "sms" / f"employer_{request.user.id}.jsonl")
+    own_file = reader.exists()
+    if not own_file and log_path:
+        # older installs only have the global log
+        reader = SmsLogReader(log_path)
+        raw_filter = raw_filter or f'"employer_user_id": {request.user.id}'.encode()
+        predicates.append(lambda e: (e.get("meta") or {}).get("employer_user_id") == request.user.id)
+
+    # numbered pages come from the offset index; filtered views page by cursor
+    if kind or before is not None or not own_file:
+        log_page = reader.latest(
+            before=before,
+            raw_filter=raw_filter,
+            predicate=(lambda e: all(p(e) for p in predicates)) if predicates else None,
+        )
+    else:
+        log_page = reader.page(_safe_int(request.GET.get("page")) or 1)
 
     return render(
         request,
         "jobs/employer_sms_log.html",
-        {"entries": entries, "kind": kind},
+        {"entries": log_page.entries, "log_page": log_page, "kind": kind},
     )
 
 def application_detail(request, application_id):
@@ -745,8 +779,18 @@ def view_applications(request, job_id):
         messages.error(request, "Not your job.")
         return redirect("home")
 
-    applications = JobApplication.objects.for_job(job).select_related("jobseeker__user").order_by("-submitted_at")
-    return render(request, "jobs/view_applications.html", {"applications": applications, "job": job})
+    applications = JobApplication.objects.for_job(job).select_related("jobseeker__user")
+    page_obj = _cursor_paginate(request, applications, per_page=20, key="submitted_at")
+    return render(
+        request,
+        "jobs/view_applications.html",
+        {
+            "applications": page_obj.object_list,
+            "page_obj": page_obj,
+            "cursor_query": _querystring_without(request, "cursor"),
+            "job": job,
+        },
+    )
 
 
 @employer_required
@@ -797,8 +841,10 @@ def schedule_interview(request, application_id):
 
         application.interview_date = parsed
         application.interview_time = parsed_time
+        previous_status = application.status
         application.status = "interview"
         application.save(update_fields=["interview_date", "interview_time", "status"])
+        counters.application_status_changed(application, previous_status)
         when = f"{application.interview_date} {application.interview_time.strftime('%H:%M') if application.interview_time else ''}".strip()
         record_application_event(application, "interview", f"Interview scheduled: {when}")
 
@@ -831,8 +877,10 @@ def reject_application(request, application_id):
         messages.error(request, "Access denied.")
         return redirect("home")
 
+    previous_status = application.status
     application.status = "rejected"
     application.save()
+    counters.application_status_changed(application, previous_status)
     record_application_event(application, "rejected", "Application rejected")
 
     send_application_status_notification(application, kind="rejected")
@@ -858,49 +906,30 @@ def recommended_jobs(request):
 
     latest_resume = Resume.objects.filter(jobseeker=seeker_profile).order_by("-created_at").first()
 
-    seeker_skills = _tokenize_reco_text(
+    seeker_skills = tokenize_reco_text(
         seeker_profile.skills,
         getattr(latest_resume, "skills", None),
     )
-    edu_tokens = _tokenize_reco_text(
+    edu_tokens = tokenize_reco_text(
         seeker_profile.education,
         getattr(latest_resume, "education", None),
     )
 
-    scored = []
-    for job in Job.objects.select_related("employer").recent()[:300]:
-        job_skills = set(job.skills_list())
-        hay = f"{job.title} {job.description or ''} {job.required_skills or ''} {job.location or ''}".lower()
-
-        exact_overlap = sorted(seeker_skills.intersection(job_skills)) if job_skills else []
-        text_overlap = sorted(
-            {
-                token
-                for token in seeker_skills
-                if len(token) >= 3 and token not in exact_overlap and token in hay
-            }
-        )
-        edu_hits = sorted({token for token in edu_tokens if len(token) >= 4 and token in hay})
-
-        score = (len(exact_overlap) * 12) + (len(text_overlap) * 4) + (len(edu_hits) * 2)
-        if score > 0:
-            scored.append(
-                {
-                    "job": job,
-                    "score": score,
-                    "overlap": len(exact_overlap),
-                    "overlap_terms": exact_overlap + text_overlap,
-                }
-            )
-
-    scored.sort(
-        key=lambda item: (
-            -item["score"],
-            -item["overlap"],
-            -(item["job"].created_at.timestamp() if item["job"].created_at else 0),
-        )
-    )
-    recommendations = scored[:30]
+    profile = request.GET.get("profile")
+    if profile not in PROFILES:
+        profile = None
+    ranked = recommend_jobs(seeker_skills, edu_tokens, profile=profile, k=30)
+    jobs_by_id = Job.objects.select_related("employer").in_bulk([item.job_id for item in ranked])
+    recommendations = [
+        {
+            "job": jobs_by_id[item.job_id],
+            "score": item.score,
+            "overlap": item.overlap,
+            "overlap_terms": item.overlap_terms,
+        }
+        for item in ranked
+        if item.job_id in jobs_by_id
+    ]
 
     used_fallback = False
     if not recommendations:
@@ -932,8 +961,10 @@ def toggle_saved_job(request, job_id: int):
     obj, created = SavedJob.objects.get_or_create(job=job, jobseeker=seeker)
     if not created:
         obj.delete()
+        counters.job_saved(job, -1)
         messages.info(request, "Removed from saved jobs.")
     else:
+        counters.job_saved(job, 1)
         messages.success(request, "Saved job.")
     next_url = request.GET.get("next") or request.META.get("HTTP_REFERER")
     if next_url and not url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
@@ -958,7 +989,7 @@ def job_alerts(request):
             alert = form.save(commit=False)
             alert.jobseeker = seeker
             alert.save()
-            created_matches = process_alert_matches_for_alert(alert, limit=300)
+            created_matches = process_alert_matches_for_alert(alert)
             if created_matches > 0:
                 create_in_app_notification(
                     seeker.user,
@@ -994,6 +1025,16 @@ def alert_inbox(request):
         JobAlertMatch.objects.filter(id__in=page_ids, is_seen=False).update(is_seen=True)
     return render(request, "jobs/alert_inbox.html", {"matches": page_obj.object_list, "page_obj": page_obj})
 
+def _count_per_seeker(qs, seeker_field: str):
+    return Coalesce(
+        Subquery(
+            qs.filter(**{seeker_field: OuterRef("pk")}).order_by().values(seeker_field).annotate(n=Count("*")).values("n")[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
 @login_required
 def dashboard(request):
     """Simple dashboard: shows different stats based on role."""
@@ -1001,35 +1042,41 @@ def dashboard(request):
     role = getattr(user, "role", "")
     if role == "employer":
         employer = EmployerProfile.objects.get(user=user)
-        jobs_qs = Job.objects.for_employer(employer)
         apps_qs = JobApplication.objects.filter(job__employer=employer)
-        weekly_series = _last_7_days_application_series(apps_qs)
+        chart_days = _safe_int(request.GET.get("range"))
+        if chart_days not in APPLICATION_CHART_RANGES:
+            chart_days = 7
+        series = _application_series(employer, chart_days)
+        summary = employer_application_summary(employer)
         ctx = {
             "role": "employer",
-            "jobs_count": jobs_qs.count(),
-            "apps_count": apps_qs.count(),
-            "submitted_count": apps_qs.filter(status="submitted").count(),
-            "interview_count": apps_qs.filter(status="interview").count(),
-            "rejected_count": apps_qs.filter(status="rejected").count(),
+            "jobs_count": employer.jobs_count,
+            "apps_count": summary["all"],
+            "submitted_count": summary["submitted"],
+            "interview_count": summary["interview"],
+            "rejected_count": summary["rejected"],
             "recent_apps": apps_qs.select_related("job", "jobseeker", "jobseeker__user").order_by("-submitted_at")[:10],
-            "weekly_chart_labels": weekly_series["labels"],
-            "weekly_chart_values": weekly_series["values"],
-            "weekly_chart_from": weekly_series["from"],
-            "weekly_chart_to": weekly_series["to"],
+            "chart": series,
+            "chart_ranges": APPLICATION_CHART_RANGES,
         }
         return render(request, "jobs/dashboard_employer.html", ctx)
     elif role == "jobseeker":
-        seeker = JobSeekerProfile.objects.get(user=user)
-        apps_qs = JobApplication.objects.filter(jobseeker=seeker)
         from .models import SavedJob, JobAlertMatch
+        # saved/unseen-alert counts come back with the profile row itself
+        seeker = JobSeekerProfile.objects.annotate(
+            saved_count=_count_per_seeker(SavedJob.objects.all(), "jobseeker"),
+            alerts_unseen=_count_per_seeker(JobAlertMatch.objects.filter(is_seen=False), "alert__jobseeker"),
+        ).get(user=user)
+        apps_qs = JobApplication.objects.filter(jobseeker=seeker)
+        summary = seeker_application_summary(seeker)
         ctx = {
             "role": "jobseeker",
-            "apps_count": apps_qs.count(),
-            "submitted_count": apps_qs.filter(status="submitted").count(),
-            "interview_count": apps_qs.filter(status="interview").count(),
-            "rejected_count": apps_qs.filter(status="rejected").count(),
-            "saved_count": SavedJob.objects.filter(jobseeker=seeker).count(),
-            "alerts_unseen": JobAlertMatch.objects.filter(alert__jobseeker=seeker, is_seen=False).count(),
+            "apps_count": summary["all"],
+            "submitted_count": summary["submitted"],
+            "interview_count": summary["interview"],
+            "rejected_count": summary["rejected"],
+            "saved_count": seeker.saved_count,
+            "alerts_unseen": seeker.alerts_unseen,
             "recent_apps": apps_qs.select_related("job", "job__employer", "job__employer__user").order_by("-submitted_at")[:10],
         }
         return render(request, "jobs/dashboard_jobseeker.html", ctx)
@@ -1040,11 +1087,7 @@ def dashboard(request):
 # Public landing page
 # -----------------------------
 def home_public(request):
-    recent_jobs = Job.objects.select_related("employer").order_by("-created_at")[:12]
-    featured_companies = (
-        EmployerProfile.objects.annotate(jobs_count=Count("jobs"))
-        .order_by("-jobs_count", "company_name")[:8]
-    )
+    landing = home_public_aggregates()
     show_applications_stat = False
     applications_count = None
     if request.user.is_authenticated:
@@ -1052,14 +1095,16 @@ def home_public(request):
         if role == "employer":
             try:
                 employer = EmployerProfile.objects.get(user=request.user)
-                applications_count = JobApplication.objects.filter(job__employer=employer).count()
+                applications_count = employer_application_summary(employer)["all"]
                 show_applications_stat = True
             except EmployerProfile.DoesNotExist:
                 pass
 
     stats = {
-        "jobs": Job.objects.count(),
-        "companies": EmployerProfile.objects.count(),
+        "jobs": landing["jobs"],
+        "jobs_estimated": landing["jobs_estimated"],
+        "companies": landing["companies"],
+        "companies_estimated": landing["companies_estimated"],
         "applications": applications_count,
         "show_applications": show_applications_stat,
     }
@@ -1067,9 +1112,9 @@ def home_public(request):
         request,
         "jobs/home_public.html",
         {
-            "recent_jobs": recent_jobs,
-            "featured_companies": featured_companies,
+            "recent_jobs": landing["recent_jobs"],
+            "featured_companies": landing["featured_companies"],
             "stats": stats,
-            "hero_skill_suggestions": _popular_skill_suggestions(limit=20),
+            "hero_skill_suggestions": landing["skill_suggestions"],
         },
     )
@@ -21,6 +21,7 @@ export DB_ENGINE="${DB_ENGINE:-django.db.backends.postgresql}"
 
 echo "Running migrations (DB_ENGINE=${DB_ENGINE})..."
 "${PYTHON_BIN}" manage.py migrate
+"${PYTHON_BIN}" manage.py createcachetable
 
 echo "Seeding demo data..."
 "${PYTHON_BIN}" manage.py seed_demo_data \
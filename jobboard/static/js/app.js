@@ -28,4 +28,16 @@
       else{ document.documentElement.setAttribute("dir","ltr"); }
     }
   }catch(e){}
+
+  // live unread count over server-sent events; the URL is only rendered for ASGI deployments
+  const bell=document.getElementById("notifBell");
+  const badge=document.getElementById("notifBadge");
+  if(bell && badge && window.EventSource && bell.getAttribute("data-stream-url")){
+    const es=new EventSource(bell.getAttribute("data-stream-url"));
+    es.addEventListener("unread", function(e){
+      const n=JSON.parse(e.data).count || 0;
+      badge.textContent=n;
+      badge.classList.toggle("d-none", n===0);
+    });
+  }
 })();